@@ -7,6 +7,7 @@ from communex.misc import get_map_modules, get_map_subnets_params
 from communex._common import get_node_url
 
 from comx.interface import ComxInterface
+from comx.snapshot import ChainSnapshot
 from loguru import logger
 import random
 import time
@@ -35,6 +36,8 @@ class ComxClient(ComxInterface):
             Retrieves the parameters of a subnet given a block hash and key.
         get_current_block() -> int:
             Retrieves the current block number.
+        get_snapshot(netuid: int = 0, interval: int = 0) -> ChainSnapshot:
+            Retrieves the modules and parameters of a subnet pinned to a single block.
     """
 
     def __init__(self, client: CommuneClient):
@@ -46,6 +49,7 @@ class ComxClient(ComxInterface):
                 The client used to interact with the Communex network.
         """
         self.client = client
+        self._snapshots: dict[int, ChainSnapshot] = {}
 
     def get_map_modules(
         self,
@@ -104,6 +108,38 @@ class ComxClient(ComxInterface):
         current_block = self.client.get_block()["header"]["number"]
         return int(current_block)
 
+    def get_snapshot(self, netuid: int = 0, interval: int = 0) -> ChainSnapshot:
+        """
+        Retrieves the modules and parameters of a subnet, all read at the same block.
+        The snapshot is cached and only re-read once the chain has advanced more than
+        interval blocks past the cached block, so a cache hit costs a single request
+        for the current block.
+
+        Args:
+            netuid (int, optional):
+                The subnet ID for which to retrieve the snapshot. Defaults to 0.
+            interval (int, optional):
+                The number of blocks a cached snapshot stays valid for. Defaults to 0,
+                which re-reads the snapshot whenever a new block was produced.
+
+        Returns:
+            ChainSnapshot: The snapshot of the subnet.
+        """
+        header = self.client.get_block()["header"]
+        block = int(header["number"])
+
+        snapshot = self._snapshots.get(netuid, None)
+        if snapshot is not None and block - snapshot.block <= interval:
+            return snapshot
+
+        block_hash = header["hash"]
+        modules = get_map_modules(_PinnedCommuneClient(self.client, block_hash), netuid, False)
+        subnet = self.get_subnet_params(block_hash=block_hash, key=netuid)
+
+        snapshot = ChainSnapshot(block=block, block_hash=block_hash, modules=modules, subnet_params=subnet)
+        self._snapshots[netuid] = snapshot
+        return snapshot
+
     def vote(
         self,
         key: Keypair,
@@ -128,4 +164,21 @@ class ComxClient(ComxInterface):
             time.sleep(sleepy_time)
             # TODO: Remove need to create new commune client every retry
             self.client = CommuneClient(get_node_url(use_testnet=use_testnet))
-            self.client.vote(key=key, uids=uids, weights=weights, netuid=netuid)
\ No newline at end of file
+            self.client.vote(key=key, uids=uids, weights=weights, netuid=netuid)
+
+
+class _PinnedCommuneClient:
+    """
+    Wraps a CommuneClient so every batch map query is made at a fixed block hash. This
+    lets communex helpers that do not accept a block hash read a pinned block.
+    """
+
+    def __init__(self, client: CommuneClient, block_hash: str):
+        self._client = client
+        self._block_hash = block_hash
+
+    def query_batch_map(self, functions, block_hash: str | None = None):
+        return self._client.query_batch_map(functions, self._block_hash)
+
+    def __getattr__(self, name):
+        return getattr(self._client, name)
@@ -6,6 +6,8 @@ from abc import ABC, abstractmethod
 
 from communex.types import SubnetParamsWithEmission, ModuleInfoWithOptionalBalance
 
+from comx.snapshot import ChainSnapshot
+
 
 class ComxInterface(ABC):
     """
@@ -25,6 +27,8 @@ class ComxInterface(ABC):
             specifying a block_hash will return the current subnet parameters.
         get_current_block() -> int:
             Retrieves the current block number.
+        get_snapshot(netuid: int = 0, interval: int = 0) -> ChainSnapshot:
+            Retrieves the modules and parameters of a subnet pinned to a single block.
     """
 
     @abstractmethod
@@ -83,6 +87,25 @@ class ComxInterface(ABC):
         """
         pass
 
+    @abstractmethod
+    def get_snapshot(self, netuid: int = 0, interval: int = 0) -> ChainSnapshot:
+        """
+        Retrieves the modules and parameters of a subnet, all read at the same block.
+        The snapshot is cached and only re-read once the chain has advanced more than
+        interval blocks past the cached block.
+
+        Args:
+            netuid (int, optional):
+                The subnet ID for which to retrieve the snapshot. Defaults to 0.
+            interval (int, optional):
+                The number of blocks a cached snapshot stays valid for. Defaults to 0,
+                which re-reads the snapshot whenever a new block was produced.
+
+        Returns:
+            ChainSnapshot: The snapshot of the subnet.
+        """
+        pass
+
     @abstractmethod
     def vote(self):
         """
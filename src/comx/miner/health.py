@@ -0,0 +1,236 @@
+import math
+import time
+from collections import deque
+from typing import Iterable
+
+
+class MinerHealth:
+    """
+    This class holds the query history of a single miner.
+
+    Attributes:
+        latencies (deque[float]): The latencies of the most recent successful queries in seconds.
+        failures (int): The total number of failed queries.
+        timeouts (int): The number of failed queries that ran into their timeout.
+        consecutive_failures (int): The number of failed queries since the last success.
+        opened_at (float | None): When the circuit was opened, or None if it is closed.
+        last_probe (float | None): When the miner was last queried while its circuit was open.
+    """
+
+    def __init__(self, window: int):
+        """
+        Initializes the MinerHealth instance.
+
+        Args:
+            window (int): The number of latencies to remember.
+        """
+        self.latencies: deque[float] = deque(maxlen=window)
+        self.failures = 0
+        self.timeouts = 0
+        self.consecutive_failures = 0
+        self.opened_at: float | None = None
+        self.last_probe: float | None = None
+
+    def percentile(self, q: float) -> float | None:
+        """
+        Returns the q-th percentile of the remembered latencies using the nearest-rank
+        method, or None if there are none.
+
+        Args:
+            q (float): The percentile to return, between 0 and 100.
+
+        Returns:
+            float | None: The latency at the percentile in seconds.
+        """
+        if not self.latencies:
+            return None
+        ordered = sorted(self.latencies)
+        rank = max(math.ceil(q / 100 * len(ordered)), 1)
+        return ordered[rank - 1]
+
+
+class MinerHealthTracker:
+    """
+    This class tracks the latencies and failures of miners by SS58 address. It derives an
+    adaptive query timeout from each miner's latency history and opens a circuit breaker
+    for miners that keep failing. While a miner's circuit is open it is only queried once
+    every probe_interval seconds; a successful probe closes the circuit again.
+
+    Attributes:
+        failure_threshold (int): The consecutive failures after which the circuit opens.
+        probe_interval (float): The seconds between probes of a miner with an open circuit.
+        timeout_multiplier (float): The multiplier applied to a miner's p95 latency.
+        min_timeout (float): The lowest adaptive timeout in seconds.
+        window (int): The number of latencies remembered per miner.
+
+    Methods:
+        should_query(ss58: str) -> bool:
+            Returns whether the miner should be queried now.
+        get_timeout(ss58: str, default: float) -> float:
+            Returns the timeout to use when querying the miner.
+        record_success(ss58: str, latency: float):
+            Records a successful query and closes the miner's circuit.
+        record_failure(ss58: str, timed_out: bool):
+            Records a failed query, opening the miner's circuit if it keeps failing.
+        prune(ss58s: Iterable[str]):
+            Forgets the miners that are not among the given ones.
+        get_stats(ss58: str) -> dict:
+            Returns the latency percentiles and failure counts of the miner.
+    """
+
+    def __init__(
+        self,
+        failure_threshold: int = 3,
+        probe_interval: float = 600,
+        timeout_multiplier: float = 2,
+        min_timeout: float = 5,
+        window: int = 50
+    ):
+        """
+        Initializes the MinerHealthTracker.
+
+        Args:
+            failure_threshold (int, optional): The consecutive failures after which the
+                circuit opens. Defaults to 3.
+            probe_interval (float, optional): The seconds between probes of a miner with an
+                open circuit. Defaults to 600.
+            timeout_multiplier (float, optional): The multiplier applied to a miner's p95
+                latency. Defaults to 2.
+            min_timeout (float, optional): The lowest adaptive timeout in seconds. Defaults to 5.
+            window (int, optional): The number of latencies remembered per miner. Defaults to 50.
+        """
+        self.failure_threshold = failure_threshold
+        self.probe_interval = probe_interval
+        self.timeout_multiplier = timeout_multiplier
+        self.min_timeout = min_timeout
+        self.window = window
+        self._health: dict[str, MinerHealth] = {}
+
+    def _get(self, ss58: str) -> MinerHealth:
+        health = self._health.get(ss58)
+        if health is None:
+            health = MinerHealth(self.window)
+            self._health[ss58] = health
+        return health
+
+    def is_open(self, ss58: str) -> bool:
+        """
+        Returns whether the circuit of the miner is open.
+
+        Args:
+            ss58 (str): The SS58 address of the miner.
+
+        Returns:
+            bool: True if the circuit is open.
+        """
+        health = self._health.get(ss58)
+        return health is not None and health.opened_at is not None
+
+    def should_query(self, ss58: str, now: float | None = None) -> bool:
+        """
+        Returns whether the miner should be queried now. Miners with a closed circuit are
+        always queried. Miners with an open circuit are queried as a probe if at least
+        probe_interval seconds passed since the circuit opened or was last probed.
+
+        Args:
+            ss58 (str): The SS58 address of the miner.
+            now (float | None, optional): The current monotonic time. Defaults to time.monotonic().
+
+        Returns:
+            bool: True if the miner should be queried.
+        """
+        if not self.is_open(ss58):
+            return True
+
+        now = time.monotonic() if now is None else now
+        health = self._health[ss58]
+        last_attempt = health.last_probe if health.last_probe is not None else health.opened_at
+        if now - last_attempt >= self.probe_interval:
+            health.last_probe = now
+            return True
+        return False
+
+    def get_timeout(self, ss58: str, default: float) -> float:
+        """
+        Returns the timeout to use when querying the miner: timeout_multiplier times the
+        miner's p95 latency, no lower than min_timeout and no higher than default. Miners
+        without a latency history get the default.
+
+        Args:
+            ss58 (str): The SS58 address of the miner.
+            default (float): The timeout used when there is no history, and the upper bound.
+
+        Returns:
+            float: The timeout in seconds.
+        """
+        health = self._health.get(ss58)
+        p95 = health.percentile(95) if health is not None else None
+        if p95 is None:
+            return default
+        return min(default, max(self.min_timeout, p95 * self.timeout_multiplier))
+
+    def record_success(self, ss58: str, latency: float):
+        """
+        Records a successful query and closes the miner's circuit.
+
+        Args:
+            ss58 (str): The SS58 address of the miner.
+            latency (float): The latency of the query in seconds.
+        """
+        health = self._get(ss58)
+        health.latencies.append(latency)
+        health.consecutive_failures = 0
+        health.opened_at = None
+        health.last_probe = None
+
+    def record_failure(self, ss58: str, now: float | None = None, timed_out: bool = False):
+        """
+        Records a failed query. The miner's circuit opens once failure_threshold
+        consecutive queries failed, and a failed probe keeps it open.
+
+        Args:
+            ss58 (str): The SS58 address of the miner.
+            now (float | None, optional): The current monotonic time. Defaults to time.monotonic().
+            timed_out (bool, optional): Whether the query failed by running into its timeout,
+                or was cancelled at the query deadline. Defaults to False.
+        """
+        now = time.monotonic() if now is None else now
+        health = self._get(ss58)
+        health.failures += 1
+        if timed_out:
+            health.timeouts += 1
+        health.consecutive_failures += 1
+        if health.opened_at is None and health.consecutive_failures >= self.failure_threshold:
+            health.opened_at = now
+
+    def prune(self, ss58s: Iterable[str]):
+        """
+        Forgets the history of every miner that is not among the given miners, so
+        deregistered miners are not tracked forever.
+
+        Args:
+            ss58s (Iterable[str]): The SS58 addresses of the miners currently registered.
+        """
+        keep = set(ss58s)
+        self._health = {ss58: health for ss58, health in self._health.items() if ss58 in keep}
+
+    def get_stats(self, ss58: str) -> dict:
+        """
+        Returns the latency percentiles and failure counts of the miner.
+
+        Args:
+            ss58 (str): The SS58 address of the miner.
+
+        Returns:
+            dict: The p50 and p95 latency, the total and consecutive failures, the
+            timeouts and whether the circuit is open.
+        """
+        health = self._get(ss58)
+        return {
+            "p50": health.percentile(50),
+            "p95": health.percentile(95),
+            "failures": health.failures,
+            "consecutive_failures": health.consecutive_failures,
+            "timeouts": health.timeouts,
+            "open": health.opened_at is not None,
+        }
@@ -0,0 +1,149 @@
+import asyncio
+import json
+from typing import Any
+
+import aiohttp
+from communex.errors import NetworkTimeoutError
+from communex.module._protocol import create_method_endpoint, create_request_data
+from communex.module.client import ModuleClient
+from substrateinterface import Keypair
+
+
+class PooledModuleClient(ModuleClient):
+    """
+    A ModuleClient that sends its requests through a shared aiohttp session instead
+    of opening a new session, and therefore a new connection, on every call.
+
+    Attributes:
+        host (str): The host the module is serving on.
+        port (int): The port the module is serving on.
+        key (Keypair): The keypair used to sign requests.
+        session (aiohttp.ClientSession): The session shared by all pooled clients.
+
+    Methods:
+        call(fn: str, target_key: str, params: Any = {}, timeout: int = 16) -> Any:
+            Calls fn on the module and returns the json response.
+    """
+
+    def __init__(self, host: str, port: int, key: Keypair, session: aiohttp.ClientSession):
+        """
+        Initializes the PooledModuleClient.
+
+        Args:
+            host (str): The host the module is serving on.
+            port (int): The port the module is serving on.
+            key (Keypair): The keypair used to sign requests.
+            session (aiohttp.ClientSession): The session shared by all pooled clients.
+        """
+        super().__init__(host=host, port=port, key=key)
+        self.session = session
+
+    async def call(self, fn: str, target_key: str, params: Any = {}, timeout: int = 16) -> Any:
+        """
+        Calls fn on the module and returns the json response.
+
+        Args:
+            fn (str): The name of the module method to call.
+            target_key (str): The SS58 address of the module.
+            params (Any, optional): The parameters passed to the module method.
+            timeout (int, optional): The total timeout of the call in seconds. Defaults to 16.
+
+        Returns:
+            Any: The json response of the module.
+
+        Raises:
+            NetworkTimeoutError: If the call took longer than the timeout.
+        """
+        serialized_data, headers = create_request_data(self.key, target_key, params)
+
+        try:
+            async with self.session.post(
+                create_method_endpoint(self.host, self.port, fn),
+                json=json.loads(serialized_data),
+                headers=headers,
+                timeout=aiohttp.ClientTimeout(total=timeout),
+            ) as response:
+                if response.status != 200:
+                    response_j = await response.json()
+                    raise Exception(f"Unexpected status code: {response.status}, response: {response_j}")
+
+                if response.content_type != "application/json":
+                    raise Exception(f"Unknown content type: {response.content_type}")
+
+                return await asyncio.wait_for(response.json(), timeout=timeout)
+        except asyncio.TimeoutError as e:
+            raise NetworkTimeoutError(
+                f"The call took longer than the timeout of {timeout} second(s)"
+            ).with_traceback(e.__traceback__)
+
+
+class ModuleClientPool:
+    """
+    Keeps one PooledModuleClient per module SS58 so clients, and the connections held
+    by their shared session, are reused across validator steps. The session is bound
+    to the event loop it was created on and is recreated if that loop changes.
+
+    Attributes:
+        key (Keypair): The keypair used to sign requests.
+        connection_limit (int): The maximum number of open connections.
+
+    Methods:
+        get_client(ss58: str, host: str, port: int) -> PooledModuleClient:
+            Returns the pooled client for the module, creating it if needed.
+        close():
+            Closes the shared session and forgets every client.
+    """
+
+    def __init__(self, key: Keypair, connection_limit: int = 100):
+        """
+        Initializes the ModuleClientPool.
+
+        Args:
+            key (Keypair): The keypair used to sign requests.
+            connection_limit (int, optional): The maximum number of open connections.
+                Defaults to 100.
+        """
+        self.key = key
+        self.connection_limit = connection_limit
+        self._session: aiohttp.ClientSession | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._clients: dict[str, PooledModuleClient] = {}
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        loop = asyncio.get_running_loop()
+        if self._session is None or self._session.closed or self._loop is not loop:
+            connector = aiohttp.TCPConnector(limit=self.connection_limit)
+            self._session = aiohttp.ClientSession(connector=connector)
+            self._loop = loop
+            self._clients = {}
+        return self._session
+
+    def get_client(self, ss58: str, host: str, port: int) -> PooledModuleClient:
+        """
+        Returns the pooled client for the module, creating it if the module is new
+        or its address changed. Must be called from within a running event loop.
+
+        Args:
+            ss58 (str): The SS58 address of the module.
+            host (str): The host the module is serving on.
+            port (int): The port the module is serving on.
+
+        Returns:
+            PooledModuleClient: The client for the module.
+        """
+        session = self._get_session()
+        client = self._clients.get(ss58)
+        if client is None or client.host != host or client.port != port:
+            client = PooledModuleClient(host=host, port=port, key=self.key, session=session)
+            self._clients[ss58] = client
+        return client
+
+    async def close(self):
+        """
+        Closes the shared session and forgets every client.
+        """
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+        self._loop = None
+        self._clients = {}
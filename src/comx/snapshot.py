@@ -0,0 +1,54 @@
+from communex.types import SubnetParamsWithEmission, ModuleInfoWithOptionalBalance
+
+
+class ChainSnapshot:
+    """
+    This class represents the state of a subnet read at a single pinned block, so the
+    modules, subnet parameters and block number are all consistent with each other.
+
+    Attributes:
+        block (int): The number of the block the snapshot was read at.
+        block_hash (str): The hash of the block the snapshot was read at.
+        modules (dict[str, ModuleInfoWithOptionalBalance]):
+            A dictionary mapping module keys to their information at the block.
+        subnet_params (SubnetParamsWithEmission | None):
+            The parameters of the subnet at the block, or None if the subnet was not found.
+
+    Methods:
+        __init__(block: int, block_hash: str, modules: dict, subnet_params: SubnetParamsWithEmission | None):
+            Initializes the ChainSnapshot instance.
+        def __repr__(self):
+            Defines and returns the string representation of a ChainSnapshot.
+    """
+
+    def __init__(
+        self,
+        block: int,
+        block_hash: str,
+        modules: dict[str, ModuleInfoWithOptionalBalance],
+        subnet_params: SubnetParamsWithEmission | None
+    ):
+        """
+        Initializes the ChainSnapshot instance.
+
+        Args:
+            block (int): The number of the block the snapshot was read at.
+            block_hash (str): The hash of the block the snapshot was read at.
+            modules (dict[str, ModuleInfoWithOptionalBalance]):
+                A dictionary mapping module keys to their information at the block.
+            subnet_params (SubnetParamsWithEmission | None):
+                The parameters of the subnet at the block, or None if the subnet was not found.
+        """
+        self.block = block
+        self.block_hash = block_hash
+        self.modules = modules
+        self.subnet_params = subnet_params
+
+    def __repr__(self) -> str:
+        """
+        Defines and returns the string representation of a ChainSnapshot.
+
+        Returns:
+            str: The string representation of the ChainSnapshot instance.
+        """
+        return f"ChainSnapshot(Block={self.block}, Hash={self.block_hash}, Modules={len(self.modules)})"
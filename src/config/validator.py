@@ -5,6 +5,15 @@ Author: Eddie
 from .base import BaseConfig
 
 ENV_VALIDATOR_INTERVAL = "VALIDATOR_INTERVAL"
+ENV_MAX_CONCURRENT_QUERIES = "MAX_CONCURRENT_QUERIES"
+ENV_QUERY_TIMEOUT = "QUERY_TIMEOUT"
+ENV_JD_PREFETCH_DEPTH = "JD_PREFETCH_DEPTH"
+ENV_SCORING_WORKERS = "SCORING_WORKERS"
+ENV_SCORE_BATCH_SIZE = "SCORE_BATCH_SIZE"
+ENV_SNAPSHOT_INTERVAL = "SNAPSHOT_INTERVAL"
+ENV_EMBEDDING_BACKEND = "EMBEDDING_BACKEND"
+ENV_MAX_RESUME_SIZE = "MAX_RESUME_SIZE"
+ENV_RESUME_CPU_DEADLINE = "RESUME_CPU_DEADLINE"
 
 
 class ValidatorConfig(BaseConfig):
@@ -14,6 +23,24 @@ class ValidatorConfig(BaseConfig):
     Methods:
         get_validator_interval() -> int:
             Retrieves the VALIDATOR_INTERVAL environment variable as an integer.
+        get_max_concurrent_queries() -> int:
+            Retrieves the MAX_CONCURRENT_QUERIES environment variable as an integer.
+        get_query_timeout() -> int:
+            Retrieves the QUERY_TIMEOUT environment variable as an integer.
+        get_jd_prefetch_depth() -> int:
+            Retrieves the JD_PREFETCH_DEPTH environment variable as an integer.
+        get_scoring_workers() -> int:
+            Retrieves the SCORING_WORKERS environment variable as an integer.
+        get_score_batch_size() -> int:
+            Retrieves the SCORE_BATCH_SIZE environment variable as an integer.
+        get_snapshot_interval() -> int:
+            Retrieves the SNAPSHOT_INTERVAL environment variable as an integer.
+        get_embedding_backend() -> str:
+            Retrieves the EMBEDDING_BACKEND environment variable.
+        get_max_resume_size() -> int:
+            Retrieves the MAX_RESUME_SIZE environment variable as an integer.
+        get_resume_cpu_deadline() -> int:
+            Retrieves the RESUME_CPU_DEADLINE environment variable as an integer.
     """
 
     def get_validator_interval(self) -> int:
@@ -35,3 +62,194 @@ class ValidatorConfig(BaseConfig):
                 f"The environment variable '{ENV_VALIDATOR_INTERVAL}' should only contain digits.")
 
         return int(interval)
+
+    def get_max_concurrent_queries(self) -> int:
+        """
+        Retrieves the MAX_CONCURRENT_QUERIES environment variable as an integer.
+
+        Returns:
+            int:
+                The value of the MAX_CONCURRENT_QUERIES environment variable, or 8 if not set.
+
+        Raises:
+            ValueError:
+                If the MAX_CONCURRENT_QUERIES environment variable contains non-digit characters
+                or is 0.
+        """
+        max_concurrent_queries = self._get(ENV_MAX_CONCURRENT_QUERIES, '8')
+
+        if not max_concurrent_queries.isdigit() or int(max_concurrent_queries) == 0:
+            raise ValueError(
+                f"The environment variable '{ENV_MAX_CONCURRENT_QUERIES}' should be a positive integer.")
+
+        return int(max_concurrent_queries)
+
+    def get_query_timeout(self) -> int:
+        """
+        Retrieves the QUERY_TIMEOUT environment variable as an integer.
+
+        Returns:
+            int:
+                The value of the QUERY_TIMEOUT environment variable, or 30 if not set.
+
+        Raises:
+            ValueError:
+                If the QUERY_TIMEOUT environment variable contains non-digit characters
+                or is 0.
+        """
+        query_timeout = self._get(ENV_QUERY_TIMEOUT, '30')
+
+        if not query_timeout.isdigit() or int(query_timeout) == 0:
+            raise ValueError(
+                f"The environment variable '{ENV_QUERY_TIMEOUT}' should be a positive integer.")
+
+        return int(query_timeout)
+
+    def get_jd_prefetch_depth(self) -> int:
+        """
+        Retrieves the JD_PREFETCH_DEPTH environment variable as an integer.
+
+        Returns:
+            int:
+                The value of the JD_PREFETCH_DEPTH environment variable, or 2 if not set.
+
+        Raises:
+            ValueError:
+                If the JD_PREFETCH_DEPTH environment variable contains non-digit characters
+                or is 0.
+        """
+        depth = self._get(ENV_JD_PREFETCH_DEPTH, '2')
+
+        if not depth.isdigit() or int(depth) == 0:
+            raise ValueError(
+                f"The environment variable '{ENV_JD_PREFETCH_DEPTH}' should be a positive integer.")
+
+        return int(depth)
+
+    def get_scoring_workers(self) -> int:
+        """
+        Retrieves the SCORING_WORKERS environment variable as an integer.
+
+        Returns:
+            int:
+                The value of the SCORING_WORKERS environment variable, or 0 if not set,
+                in which case resumes are scored serially in the validator process.
+
+        Raises:
+            ValueError:
+                If the SCORING_WORKERS environment variable contains non-digit characters.
+        """
+        workers = self._get(ENV_SCORING_WORKERS, '0')
+
+        if not workers.isdigit():
+            raise ValueError(
+                f"The environment variable '{ENV_SCORING_WORKERS}' should only contain digits.")
+
+        return int(workers)
+
+    def get_score_batch_size(self) -> int:
+        """
+        Retrieves the SCORE_BATCH_SIZE environment variable as an integer.
+
+        Returns:
+            int:
+                The value of the SCORE_BATCH_SIZE environment variable, or 16 if not set.
+
+        Raises:
+            ValueError:
+                If the SCORE_BATCH_SIZE environment variable contains non-digit characters
+                or is 0.
+        """
+        size = self._get(ENV_SCORE_BATCH_SIZE, '16')
+
+        if not size.isdigit() or int(size) == 0:
+            raise ValueError(
+                f"The environment variable '{ENV_SCORE_BATCH_SIZE}' should be a positive integer.")
+
+        return int(size)
+
+    def get_snapshot_interval(self) -> int:
+        """
+        Retrieves the SNAPSHOT_INTERVAL environment variable as an integer.
+
+        Returns:
+            int:
+                The value of the SNAPSHOT_INTERVAL environment variable, or 10 if not set.
+
+        Raises:
+            ValueError:
+                If the SNAPSHOT_INTERVAL environment variable contains non-digit characters.
+        """
+        interval = self._get(ENV_SNAPSHOT_INTERVAL, '10')
+
+        if not interval.isdigit():
+            raise ValueError(
+                f"The environment variable '{ENV_SNAPSHOT_INTERVAL}' should only contain digits.")
+
+        return int(interval)
+
+    def get_embedding_backend(self) -> str:
+        """
+        Retrieves the EMBEDDING_BACKEND environment variable.
+
+        Returns:
+            str:
+                The value of the EMBEDDING_BACKEND environment variable, or torch if not set.
+
+        Raises:
+            ValueError:
+                If the EMBEDDING_BACKEND environment variable is not a known backend.
+        """
+        # The backends are registered with the models, which are only imported here so
+        # the config stays cheap to import.
+        from validator.ats import EMBEDDING_BACKENDS
+
+        backend = self._get(ENV_EMBEDDING_BACKEND, 'torch')
+
+        if backend not in EMBEDDING_BACKENDS:
+            raise ValueError(
+                f"The environment variable '{ENV_EMBEDDING_BACKEND}' should be one of {list(EMBEDDING_BACKENDS)}.")
+
+        return backend
+
+    def get_max_resume_size(self) -> int:
+        """
+        Retrieves the MAX_RESUME_SIZE environment variable as an integer.
+
+        Returns:
+            int:
+                The value of the MAX_RESUME_SIZE environment variable, or 65536 if not set.
+
+        Raises:
+            ValueError:
+                If the MAX_RESUME_SIZE environment variable contains non-digit characters
+                or is 0.
+        """
+        size = self._get(ENV_MAX_RESUME_SIZE, '65536')
+
+        if not size.isdigit() or int(size) == 0:
+            raise ValueError(
+                f"The environment variable '{ENV_MAX_RESUME_SIZE}' should be a positive integer.")
+
+        return int(size)
+
+    def get_resume_cpu_deadline(self) -> int:
+        """
+        Retrieves the RESUME_CPU_DEADLINE environment variable as an integer.
+
+        Returns:
+            int:
+                The value of the RESUME_CPU_DEADLINE environment variable, or 10 if not set.
+
+        Raises:
+            ValueError:
+                If the RESUME_CPU_DEADLINE environment variable contains non-digit characters
+                or is 0.
+        """
+        deadline = self._get(ENV_RESUME_CPU_DEADLINE, '10')
+
+        if not deadline.isdigit() or int(deadline) == 0:
+            raise ValueError(
+                f"The environment variable '{ENV_RESUME_CPU_DEADLINE}' should be a positive integer.")
+
+        return int(deadline)
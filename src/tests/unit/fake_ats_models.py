@@ -0,0 +1,105 @@
+import json
+import random
+from typing import List
+
+import numpy as np
+import pandas as pd
+import torch
+from torch import Tensor
+
+from validator.ats import ComponentStats
+from validator.education import EducationIndex
+from validator.embedding_cache import SentenceEmbeddingCache
+from validator.resume_extract import ResumeExtractor, ResumeReferenceData
+from validator.resume_features import ResumeFeatureCache
+
+SKILLS = ["python", "pyspark", "sql", "java", "go", "rust", "c"]
+DEGREES = ["Bachelor of Science", "Master of Arts", "Doctor of Philosophy", "High School Diploma", "MBA"]
+TITLES = ["python data. ml sql", "cook. chef. a", "nothing here", "data ml python sql. aaa"]
+
+SCORING_DATA = {
+    "skills": pd.DataFrame({"skill": ["python", "sql"]}),
+    "universal": {"python": 3, "sql": 1, "java": 2},
+    "preferred": {"pyspark": 1, "go": 2},
+    "jd": {"ner_keywords": {"skills": ["python", "sql"], "education": ["Bachelor", "Master"]}, "tfidf_keywords": ["data", "ml"]},
+}
+
+
+def split_sentences(text: str) -> List[str]:
+    # Stands in for nltk.sent_tokenize, whose punkt data is downloaded by the validator at runtime.
+    return [sentence for sentence in text.split('.') if sentence.strip()]
+
+
+class FakeEmbeddingBackend:
+
+    name = "fake"
+
+    def __init__(self):
+        self.calls = 0
+
+    def encode(self, sentences: List[str]) -> Tensor:
+        self.calls += 1
+        return torch.tensor([[len(s) % 7 + 1, s.count('a') + 1, 1.0] for s in sentences], dtype=torch.float32)
+
+
+class FakeATSModels:
+    """
+    Small deterministic stand-ins for the models of ATSModels, so ATS scoring can be
+    tested without downloading any model.
+    """
+
+    def __init__(self):
+        self.model = None
+        self.nlp = None
+        self.skill_vectors = None
+        self.embedding_backend = FakeEmbeddingBackend()
+        self.embedding_cache = SentenceEmbeddingCache()
+        self.education_index = EducationIndex(
+            degree_type_mappings={degree: level for degree, level in zip(
+                DEGREES, ["Bachelor", "Master", "Doctorate", "High School", "Master"])},
+            degree_level_mappings={level: level for level in ["Bachelor", "Master", "Doctorate", "High School"]}
+        )
+        self.component_stats = ComponentStats()
+        self.resume_features = ResumeFeatureCache()
+        self.resume_extractor = ResumeExtractor(reference_data=ResumeReferenceData(
+            dataset=[{"id": 1, "Class": "Certified ScrumMaster", "Skills Gained": "Scrum, Agile"}],
+            universities={"name": ["Harvard University"]}
+        ))
+        self.encoded_skills = []
+
+    def encode_skills(self, skills: List[str]) -> np.ndarray:
+        self.encoded_skills += skills
+        vectors = []
+        for skill in skills:
+            vector = np.random.default_rng(sum(map(ord, skill))).normal(size=4)
+            if skill.startswith("py"):
+                vector = np.ones(4) + 0.01 * len(skill)
+            vectors.append(vector.astype(np.float32))
+        return np.array(vectors).reshape(len(skills), 4)
+
+    def report_embedding_backend(self):
+        pass
+
+
+def make_resumes(count: int, seed: int = 0) -> List:
+    """
+    Returns count random resumes, as JSON strings or objects, after an empty resume of
+    every kind.
+    """
+    rng = random.Random(seed)
+    resumes = [None, "", {}]
+    for _ in range(count):
+        resume = {}
+        if rng.random() < .8:
+            resume["education"] = [{"degree": rng.choice(DEGREES)} for _ in range(rng.randint(0, 2))]
+        if rng.random() < .8:
+            resume["skills"] = [rng.choice(SKILLS) for _ in range(rng.randint(0, 5))]
+        if rng.random() < .8:
+            resume["projects"] = [
+                {"start_date": f"2020-01-{rng.randint(1, 27):02d}", "end_date": f"2023-0{rng.randint(1, 8)}-01"}
+                for _ in range(rng.randint(0, 2))
+            ]
+        if rng.random() < .8:
+            resume["work_experience"] = [{"title": rng.choice(TITLES)} for _ in range(rng.randint(0, 2))]
+        resumes.append(json.dumps(resume) if rng.random() < .5 else resume)
+    return resumes
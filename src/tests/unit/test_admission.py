@@ -0,0 +1,67 @@
+import json
+from unittest import TestCase
+
+from validator.admission import AdmissionLimits, ResumeAdmission
+
+
+class TestResumeAdmission(TestCase):
+
+    def test_admit(self):
+        """
+        Unit tests that well-formed resumes are passed on unchanged, over-long lists and
+        strings are truncated, numbers in object items are converted to strings while
+        nested values are dropped, and oversized or malformed resumes are rejected.
+        """
+        admission = ResumeAdmission(AdmissionLimits(max_bytes=200, max_string_length=8, max_items={"skills": 2}))
+        resume = json.dumps({"skills": ["Python"], "work_experience": [{"title": "Engineer"}]})
+
+        tests = [
+            (resume, resume),
+            (json.dumps({"skills": ["Python", "SQL", "Java"]}), json.dumps({"skills": ["Python", "SQL"]})),
+            ({"education": [{"degree": "Bachelor of Science", "school": None}]}, {"education": [{"degree": "Bachelor"}]}),
+            ({"skills": ["Python"], "name": "Jane"}, {"skills": ["Python"]}),
+            (json.dumps({"skills": ["Python"] * 100}), None),
+            ({"education": [{"degree": "PhD"}] * 100}, None),
+            ("not json", None),
+            (json.dumps(["Python"]), None),
+            ({"skills": "Python"}, None),
+            ({"work_experience": [{"title": "Engineer", "years": 3, "current": True}]},
+             {"work_experience": [{"title": "Engineer", "years": "3", "current": "True"}]}),
+            (json.dumps({"work_experience": [{"title": "App", "tags": ["web"], "links": {"url": "x"}}]}),
+             json.dumps({"work_experience": [{"title": "App"}]})),
+            ({"work_experience": [{"title": "Engineer"}, ["Engineer"]]}, None),
+            (None, None),
+        ]
+
+        for response, expected in tests:
+            admitted = admission.admit(response)
+            assert (admitted == expected), f"Expected {expected} for {response}, got {admitted}"
+
+        stats = admission.get_stats()
+        assert (stats == {"admitted": 1, "truncated": 5, "rejected": 6}), f"Unexpected stats {stats}"
+
+    def test_admit_required_fields(self):
+        """
+        Unit tests that education items without a degree and projects without dates in
+        the YYYY-MM-DD format are dropped, as ATS reads them without checking.
+        """
+        admission = ResumeAdmission()
+        project = {"name": "App", "start_date": "2020-01-01", "end_date": "2021-06-30"}
+        education = {"school": "MIT", "degree": "Bachelor of Science"}
+
+        tests = [
+            ({"projects": [project], "education": [education]}, {"projects": [project], "education": [education]}),
+            ({"projects": [{"name": "App"}, project]}, {"projects": [project]}),
+            ({"projects": [dict(project, start_date="2020/01/01")]}, {"projects": []}),
+            ({"projects": [dict(project, end_date="2021-02-30")]}, {"projects": []}),
+            ({"projects": [dict(project, end_date=20210630)]}, {"projects": []}),
+            ({"projects": ["App"]}, {"projects": []}),
+            (json.dumps({"education": [{"school": "MIT"}, education]}), json.dumps({"education": [education]})),
+        ]
+
+        for response, expected in tests:
+            admitted = admission.admit(response)
+            assert (admitted == expected), f"Expected {expected} for {response}, got {admitted}"
+
+        stats = admission.get_stats()
+        assert (stats == {"admitted": 1, "truncated": 6, "rejected": 0}), f"Unexpected stats {stats}"
@@ -0,0 +1,266 @@
+from collections import defaultdict
+from typing import Any, Dict, List
+from unittest import TestCase
+from unittest.mock import patch
+
+import numpy as np
+import torch
+from sklearn.metrics.pairwise import cosine_similarity
+
+from validator.ats import ATS, ATS_SCORE_COLUMNS, EMBEDDING_REFERENCE_SENTENCES, QuantizedEmbeddingBackend, TorchEmbeddingBackend
+
+from tests.unit.fake_ats_models import SCORING_DATA, FakeATSModels, make_resumes, split_sentences
+
+# golang is an alias of go and shares its vector, so vectors match it to go as well.
+SKILL_VECTOR_NAMES = {"golang": "go"}
+
+
+class TinySentenceModel(torch.nn.Module):
+    """
+    A small stand-in for the SentenceTransformer, embedding the bytes of a sentence and
+    passing them through linear layers like its pooling and dense layers.
+    """
+
+    def __init__(self):
+        super().__init__()
+        generator = torch.Generator().manual_seed(0)
+        self.embedding = torch.nn.EmbeddingBag(256, 64)
+        self.layers = torch.nn.Sequential(torch.nn.Linear(64, 128), torch.nn.ReLU(), torch.nn.Linear(128, 32))
+        with torch.no_grad():
+            for parameter in self.parameters():
+                parameter.copy_(torch.randn(parameter.shape, generator=generator) * 0.1)
+
+    def encode(self, sentences: List[str], convert_to_tensor: bool = True) -> torch.Tensor:
+        tokens = [torch.tensor(list(sentence.encode())) for sentence in sentences]
+        offsets = torch.tensor([0] + [len(sentence_tokens) for sentence_tokens in tokens[:-1]]).cumsum(0)
+        with torch.no_grad():
+            return self.layers(self.embedding(torch.cat(tokens), offsets))
+
+
+class TestEmbeddingBackends(TestCase):
+
+    def test_int8(self):
+        """
+        Unit tests that the int8 backend quantizes the model's linear layers and returns
+        embeddings of the same shape, within a cosine tolerance of the torch backend.
+        """
+        model = TinySentenceModel()
+        reference = TorchEmbeddingBackend(model).encode(EMBEDDING_REFERENCE_SENTENCES)
+        quantized = QuantizedEmbeddingBackend(model)
+        embeddings = quantized.encode(EMBEDDING_REFERENCE_SENTENCES)
+
+        assert (isinstance(model.layers[0], torch.nn.Linear)), "Expected the original model left unquantized"
+        assert (not isinstance(quantized.model.layers[0], torch.nn.Linear)), "Expected the linear layers quantized"
+        assert (embeddings.shape == reference.shape), f"Expected shape {reference.shape}, got {embeddings.shape}"
+        similarity = torch.nn.functional.cosine_similarity(reference, embeddings, dim=1)
+        assert (similarity.min() > 0.99), f"Expected the int8 embeddings close to torch, got {similarity}"
+
+
+class TestATSSkills(TestCase):
+
+    def setUp(self):
+        self.models = FakeATSModels()
+        self.models.encode_skills = self.encode_skills
+        self.encoded_skills = []
+        self.ats = ATS(
+            skills_df=SCORING_DATA['skills'],
+            universal_skills_weights=SCORING_DATA['universal'],
+            preferred_skills_weights=SCORING_DATA['preferred'],
+            models=self.models
+        )
+        self.plan = self.ats.compile_plan(SCORING_DATA['jd'])
+        self.encoded_skills.clear()
+
+    def encode_skills(self, skills: List[str]) -> np.ndarray:
+        self.encoded_skills += skills
+        return np.array([
+            np.random.default_rng(sum(map(ord, SKILL_VECTOR_NAMES.get(skill, skill)))).normal(size=4)
+            for skill in skills
+        ], dtype=np.float32).reshape(len(skills), 4)
+
+    def get_baseline_score(self, resume_skills: List[str], threshold: float = 0.9) -> float:
+        # Every JD skill matched to its most similar resume skill by vector alone.
+        counts = defaultdict(int)
+        for skill in resume_skills:
+            counts[skill] += 1
+        skills = list(counts)
+        similarities = cosine_similarity(self.plan.weighted_skill_vectors, self.encode_skills(skills))
+
+        resume_score = sum(counts.values())
+        score = resume_score / len(self.plan.skills) * resume_score
+        weights = list(self.plan.universal_weights) + [weight * 0.5 for weight in self.plan.preferred_weights]
+        for weight, row in zip(weights, similarities):
+            if row.max() >= threshold:
+                score += counts[skills[row.argmax()]] * weight
+        return score
+
+    def test_match_skills(self):
+        """
+        Unit tests the ATS match_skills method using table testing.
+        """
+        test_cases = [
+            {
+                "name": "Test 1: Exact matches skip the vector lookup",
+                "resume_skills": ["python", "sql", "java", "pyspark", "go"],
+                "expected": ["python", "sql", "java", "pyspark", "go"],
+                "expected_lookup": False
+            },
+            {
+                "name": "Test 2: Matches ignore case and surrounding whitespace",
+                "resume_skills": ["  Python", "SQL", "Java ", "PySpark", "GO"],
+                "expected": ["  Python", "SQL", "Java ", "PySpark", "GO"],
+                "expected_lookup": False
+            },
+            {
+                "name": "Test 3: Aliases skip the vector lookup",
+                "resume_skills": ["python", "sql", "java", "pyspark", "Golang"],
+                "expected": ["python", "sql", "java", "pyspark", "Golang"],
+                "expected_lookup": False
+            },
+            {
+                "name": "Test 4: JD skills not matched by name are looked up by vector",
+                "resume_skills": ["python", "golang", "rust"],
+                "expected": ["python", None, None, None, "golang"],
+                "expected_lookup": True
+            }
+        ]
+
+        for tc in test_cases:
+            name: str = tc["name"]
+            lookups = []
+
+            def resume_vectors():
+                lookups.append(1)
+                return self.encode_skills(tc["resume_skills"])
+
+            matches = self.ats.match_skills(
+                self.plan.weighted_skill_names, self.plan.weighted_skill_vectors, tc["resume_skills"],
+                resume_vectors=resume_vectors)
+            assert (matches == tc["expected"]), f"{name}: Expected matches {tc['expected']}, got {matches}"
+            assert (bool(lookups) == tc["expected_lookup"]), \
+                f"{name}: Expected the vector lookup to be {tc['expected_lookup']}"
+
+    def test_score_skills(self):
+        """
+        Unit tests that skills matched by name or alias score as they do when matched by
+        vector, without looking up any resume skill vectors.
+        """
+        matched_by_name = [["python", "sql", "java", "pyspark", "go", "python"], ["python", "sql", "java", "pyspark", "golang"]]
+        for resume_skills in matched_by_name:
+            self.encoded_skills.clear()
+            score = self.ats.score_skills(self.plan, resume_skills)
+            assert (not self.encoded_skills), f"Expected no skill vectors looked up, got {self.encoded_skills}"
+            assert (np.isclose(score, self.get_baseline_score(resume_skills))), \
+                f"Expected the baseline score for {resume_skills}, got {score}"
+
+        resume_skills = ["python", "golang", "rust", "c"]
+        score = self.ats.score_skills(self.plan, resume_skills)
+        assert (np.isclose(score, self.get_baseline_score(resume_skills))), \
+            f"Expected the baseline score for {resume_skills}, got {score}"
+
+
+class TestATSScores(TestCase):
+
+    def setUp(self):
+        patcher = patch("nltk.sent_tokenize", split_sentences)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.ats = ATS(
+            skills_df=SCORING_DATA['skills'],
+            universal_skills_weights=SCORING_DATA['universal'],
+            preferred_skills_weights=SCORING_DATA['preferred'],
+            models=FakeATSModels()
+        )
+        self.plan = self.ats.compile_plan(SCORING_DATA['jd'])
+
+    def get_full_score(self, resume: Any) -> Dict[str, Any]:
+        # Every component evaluated, including those skipped when the similarity is 1.
+        if not resume:
+            return {"total_score": 0, "similarity_score": 1, "result": "Sorry, you're out."}
+        resume = self.ats.safe_json_loads(resume)
+        text = ' '.join(work["title"] for work in resume.get("work_experience", []) if "title" in work)
+        similarity_score = 1
+        if "work_experience" in resume and "skills" in resume:
+            similarity_score = self.ats.score_similarity(text, self.plan.similarity_model)
+
+        education_score = 1
+        if "education" in resume:
+            education_score = self.ats.score_degree_levels(
+                self.plan.job_levels, self.ats.get_degree_levels(resume["education"]))
+        skills_score = self.ats.score_skills(self.plan, resume["skills"]) if "skills" in resume else 1
+        projects_score = 0.3
+        if "projects" in resume:
+            projects_score = self.ats.score_project_durations(self.ats.get_project_durations(resume["projects"]))
+        semantics_score = self.ats.score_coherence(self.ats.check_semantic_sense(text))
+
+        total_score = education_score + skills_score + projects_score + semantics_score + similarity_score
+        passed = (education_score >= 1 and skills_score >= 1 and projects_score >= 0.3 and
+                  semantics_score >= 1 and similarity_score >= 1 and total_score >= 5.5)
+        if similarity_score == 1:
+            total_score, passed = 0, False
+        return {
+            "total_score": total_score,
+            "similarity_score": similarity_score,
+            "result": "Yay, you're in!" if passed else "Sorry, you're out."
+        }
+
+    def test_calculate_ats_score(self):
+        """
+        Unit tests that the expensive components are not evaluated for resumes with a
+        similarity score of 1, and that every resume still gets the score of evaluating
+        all of its components.
+        """
+        resumes = make_resumes(100)
+        full_scores = [self.get_full_score(resume) for resume in resumes]
+
+        components = ["get_degree_levels", "score_degree_levels", "score_skills",
+                      "get_project_durations", "score_project_durations", "check_semantic_sense", "score_coherence"]
+        stubs = {}
+        for component in components:
+            patcher = patch.object(self.ats, component, wraps=getattr(self.ats, component))
+            stubs[component] = patcher.start()
+            self.addCleanup(patcher.stop)
+
+        skipped = 0
+        for uid, (resume, full_score) in enumerate(zip(resumes, full_scores)):
+            for stub in stubs.values():
+                stub.reset_mock()
+            self.ats.store_resume(resume_data={str(uid): resume})
+            score = self.ats.calculate_ats_score(self.plan, str(uid))
+
+            calls = {component: stub.call_count for component, stub in stubs.items() if stub.call_count}
+            if full_score["similarity_score"] == 1:
+                skipped += 1
+                assert (not calls), f"Resume {uid}: Expected no expensive component evaluated, got {calls}"
+            else:
+                assert (calls.get("score_coherence") == 1), f"Resume {uid}: Expected the components evaluated, got {calls}"
+            for column, expected in full_score.items():
+                assert (np.isclose(score[column], expected) if column != "result" else score[column] == expected), \
+                    f"Resume {uid}: Expected {column} {expected}, got {score[column]}"
+
+        assert (skipped and skipped < len(resumes)), f"Expected some resumes skipped and some scored, got {skipped} skipped"
+
+    def test_calculate_ats_scores(self):
+        """
+        Unit tests that scoring resumes in a batch gives every resume the score it gets
+        when scored alone, with the same components skipped.
+        """
+        resumes = make_resumes(100)
+        batch = self.ats.calculate_ats_scores(self.plan, resumes).to_dict('records')
+
+        skipped = 0
+        for uid, (resume, batch_score) in enumerate(zip(resumes, batch)):
+            self.ats.store_resume(resume_data={str(uid): resume})
+            score = self.ats.calculate_ats_score(self.plan, str(uid))
+            assert (list(batch_score) == ATS_SCORE_COLUMNS), f"Expected the columns {ATS_SCORE_COLUMNS}, got {list(batch_score)}"
+            for column in ATS_SCORE_COLUMNS:
+                expected, value = score[column], batch_score[column]
+                if expected is None or isinstance(expected, str):
+                    skipped += expected is None
+                    assert (value == expected), f"Resume {uid}: Expected {column} {expected!r}, got {value!r}"
+                else:
+                    assert (value is not None and np.isclose(value, expected)), \
+                        f"Resume {uid}: Expected {column} {expected}, got {value}"
+
+        assert (skipped), "Expected some resumes with skipped components"
+        assert (any(score["total_score"] for score in batch)), "Expected some resumes scored in full"
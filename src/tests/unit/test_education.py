@@ -0,0 +1,63 @@
+from unittest import TestCase
+
+from validator.education import EducationIndex
+
+DEGREE_TYPE_MAPPINGS = {
+    "High School Diploma": "High School",
+    "Associate of Arts": "Associate",
+    "Bachelor of Science": "Bachelor",
+    "BS": "Bachelor",
+    "Master of Science": "Master",
+    "MBA": "Master",
+    "Doctor of Philosophy": "Doctorate",
+}
+DEGREE_LEVEL_MAPPINGS = {
+    "High School": "High School",
+    "Associate": "Associate",
+    "Bachelor": "Bachelor",
+    "Master": "Master",
+    "Doctorate": "Doctorate",
+}
+
+
+class TestEducationIndex(TestCase):
+
+    def test_get_degree_level(self):
+        """
+        Unit tests the EducationIndex get_degree_level method using table testing.
+        """
+        test_cases = [
+            {
+                "name": "Test 1: Exact key",
+                "degree": "Master of Science",
+                "expected": 3
+            },
+            {
+                "name": "Test 2: Same terms as a key",
+                "degree": "science, BACHELOR",
+                "expected": 2
+            },
+            {
+                "name": "Test 3: Nearest key",
+                "degree": "Bachelor of Science in Computer Science",
+                "expected": 2
+            },
+            {
+                "name": "Test 4: Nearest key by a shared term",
+                "degree": "Doctor of Medicine",
+                "expected": 4
+            },
+            {
+                "name": "Test 5: No shared terms falls back to the first key",
+                "degree": "Certificate",
+                "expected": 0
+            }
+        ]
+
+        index = EducationIndex(DEGREE_TYPE_MAPPINGS, DEGREE_LEVEL_MAPPINGS)
+        for tc in test_cases:
+            name: str = tc["name"]
+            level = index.get_degree_level(tc["degree"])
+            assert (level == tc["expected"]), f"{name}: Expected level {tc['expected']}, got {level}"
+            level = index.get_degree_level(tc["degree"])
+            assert (level == tc["expected"]), f"{name}: Expected memoized level {tc['expected']}, got {level}"
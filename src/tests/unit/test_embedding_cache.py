@@ -0,0 +1,42 @@
+from typing import List
+from unittest import TestCase
+
+import torch
+
+from validator.embedding_cache import SentenceEmbeddingCache
+
+
+class FakeModel:
+
+    def __init__(self):
+        self.calls = []
+
+    def encode(self, sentences: List[str]) -> torch.Tensor:
+        self.calls.append(sentences)
+        return torch.tensor([[float(len(sentence)), 1.0] for sentence in sentences])
+
+
+class TestSentenceEmbeddingCache(TestCase):
+
+    def test_encode(self):
+        """
+        Unit tests that only sentences missing from the cache are encoded, and that the
+        least recently used embeddings are evicted once the byte limit is exceeded.
+        """
+        model = FakeModel()
+        # Every entry takes a 32 byte key and an 8 byte embedding, so two entries fit.
+        cache = SentenceEmbeddingCache(max_bytes=80)
+
+        embeddings = cache.encode(model.encode, ["ab", "abc", "ab"])
+        assert (model.calls == [["ab", "abc"]]), f"Expected one batch of distinct sentences, got {model.calls}"
+        assert (embeddings[:, 0].tolist() == [2, 3, 2]), f"Unexpected embeddings {embeddings}"
+
+        cache.encode(model.encode, ["abc", "abcd"])
+        assert (model.calls[-1] == ["abcd"]), f"Expected only the missing sentence encoded, got {model.calls[-1]}"
+
+        cache.encode(model.encode, ["ab"])
+        assert (model.calls[-1] == ["ab"]), f"Expected the evicted sentence encoded again, got {model.calls[-1]}"
+
+        stats = cache.get_stats()
+        assert (stats["hits"] == 2 and stats["misses"] == 4), f"Unexpected stats {stats}"
+        assert (stats["size"] == 2 and stats["bytes"] == 80), f"Unexpected stats {stats}"
@@ -0,0 +1,64 @@
+import os
+import tempfile
+import time
+from unittest import TestCase
+from unittest.mock import patch
+
+from datasets import Dataset
+
+from validator import jd_pool
+from validator.jd_pool import FallbackJobDescriptionPool
+
+
+class TestFallbackJobDescriptionPool(TestCase):
+
+    def test_sample(self):
+        """
+        Unit tests that every record is drawn once per cycle before any is repeated.
+        """
+        with tempfile.TemporaryDirectory() as dir_path:
+            Dataset.from_dict({"id": list(range(5))}).save_to_disk(
+                os.path.join(dir_path, f"pool-{time.time_ns()}"))
+            pool = FallbackJobDescriptionPool(dir_path=dir_path)
+
+            for cycle in range(3):
+                ids = [pool.sample()["id"] for _ in range(5)]
+                assert (sorted(ids) == list(range(5))), f"Expected every record once in cycle {cycle}, got {ids}"
+
+    def test_start(self):
+        """
+        Unit tests that a restart reopens the saved pool without reloading the dataset
+        while it is recent, and reloads it once it is stale or missing using table testing.
+        """
+        test_cases = [
+            {"name": "recent pool", "age": 0, "expected_loads": 0, "expected_id": 0},
+            {"name": "stale pool", "age": 2 * 60 * 60, "expected_loads": 1, "expected_id": 1},
+            {"name": "missing pool", "age": None, "expected_loads": 1, "expected_id": 1},
+        ]
+
+        for test_case in test_cases:
+            with self.subTest(test_case["name"]), tempfile.TemporaryDirectory() as dir_path:
+                if test_case["age"] is not None:
+                    built_ns = time.time_ns() - test_case["age"] * 10**9
+                    Dataset.from_dict({"id": [0]}).save_to_disk(os.path.join(dir_path, f"pool-{built_ns}"))
+
+                loads = []
+
+                def load_dataset(*args, **kwargs):
+                    loads.append(args)
+                    return Dataset.from_dict({"id": [1]})
+
+                with patch.object(jd_pool, "load_dataset", load_dataset):
+                    pool = FallbackJobDescriptionPool(dir_path=dir_path, refresh_interval=60 * 60)
+                    pool.start()
+                    deadline = time.monotonic() + 5
+                    while len(loads) < test_case["expected_loads"] and time.monotonic() < deadline:
+                        time.sleep(0.01)
+                    time.sleep(0.1)
+                    record = pool.sample()
+
+                assert (record["id"] == test_case["expected_id"]), f"Unexpected record {record}"
+
+                assert (len(loads) == test_case["expected_loads"]), \
+                    f"Expected {test_case['expected_loads']} dataset loads, got {len(loads)}"
+                assert (len(pool._saved_paths()) == 1), "Expected only the newest pool kept on disk"
@@ -0,0 +1,78 @@
+import queue
+import threading
+import time
+from unittest import TestCase
+
+from validator.jd_prefetch import JobDescriptionPrefetcher
+
+
+def wait_for(condition, timeout: float = 5):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        if time.monotonic() > deadline:
+            raise AssertionError("Timed out waiting for the prefetcher")
+        time.sleep(0.01)
+
+
+class TestJobDescriptionPrefetcher(TestCase):
+
+    def test_queue_depth(self):
+        """
+        Unit tests that the prefetcher keeps at most depth bundles queued, refills the
+        queue as bundles are popped, and reports it in its metrics.
+        """
+        fetched = []
+
+        async def fetch():
+            fetched.append(len(fetched))
+            return f"jd {len(fetched) - 1}"
+
+        prefetcher = JobDescriptionPrefetcher(fetch=fetch, process=lambda jd: {"jd": jd}, depth=2)
+        prefetcher.start()
+        try:
+            wait_for(lambda: prefetcher.get_metrics()["ready"] == 2)
+            time.sleep(0.1)
+            metrics = prefetcher.get_metrics()
+            assert (len(fetched) == 2), f"Expected the queue filled to its depth, fetched {len(fetched)}"
+            assert (metrics["queue_depth"] == 2 and metrics["queue_capacity"] == 2), f"Unexpected metrics {metrics}"
+            assert (metrics["refills"] == 2 and metrics["failures"] == 0), f"Unexpected metrics {metrics}"
+            assert (metrics["avg_refill_latency"] is not None), f"Unexpected metrics {metrics}"
+
+            job_description, scoring_data = prefetcher.get(timeout=1)
+            assert (job_description == "jd 0"), f"Expected the oldest job description, got {job_description}"
+            assert (scoring_data.result(timeout=1) == {"jd": "jd 0"}), "Unexpected scoring data"
+
+            wait_for(lambda: len(fetched) == 3)
+            assert (prefetcher.get_metrics()["last_wait"] is not None), "Expected the wait recorded"
+        finally:
+            prefetcher.stop()
+
+    def test_errors(self):
+        """
+        Unit tests that processing errors are raised from the scoring data, fetch errors
+        are counted and retried, and get times out while nothing could be fetched.
+        """
+        fail_fetch = threading.Event()
+        fail_fetch.set()
+
+        async def fetch():
+            if fail_fetch.is_set():
+                raise ConnectionError("JD API down")
+            return "jd"
+
+        def process(job_description):
+            raise ValueError("unparseable job description")
+
+        prefetcher = JobDescriptionPrefetcher(fetch=fetch, process=process, depth=1, retry_interval=0.05)
+        prefetcher.start()
+        try:
+            with self.assertRaises(queue.Empty):
+                prefetcher.get(timeout=0.2)
+            assert (prefetcher.get_metrics()["failures"] >= 1), "Expected the fetch failures counted"
+
+            fail_fetch.clear()
+            job_description, scoring_data = prefetcher.get(timeout=2)
+            with self.assertRaises(ValueError):
+                scoring_data.result(timeout=1)
+        finally:
+            prefetcher.stop()
@@ -0,0 +1,93 @@
+from unittest import TestCase
+
+from comx.miner.health import MinerHealthTracker
+
+
+class TestMinerHealthTracker(TestCase):
+
+    def test_get_timeout(self):
+        """
+        Unit tests the MinerHealthTracker get_timeout method using table testing.
+        """
+        test_cases = [
+            {
+                "name": "Test 1: No history uses the default",
+                "latencies": [],
+                "expected": 20
+            },
+            {
+                "name": "Test 2: Fast miner is floored at the minimum timeout",
+                "latencies": [0.5, 1, 1.5],
+                "expected": 5
+            },
+            {
+                "name": "Test 3: Timeout follows the p95 latency",
+                "latencies": [1, 2, 3, 4, 6],
+                "expected": 12
+            },
+            {
+                "name": "Test 4: Slow miner is capped at the default",
+                "latencies": [15, 18],
+                "expected": 20
+            }
+        ]
+
+        for tc in test_cases:
+            name: str = tc["name"]
+            tracker = MinerHealthTracker(timeout_multiplier=2, min_timeout=5)
+            for latency in tc["latencies"]:
+                tracker.record_success("a", latency)
+
+            timeout = tracker.get_timeout("a", 20)
+            assert (timeout == tc["expected"]), f"{name}: Expected timeout {tc['expected']}, got {timeout}"
+
+    def test_circuit_breaker(self):
+        """
+        Unit tests that the circuit opens after repeated failures, is probed once per
+        probe interval and closes again after a successful probe.
+        """
+        tracker = MinerHealthTracker(failure_threshold=3, probe_interval=100)
+
+        for now in [0, 1]:
+            tracker.record_failure("a", now=now)
+            assert (tracker.should_query("a", now=now)), "Circuit should stay closed below the threshold"
+
+        tracker.record_failure("a", now=2)
+        assert (tracker.is_open("a")), "Circuit should open at the threshold"
+        assert (not tracker.should_query("a", now=50)), "Open circuit should not be queried before the probe interval"
+
+        assert (tracker.should_query("a", now=102)), "Open circuit should be probed after the probe interval"
+        assert (not tracker.should_query("a", now=103)), "Only one probe should be allowed per probe interval"
+
+        tracker.record_failure("a", now=103)
+        assert (tracker.is_open("a")), "Failed probe should keep the circuit open"
+        assert (tracker.should_query("a", now=202)), "Open circuit should be probed again after the probe interval"
+
+        tracker.record_success("a", 1)
+        assert (not tracker.is_open("a")), "Successful probe should close the circuit"
+        assert (tracker.should_query("b")), "Unknown miners should be queried"
+
+    def test_timeouts(self):
+        """
+        Unit tests that timed out queries are counted as failures and as timeouts.
+        """
+        tracker = MinerHealthTracker(failure_threshold=2)
+
+        tracker.record_failure("a", now=0, timed_out=True)
+        tracker.record_failure("a", now=1)
+        stats = tracker.get_stats("a")
+        assert (stats["failures"] == 2 and stats["timeouts"] == 1), f"Unexpected stats {stats}"
+        assert (stats["open"]), "Timed out queries should count towards opening the circuit"
+
+    def test_prune(self):
+        """
+        Unit tests that pruning forgets the miners that are no longer registered.
+        """
+        tracker = MinerHealthTracker(failure_threshold=1)
+        tracker.record_failure("a", now=0)
+        tracker.record_failure("b", now=0)
+
+        tracker.prune(["a", "c"])
+        assert (tracker.is_open("a")), "Registered miners should keep their history"
+        assert (not tracker.is_open("b")), "Deregistered miners should be forgotten"
+        assert (tracker.get_stats("b")["failures"] == 0), "A re-registered miner should start without history"
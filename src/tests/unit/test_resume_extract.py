@@ -0,0 +1,34 @@
+from collections import defaultdict
+from unittest import TestCase
+
+from validator.resume_extract import ResumeExtractor, ResumeReferenceData
+
+CERTIFICATIONS = [
+    {"id": 1, "Class": "AWS Certified Solutions Architect", "Skills Gained": "AWS, Cloud Architecture"},
+    {"id": 2, "Class": "Certified ScrumMaster", "Skills Gained": "Scrum, Agile"},
+    {"id": 3, "Class": "Certified ScrumMaster", "Skills Gained": "Ignored"},
+]
+COLLEGES = {"name": ["Harvard University", "Stanford University"]}
+
+
+class TestResumeExtractor(TestCase):
+
+    def test_stateless(self):
+        """
+        Unit tests that certifications are resolved to the skills gained of their first
+        record, and that the extractor keeps nothing from the resumes it extracted.
+        """
+        reference_data = ResumeReferenceData(dataset=CERTIFICATIONS, universities=COLLEGES)
+        extractor = ResumeExtractor(reference_data=reference_data)
+
+        assert (extractor.check_university_exists("harvard university") == 1), "Expected the college to exist"
+        assert (extractor.check_university_exists("Nonexistent University") == 0), "Expected the college not to exist"
+
+        for _ in range(2):
+            universal_skills = extractor.process_skills(["Agile", "Python"], defaultdict(int))
+            certification_dict = extractor.skills_from_certs(["Certified ScrumMaster (CSM)"], universal_skills)
+            assert (certification_dict == {"Certified ScrumMaster": ["Scrum", "Agile"]}), \
+                f"Unexpected certifications {certification_dict}"
+            assert (universal_skills == {"Agile": 2, "Python": 1, "Scrum": 1}), f"Unexpected skills {universal_skills}"
+
+        assert (list(vars(extractor)) == ["reference_data"]), f"Unexpected extractor state {vars(extractor)}"
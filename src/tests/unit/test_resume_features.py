@@ -0,0 +1,32 @@
+from unittest import TestCase
+
+from validator.resume_features import ResumeFeatureCache
+
+
+class TestResumeFeatureCache(TestCase):
+
+    def test_get(self):
+        """
+        Unit tests that a feature is only computed once per resume, and that the least
+        recently used resumes are evicted once the cache is full.
+        """
+        cache = ResumeFeatureCache(max_size=2)
+        calls = []
+
+        def compute():
+            calls.append(1)
+            return (3, 2)
+
+        assert (cache.get("a").get("degree_levels", compute) == (3, 2)), "Expected the computed feature"
+        assert (cache.get("a").get("degree_levels", compute) == (3, 2)), "Expected the cached feature"
+        assert (len(calls) == 1), f"Expected the feature computed once, got {len(calls)}"
+
+        cache.get("b").set("coherence", 0.5)
+        assert ("coherence" in cache.get("b")), "Expected the stored feature"
+
+        cache.get("c")
+        assert ("degree_levels" not in cache.get("a")), "Expected the least recently used resume evicted"
+
+        stats = cache.get_stats()
+        assert (stats["hits"] == 2 and stats["misses"] == 4), f"Unexpected stats {stats}"
+        assert (stats["size"] == 2), f"Unexpected stats {stats}"
@@ -0,0 +1,80 @@
+from unittest import TestCase
+
+from validator.score_cache import ScoreCache
+
+SCORING_DATA = {
+    "jd": {"ner_keywords": {"skills": ["Python", "SQL"], "education": ["Bachelor"]}, "tfidf_keywords": ["data"]},
+    "universal": {"python": 3, "sql": 1},
+    "preferred": {"go": 2},
+}
+
+
+class TestScoreCache(TestCase):
+
+    def test_fingerprint_resume(self):
+        """
+        Unit tests the ScoreCache fingerprint_resume method using table testing.
+        """
+        resume = '{"skills": ["Python", "SQL"], "education": [{"degree": "BS"}]}'
+        test_cases = [
+            {
+                "name": "Test 1: Key order does not matter",
+                "resume": '{"education": [{"degree": "BS"}], "skills": ["Python", "SQL"]}',
+                "expected": True
+            },
+            {
+                "name": "Test 2: Whitespace does not matter",
+                "resume": '{ "skills" : [ "Python" , "SQL" ],\n "education": [ { "degree": "BS" } ] }',
+                "expected": True
+            },
+            {
+                "name": "Test 3: Object responses are told apart from JSON responses",
+                "resume": {"skills": ["Python", "SQL"], "education": [{"degree": "BS"}]},
+                "expected": False
+            },
+            {
+                "name": "Test 4: List order matters",
+                "resume": '{"skills": ["SQL", "Python"], "education": [{"degree": "BS"}]}',
+                "expected": False
+            },
+            {
+                "name": "Test 5: Whitespace inside values matters",
+                "resume": '{"skills": ["Python ", "SQL"], "education": [{"degree": "BS"}]}',
+                "expected": False
+            }
+        ]
+
+        for tc in test_cases:
+            name: str = tc["name"]
+            same = ScoreCache.fingerprint_resume(tc["resume"]) == ScoreCache.fingerprint_resume(resume)
+            assert (same == tc["expected"]), f"{name}: Expected equal fingerprints to be {tc['expected']}, got {same}"
+
+        reordered = {"preferred": SCORING_DATA["preferred"], "universal": {"sql": 1, "python": 3}, "jd": SCORING_DATA["jd"]}
+        assert (ScoreCache.fingerprint_job_description(reordered) == ScoreCache.fingerprint_job_description(SCORING_DATA)), \
+            "Expected the job description fingerprint to ignore key order"
+
+    def test_get(self):
+        """
+        Unit tests that scores are copied in and out of the cache, that the least recently
+        used score is evicted once the cache is full, and that hits and misses are counted.
+        """
+        cache = ScoreCache(max_size=2)
+        jd = ScoreCache.fingerprint_job_description(SCORING_DATA)
+
+        score = {"total_score": 1.5}
+        cache.put(jd, "a", score)
+        score["total_score"] = 0
+        assert (cache.get(jd, "a") == {"total_score": 1.5}), "Expected the cached score unaffected by later changes"
+        cache.get(jd, "a")["total_score"] = 0
+        assert (cache.get(jd, "a") == {"total_score": 1.5}), "Expected the cached score unaffected by changes to copies"
+
+        cache.put(jd, "b", {"total_score": 2})
+        cache.get(jd, "a")
+        cache.put(jd, "c", {"total_score": 3})
+        assert (cache.get(jd, "b") is None), "Expected the least recently used score evicted"
+        assert (cache.get(jd, "a") is not None and cache.get(jd, "c") is not None), "Expected the recent scores kept"
+        assert (cache.get("other", "a") is None), "Expected scores keyed by the job description"
+
+        stats = cache.get_stats()
+        assert (stats["hits"] == 6 and stats["misses"] == 2), f"Unexpected stats {stats}"
+        assert (stats["hit_rate"] == 0.75 and stats["size"] == 2), f"Unexpected stats {stats}"
@@ -0,0 +1,88 @@
+import json
+from unittest import TestCase
+from unittest.mock import patch
+
+from validator.ats import ATS
+from validator.scoring_pool import ScoringPool, score_resumes
+
+from tests.unit.fake_ats_models import SCORING_DATA, FakeATSModels, make_resumes, split_sentences
+
+SECOND_JOB_DESCRIPTION = {
+    "ner_keywords": {"skills": ["java", "cook"], "education": ["Master"]},
+    "tfidf_keywords": ["chef"],
+}
+
+
+class TestScoringPool(TestCase):
+
+    def setUp(self):
+        patcher = patch("nltk.sent_tokenize", split_sentences)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def get_ats(self) -> ATS:
+        return ATS(
+            skills_df=SCORING_DATA['skills'],
+            universal_skills_weights=SCORING_DATA['universal'],
+            preferred_skills_weights=SCORING_DATA['preferred'],
+            models=FakeATSModels()
+        )
+
+    def test_score(self):
+        """
+        Unit tests that resumes scored in batches by the pool's workers get exactly the
+        scores they get when scored serially in one batch, across two job descriptions.
+        """
+        resumes = [(str(uid), {str(uid): resume}) for uid, resume in enumerate(make_resumes(60))]
+        pool = ScoringPool(models=FakeATSModels(), workers=2)
+        try:
+            for jd in [SCORING_DATA['jd'], SECOND_JOB_DESCRIPTION]:
+                ats = self.get_ats()
+                plan = ats.compile_plan(jd)
+                scoring_data = dict(SCORING_DATA, jd=jd)
+
+                pooled = pool.score(scoring_data, plan, resumes)
+                serial = score_resumes(ats, plan, resumes)
+                assert (any(score["total_score"] for score in serial)), "Expected some resumes scored in full"
+                for (uid, _), pooled_score, serial_score in zip(resumes, pooled, serial):
+                    assert (pooled_score == serial_score), \
+                        f"Expected the pooled score of {uid} to equal {serial_score}, got {pooled_score}"
+        finally:
+            pool.shutdown()
+
+    def test_score_resumes_deadline(self):
+        """
+        Unit tests that resumes whose scoring runs past the CPU deadline are scored as
+        empty resumes instead of failing the batch.
+        """
+        ats = self.get_ats()
+        plan = ats.compile_plan(SCORING_DATA['jd'])
+        resumes = [(str(uid), {str(uid): resume}) for uid, resume in enumerate(make_resumes(20))]
+
+        ats.store_resume(resume_data={"empty": None})
+        empty_score = ats.calculate_ats_score(plan, "empty")
+        scores = score_resumes(ats, plan, resumes, cpu_deadline=1e-9)
+        assert (scores == [empty_score] * len(resumes)), f"Expected every resume scored as empty, got {scores}"
+
+    def test_score_resumes_failure(self):
+        """
+        Unit tests that a resume failing to score in a batch is scored as an empty resume,
+        while the other resumes of the batch get their usual scores.
+        """
+        ats = self.get_ats()
+        plan = ats.compile_plan(SCORING_DATA['jd'])
+        resumes = [(str(uid), {str(uid): resume}) for uid, resume in enumerate(make_resumes(20))]
+        expected = score_resumes(ats, plan, resumes)
+
+        # A project date ATS cannot parse, in a resume scored in full.
+        uid, resume_data = next(resume for resume, score in zip(resumes, expected) if score["total_score"])
+        resume = resume_data[uid]
+        resume = json.loads(resume) if isinstance(resume, str) else resume
+        bad_resume = dict(resume, projects=[{"start_date": "2020/01/01", "end_date": "2021-01-01"}])
+        ats.store_resume(resume_data={"empty": None})
+        expected[int(uid)] = ats.calculate_ats_score(plan, "empty")
+
+        resumes[int(uid)] = (uid, {uid: bad_resume})
+        scores = score_resumes(ats, plan, resumes)
+        for (uid, _), score, expected_score in zip(resumes, scores, expected):
+            assert (score == expected_score), f"Expected the score of {uid} to equal {expected_score}, got {score}"
@@ -0,0 +1,53 @@
+import random
+from unittest import TestCase
+
+import numpy as np
+from sklearn.feature_extraction.text import TfidfVectorizer
+from sklearn.metrics.pairwise import cosine_similarity
+
+from validator.similarity import TfidfSimilarity
+
+WORDS = ["python", "data", "sql", "machine", "learning", "Python", "cloud", "a", "I", "c++", "node.js", "team"]
+
+
+def get_baseline_similarity(job_description_text: str, resume_text: str) -> float:
+    # The TfidfVectorizer refit on every resume that TfidfSimilarity replaces.
+    vectorizer = TfidfVectorizer()
+    vectorizer.fit([job_description_text, resume_text])
+    return cosine_similarity(vectorizer.transform([job_description_text]), vectorizer.transform([resume_text]))[0][0]
+
+
+class TestTfidfSimilarity(TestCase):
+
+    def test_similarities(self):
+        """
+        Unit tests that the similarities equal those of refitting a TfidfVectorizer on
+        the job description and each resume.
+        """
+        rng = random.Random(0)
+        job_descriptions = ["python data sql machine learning data", "cloud team", "a I"]
+        resume_texts = ["", "a", "python", "Python PYTHON data. SQL"] + [
+            ' '.join(rng.choice(WORDS) for _ in range(rng.randint(1, 12))) for _ in range(200)
+        ]
+
+        for job_description_text in job_descriptions:
+            similarities = TfidfSimilarity(job_description_text).similarities(resume_texts)
+            for resume_text, similarity in zip(resume_texts, similarities):
+                try:
+                    expected = get_baseline_similarity(job_description_text, resume_text)
+                except ValueError:
+                    # Neither text has any terms.
+                    expected = 0
+                assert (np.isclose(similarity, expected)), \
+                    f"Expected similarity {expected} of {resume_text!r} to {job_description_text!r}, got {similarity}"
+
+    def test_empty_vocabulary(self):
+        """
+        Unit tests that texts without terms have a similarity of 0, where TfidfVectorizer
+        raises for the empty vocabulary.
+        """
+        with self.assertRaises(ValueError):
+            get_baseline_similarity("a", "I")
+
+        similarities = TfidfSimilarity("a").similarities(["I", "", "python"])
+        assert (list(similarities) == [0, 0, 0]), f"Expected similarities of 0, got {similarities}"
@@ -0,0 +1,44 @@
+import tempfile
+from typing import List
+from unittest import TestCase
+
+import numpy as np
+
+from validator.skill_vectors import SkillVectorStore
+
+
+class FakeEncoder:
+
+    def __init__(self):
+        self.calls = []
+
+    def __call__(self, skills: List[str]) -> np.ndarray:
+        self.calls += skills
+        return np.array([np.full(3, len(skill)) for skill in skills], dtype=np.float32)
+
+
+class TestSkillVectorStore(TestCase):
+
+    def test_get_vectors(self):
+        """
+        Unit tests that skills are embedded once, persisted to disk and shared with
+        other stores opened on the same directory.
+        """
+        with tempfile.TemporaryDirectory() as dir_path:
+            encoder = FakeEncoder()
+            store = SkillVectorStore(dir_path=dir_path, encode=encoder, dim=3, max_cache_size=1)
+            store.seed(["Python", "SQL", "Python"])
+            assert (encoder.calls == ["Python", "SQL"]), f"Expected each skill embedded once, got {encoder.calls}"
+
+            vectors = store.get_vectors(["SQL", "Python", "Java"])
+            assert (encoder.calls == ["Python", "SQL", "Java"]), f"Expected only Java embedded, got {encoder.calls}"
+            assert (np.array_equal(vectors["Python"], np.full(3, 6))), f"Unexpected vector {vectors['Python']}"
+
+            other_encoder = FakeEncoder()
+            other = SkillVectorStore(dir_path=dir_path, encode=other_encoder, dim=3)
+            assert (len(other) == 3), f"Expected 3 stored skills, got {len(other)}"
+
+            store.get_vectors(["Go"])
+            vectors = other.get_vectors(["Go", "Java"])
+            assert (other_encoder.calls == []), f"Expected no skills embedded, got {other_encoder.calls}"
+            assert (np.array_equal(vectors["Go"], np.full(3, 2))), f"Unexpected vector {vectors['Go']}"
@@ -2,18 +2,39 @@
 Author: Eddie
 """
 
+import asyncio
 from unittest import TestCase
-from unittest.mock import create_autospec
+from unittest.mock import create_autospec, patch
 
 from communex.types import ModuleInfoWithOptionalBalance, SubnetParamsWithEmission
 
 from comx.interface import ComxInterface
+from comx.module_client import ModuleClientPool
+from comx.snapshot import ChainSnapshot
 from comx.miner.module import MinerModule, ScoredMinerModule
 from comx.miner.registry import MinerRegistry
 
 from validator.main import Validator
 from validator.io.weights import WeightIOInterface
 
+from tests.unit.fake_ats_models import SCORING_DATA, FakeATSModels
+
+
+class FakeModuleClient:
+    """
+    A module client that answers after a delay, or raises if no answer is given.
+    """
+
+    def __init__(self, delay: float, answer: str | None):
+        self.delay = delay
+        self.answer = answer
+
+    async def call(self, fn, target_key, params={}, timeout=16):
+        await asyncio.sleep(self.delay)
+        if self.answer is None:
+            raise Exception("Miner failed to respond")
+        return {"answer": self.answer}
+
 
 class TestValidator(TestCase):
 
@@ -84,13 +105,12 @@ class TestValidator(TestCase):
             expected_miners: dict[str, bool] = tc["expected_miners"]
             modules: dict[str, ModuleInfoWithOptionalBalance] = tc["modules"]
 
-            def mock_get_map_modules(self, netuid: int = 0, include_balances: bool = False):
-                nonlocal modules
-                return modules
-
-            self.mock_comx.get_map_modules.side_effect = mock_get_map_modules
-            self.mock_comx.get_subnet_params.return_value = SubnetParamsWithEmission(max_weight_age=max_weight_age)
-            self.mock_comx.get_current_block.return_value = current_block
+            self.mock_comx.get_snapshot.return_value = ChainSnapshot(
+                block=current_block,
+                block_hash="0x0",
+                modules=modules,
+                subnet_params=SubnetParamsWithEmission(max_weight_age=max_weight_age)
+            )
 
             validator = Validator(key=None, netuid=0, client=self.mock_comx, weight_io=None, interval=20)
             miners = validator.get_miner_modules()
@@ -597,3 +617,84 @@ class TestValidator(TestCase):
 
             expected_registry_dict = expected_registry.to_ss58_dict()
             assert (len(expected_registry_dict) == 0), f"{name}: Missing miners in result_dict"
+
+    def test_query(self):
+        """
+        Unit tests the Validator query method using table testing.
+        """
+        test_cases = [
+            {
+                "name": "Test 1: All miners respond",
+                "miners": [
+                    ScoredMinerModule(uid=1, ss58="a", address="0.0.0.0:0", score=0),
+                    ScoredMinerModule(uid=2, ss58="b", address="0.0.0.0:1", score=0)
+                ],
+                "clients": {
+                    "a": FakeModuleClient(delay=0, answer="resume a"),
+                    "b": FakeModuleClient(delay=0, answer="resume b")
+                },
+                "expected": [{"1": "resume a"}, {"2": "resume b"}]
+            },
+            {
+                "name": "Test 2: Miner errors and miner without address",
+                "miners": [
+                    ScoredMinerModule(uid=1, ss58="a", address="0.0.0.0:0", score=0),
+                    ScoredMinerModule(uid=2, ss58="b", address="None:None", score=0)
+                ],
+                "clients": {
+                    "a": FakeModuleClient(delay=0, answer=None)
+                },
+                "expected": [{"1": None}, {"2": None}]
+            },
+            {
+                "name": "Test 3: Slow miner misses the query deadline",
+                "miners": [
+                    ScoredMinerModule(uid=1, ss58="a", address="0.0.0.0:0", score=0),
+                    ScoredMinerModule(uid=2, ss58="b", address="0.0.0.0:1", score=0)
+                ],
+                "clients": {
+                    "a": FakeModuleClient(delay=0, answer="resume a"),
+                    "b": FakeModuleClient(delay=10, answer="resume b")
+                },
+                "expected": [{"1": "resume a"}, {"2": None}]
+            }
+        ]
+
+        for tc in test_cases:
+            name: str = tc["name"]
+            miners: list[ScoredMinerModule] = tc["miners"]
+            clients: dict[str, FakeModuleClient] = tc["clients"]
+            expected: list[dict] = tc["expected"]
+
+            miner_registry = MinerRegistry()
+            [miner_registry.set(miner) for miner in miners]
+
+            validator = Validator(key=None, netuid=0, client=None, weight_io=None, interval=20, query_timeout=1)
+            validator.client_pool = create_autospec(ModuleClientPool, instance=True)
+            validator.client_pool.get_client.side_effect = lambda ss58, host, port: clients[ss58]
+
+            result = asyncio.run(validator.query(miners=miner_registry, job_description="job"))
+            assert (result == expected), f"{name}: Expected {expected}, got {result}"
+
+    def test_get_ats(self):
+        """
+        Unit tests that the ATS models are loaded once and shared by the ATS context of
+        every job description.
+        """
+        loaded = []
+
+        class CountingATSModels(FakeATSModels):
+
+            def __init__(self, **kwargs):
+                super().__init__()
+                loaded.append(self)
+
+        with patch("validator.main.ATSModels", CountingATSModels):
+            validator = Validator(key=None, netuid=0, client=None, weight_io=None, interval=20)
+            first = validator.get_ats(SCORING_DATA)
+            second = validator.get_ats(dict(SCORING_DATA, universal={"go": 1}))
+            validator.load_scoring()
+
+        assert (len(loaded) == 1), f"Expected the ATS models loaded once, got {len(loaded)}"
+        assert (first.models is loaded[0] and second.models is loaded[0]), "Expected the ATS models shared"
+        assert (first.resume_extractor is second.resume_extractor), "Expected the resume extractor shared"
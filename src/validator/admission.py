@@ -0,0 +1,190 @@
+import json
+import threading
+import typing
+from dataclasses import dataclass, field, fields
+from datetime import datetime
+from typing import Any, Dict, List, Tuple
+
+from loguru import logger
+
+from miner.resume_dataclasses import Resume
+
+# The most items of each Resume list field admitted, the rest are dropped.
+DEFAULT_MAX_ITEMS = {
+    "skills": 100,
+    "work_experience": 20,
+    "education": 10,
+    "certifications": 50,
+    "projects": 20,
+}
+
+
+# The shape of a Resume: whether the items of every list field are strings, or objects
+# of string fields like JobExperience and Education. Miners name the fields of these
+# objects differently, so only their values are checked.
+RESUME_SCHEMA = {
+    resume_field.name: typing.get_args(resume_field.type)[0] is str
+    for resume_field in fields(Resume)
+}
+# Projects are declared as strings, but ATS scores projects given as objects with dates.
+OBJECT_ITEM_FIELDS = {"projects"}
+# The fields ATS reads from the items of a list field without checking for them, with
+# the date format a field is parsed with, or None if it is not a date.
+REQUIRED_ITEM_FIELDS = {
+    "education": {"degree": None},
+    "projects": {"start_date": "%Y-%m-%d", "end_date": "%Y-%m-%d"},
+}
+
+
+@dataclass(frozen=True)
+class AdmissionLimits:
+    """
+    The limits miner responses are admitted under before they are scored.
+
+    Attributes:
+        max_bytes (int): The most characters of a JSON response, or of the strings in an object response.
+        max_string_length (int): The most characters of any string, longer strings are truncated.
+        max_items (Dict[str, int]): The most items of each list field, longer lists are truncated.
+        cpu_deadline (float | None): The most CPU seconds spent scoring a single resume.
+    """
+
+    max_bytes: int = 64 * 1024
+    max_string_length: int = 1000
+    max_items: Dict[str, int] = field(default_factory=lambda: dict(DEFAULT_MAX_ITEMS))
+    cpu_deadline: float | None = 10.0
+
+
+class ResumeAdmission:
+    """
+    The admission stage in front of ATS scoring. Miner responses are untrusted, so they
+    are checked against the shape of the Resume dataclass and capped in size before any
+    NLP runs on them.
+
+    JSON responses longer than max_bytes are rejected without being parsed. Responses
+    that are not JSON objects, or whose fields do not have the shape of a Resume, are
+    rejected. Unknown fields, list items beyond the per-field caps, string characters
+    beyond max_string_length and lists or objects nested in the fields of an object item
+    are dropped, and numbers or booleans in those fields are converted to strings.
+    Education items without a degree and projects without a start and end date in the
+    YYYY-MM-DD format are dropped too, as ATS cannot score them.
+    Responses that are admitted unchanged are passed on as they are, so they are scored
+    exactly as before.
+
+    Attributes:
+        limits (AdmissionLimits): The limits responses are admitted under.
+    """
+
+    def __init__(self, limits: AdmissionLimits | None = None):
+        self.limits = limits if limits is not None else AdmissionLimits()
+        self._counts = {"admitted": 0, "truncated": 0, "rejected": 0}
+        self._lock = threading.Lock()
+
+    def _count(self, outcome: str):
+        with self._lock:
+            self._counts[outcome] += 1
+
+    def _string(self, value: Any, budget: List[int]) -> Tuple[str, bool]:
+        if not isinstance(value, str):
+            raise ValueError(f"expected a string, got {type(value).__name__}")
+        truncated = len(value) > self.limits.max_string_length
+        value = value[:self.limits.max_string_length]
+        budget[0] -= len(value) + 1
+        if budget[0] < 0:
+            raise ValueError("response too large")
+        return value, truncated
+
+    def _object(self, value: Any, budget: List[int]) -> Tuple[Dict[str, str], bool]:
+        if not isinstance(value, dict):
+            raise ValueError(f"expected an object, got {type(value).__name__}")
+        admitted, truncated = {}, False
+        for key, item in value.items():
+            budget[0] -= len(key) + 1
+            # Missing values are omitted, as in Resume.to_json, and so are nested values,
+            # which ATS never reads. Numbers and booleans are kept as strings.
+            if item is None or isinstance(item, (list, dict)):
+                truncated = True
+                continue
+            if not isinstance(item, str):
+                item, truncated = str(item), True
+            admitted[key], item_truncated = self._string(item, budget)
+            truncated = truncated or item_truncated
+        return admitted, truncated
+
+    @staticmethod
+    def _complete(name: str, item: Any) -> bool:
+        for key, date_format in REQUIRED_ITEM_FIELDS.get(name, {}).items():
+            if not isinstance(item, dict) or key not in item:
+                return False
+            if date_format is not None:
+                try:
+                    datetime.strptime(item[key], date_format)
+                except ValueError:
+                    return False
+        return True
+
+    def _resume(self, resume: Any, budget: List[int]) -> Tuple[Dict[str, Any], bool]:
+        if not isinstance(resume, dict):
+            raise ValueError(f"expected an object, got {type(resume).__name__}")
+        admitted, truncated = {}, False
+        for name, items in resume.items():
+            if name not in RESUME_SCHEMA:
+                truncated = True
+                continue
+            if not isinstance(items, list):
+                raise ValueError(f"expected a list for {name}, got {type(items).__name__}")
+
+            max_items = self.limits.max_items.get(name, len(items))
+            truncated = truncated or len(items) > max_items
+            string_items = RESUME_SCHEMA[name]
+            admitted[name] = []
+            for item in items[:max_items]:
+                if not string_items or (name in OBJECT_ITEM_FIELDS and isinstance(item, dict)):
+                    item, item_truncated = self._object(item, budget)
+                else:
+                    item, item_truncated = self._string(item, budget)
+                if not self._complete(name, item):
+                    truncated = True
+                    continue
+                admitted[name].append(item)
+                truncated = truncated or item_truncated
+        return admitted, truncated
+
+    def admit(self, response: Any) -> Any:
+        """
+        Admits a miner response for scoring.
+
+        Args:
+            response: The resume returned by the miner, a JSON string or an object.
+
+        Returns:
+            The response if it was admitted unchanged, the truncated response in the same
+            form if it had to be truncated, or None if it was rejected.
+        """
+        if response is None:
+            return None
+
+        try:
+            resume = response
+            if isinstance(response, str):
+                if len(response) > self.limits.max_bytes:
+                    raise ValueError(f"response of {len(response)} characters is too large")
+                resume = json.loads(response)
+            admitted, truncated = self._resume(resume, [self.limits.max_bytes])
+        except (ValueError, RecursionError) as e:
+            logger.info(f"Rejected resume: {e}")
+            self._count("rejected")
+            return None
+
+        if not truncated:
+            self._count("admitted")
+            return response
+
+        self._count("truncated")
+        return json.dumps(admitted) if isinstance(response, str) else admitted
+
+    def get_stats(self) -> Dict[str, int]:
+        """
+        Returns the number of admitted, truncated and rejected responses.
+        """
+        with self._lock:
+            return dict(self._counts)
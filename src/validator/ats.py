@@ -1,20 +1,31 @@
 import json
 import ast
+import re
+import threading
+import time
+from abc import ABC, abstractmethod
 from datetime import datetime
 from collections import defaultdict
-from sklearn.feature_extraction.text import TfidfVectorizer
+from dataclasses import dataclass, field
+from functools import partial
 from sklearn.metrics.pairwise import cosine_similarity
 import nltk
 from sentence_transformers import SentenceTransformer, util
 from resume_extract import ResumeExtractor, sample_resume_data
 import pandas as pd
-from typing import Dict, Any, List
+from typing import Callable, Dict, Any, List, Sequence, Tuple
+import torch
 from torch import Tensor
-from hugging_data import get_degree_level_mappings, get_degree_type_mappings
-from normalize import DataNormalize
 import spacy
 import numpy as np
 from sklearn.neighbors import NearestNeighbors
+from loguru import logger
+from education import EducationIndex
+from embedding_cache import SentenceEmbeddingCache
+from resume_features import ResumeFeatureCache, ResumeFeatures
+from score_cache import ScoreCache
+from similarity import TfidfSimilarity
+from skill_vectors import SkillVectorStore, encode_skills, load_skill_nlp, normalize_skill
 
 
 sample_job_description = {
@@ -32,38 +43,417 @@ sample_job_description = {
 }
 
 
+# Resume-like sentences used to check a backend's embeddings against the torch backend.
+EMBEDDING_REFERENCE_SENTENCES = [
+    "Software Engineer",
+    "Developed data pipelines in Python and SQL for a retail analytics team.",
+    "Led a team of five engineers building a customer-facing web application.",
+    "Bachelor of Science in Computer Science",
+    "Managed AWS infrastructure and automated deployments with Terraform.",
+    "Designed machine learning models to forecast weekly product demand.",
+    "Senior Data Analyst",
+    "Coordinated with stakeholders to gather requirements and define project scope.",
+]
+
+
+class EmbeddingBackend(ABC):
+    """
+    Encodes sentences into embeddings for the semantic coherence score.
+    """
+
+    name = ""
+
+    @abstractmethod
+    def encode(self, sentences: List[str]) -> Tensor:
+        pass
+
+
+class TorchEmbeddingBackend(EmbeddingBackend):
+    """
+    Encodes sentences with the SentenceTransformer model as is.
+    """
+
+    name = "torch"
+
+    def __init__(self, model: SentenceTransformer):
+        self.model = model
+
+    def encode(self, sentences: List[str]) -> Tensor:
+        return self.model.encode(sentences, convert_to_tensor=True)
+
+
+class QuantizedEmbeddingBackend(TorchEmbeddingBackend):
+    """
+    Encodes sentences with a copy of the SentenceTransformer model whose linear layers
+    are dynamically quantized to int8, which is faster on CPUs.
+    """
+
+    name = "int8"
+
+    def __init__(self, model: SentenceTransformer):
+        super().__init__(torch.quantization.quantize_dynamic(model, {torch.nn.Linear}, dtype=torch.qint8))
+
+
+EMBEDDING_BACKENDS = {backend.name: backend for backend in [TorchEmbeddingBackend, QuantizedEmbeddingBackend]}
+
+
+def benchmark_embedding_backend(backend: EmbeddingBackend, sentences: List[str], repeats: int = 3) -> Dict[str, float]:
+    """
+    Returns the best latency of encoding the sentences over the repeats, and the
+    resulting throughput in sentences per second.
+    """
+    backend.encode(sentences)
+    latencies = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        backend.encode(sentences)
+        latencies.append(time.perf_counter() - start)
+    latency = min(latencies)
+    return {
+        "latency": latency,
+        "sentences_per_second": len(sentences) / latency if latency else float("inf"),
+    }
+
+
+def compare_embedding_backends(
+    reference: EmbeddingBackend,
+    candidate: EmbeddingBackend,
+    sentences: List[str] = EMBEDDING_REFERENCE_SENTENCES,
+    repeats: int = 3
+) -> Dict[str, Any]:
+    """
+    Compares a candidate backend with a reference backend on a set of sentences: the
+    cosine drift of each candidate embedding from the reference embedding, and the
+    latency and throughput of both backends.
+
+    Returns:
+        The mean and max cosine drift and the benchmark of each backend by name.
+    """
+    drift = 1 - torch.nn.functional.cosine_similarity(
+        reference.encode(sentences).cpu(), candidate.encode(sentences).cpu(), dim=1)
+    return {
+        "mean_cosine_drift": drift.mean().item(),
+        "max_cosine_drift": drift.max().item(),
+        reference.name: benchmark_embedding_backend(reference, sentences, repeats),
+        candidate.name: benchmark_embedding_backend(candidate, sentences, repeats),
+    }
+
+
+class ScoringDeadlineExceeded(Exception):
+    """
+    Raised when scoring a resume takes more CPU time than its deadline.
+    """
+
+
+class CpuDeadline:
+    """
+    A deadline on the CPU time of the current thread, checked between scoring steps so
+    a resume that is expensive to score is abandoned rather than stalling the step.
+
+    Attributes:
+        seconds (float | None): The CPU seconds allowed, or None for no deadline.
+    """
+
+    def __init__(self, seconds: float | None):
+        self.seconds = seconds
+        self._start = time.thread_time()
+
+    def check(self):
+        """
+        Raises ScoringDeadlineExceeded if the deadline has passed.
+        """
+        if self.seconds is not None and time.thread_time() - self._start > self.seconds:
+            raise ScoringDeadlineExceeded(f"Scoring took more than {self.seconds} CPU seconds")
+
+
+# Common alternative names of skills, by normalized name. A resume skill is matched to
+# a JD skill with the same normalized name or alias before any skill vectors are compared.
+SKILL_ALIASES = {
+    "js": "javascript",
+    "ts": "typescript",
+    "golang": "go",
+    "k8s": "kubernetes",
+    "postgres": "postgresql",
+    "ml": "machine learning",
+    "ai": "artificial intelligence",
+    "nlp": "natural language processing",
+    "aws": "amazon web services",
+    "gcp": "google cloud platform",
+    "reactjs": "react",
+    "react.js": "react",
+    "nodejs": "node.js",
+    "cpp": "c++",
+}
+
+
+def get_skill_name(skill: str) -> str:
+    """
+    Returns the name a skill is matched by before comparing skill vectors: the
+    normalized skill, resolved through SKILL_ALIASES.
+    """
+    skill = normalize_skill(skill)
+    return SKILL_ALIASES.get(skill, skill)
+
+
+# The components scored after similarity, which only count towards the total score
+# when the similarity score is not 1.
+EXPENSIVE_COMPONENTS = ["education", "skills", "projects", "semantics"]
+
+
+class ComponentStats:
+    """
+    Counts how often each scoring component was evaluated and how often it was skipped
+    because it could no longer change the ATS score.
+
+    Attributes:
+        evaluated (Dict[str, int]): The number of evaluations of each component.
+        skipped (Dict[str, int]): The number of avoided evaluations of each component.
+    """
+
+    def __init__(self):
+        self.evaluated = defaultdict(int)
+        self.skipped = defaultdict(int)
+        self._lock = threading.Lock()
+
+    def record(self, evaluated: Sequence[str] = (), skipped: Sequence[str] = (), count: int = 1):
+        """
+        Records count evaluations of the evaluated components and count avoided
+        evaluations of the skipped components.
+        """
+        with self._lock:
+            for component in evaluated:
+                self.evaluated[component] += count
+            for component in skipped:
+                self.skipped[component] += count
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Returns the evaluations and avoided evaluations of each component, and the total
+        number of avoided evaluations.
+        """
+        with self._lock:
+            return {
+                "evaluated": dict(self.evaluated),
+                "skipped": dict(self.skipped),
+                "avoided": sum(self.skipped.values()),
+            }
+
+
+class ATSModels:
+    """
+    Holds the models used by ATS scoring. Loading these is expensive, so a single
+    instance should be created once per process and shared by every ATS scoring
+    context built for a job description.
+
+    Attributes:
+        model (SentenceTransformer): The sentence embedding model.
+        embedding_backend (EmbeddingBackend): The backend encoding sentences with the model.
+        nlp (spacy.Language): The spaCy pipeline used for skill vectors, loaded without
+            any components since only its vectors table is used.
+        skill_vectors (SkillVectorStore | None): The persistent skill vector store, if a
+            directory was given.
+        embedding_cache (SentenceEmbeddingCache): The cache of sentence embeddings.
+        education_index (EducationIndex): The index resolving degrees to education levels.
+        component_stats (ComponentStats): The evaluated and skipped scoring components.
+        resume_features (ResumeFeatureCache): The job description independent features of recent resumes.
+        resume_extractor (ResumeExtractor): The stateless resume extractor, over the process-wide reference data.
+    """
+
+    def __init__(self, skill_vector_dir: str | None = None, embedding_backend: str = "torch"):
+        self.model = SentenceTransformer('paraphrase-MiniLM-L6-v2')
+        self.embedding_backend = EMBEDDING_BACKENDS[embedding_backend](self.model)
+        self.nlp = load_skill_nlp()
+        self.embedding_cache = SentenceEmbeddingCache()
+        self.education_index = EducationIndex()
+        self.component_stats = ComponentStats()
+        self.resume_features = ResumeFeatureCache()
+        self.resume_extractor = ResumeExtractor()
+        self.skill_vectors = None
+        if skill_vector_dir is not None:
+            self.skill_vectors = SkillVectorStore(
+                dir_path=skill_vector_dir,
+                encode=self.encode_skills,
+                dim=self.nlp.vocab.vectors_length
+            )
+
+    def encode_skills(self, skills: List[str]) -> np.ndarray:
+        return encode_skills(self.nlp, skills)
+
+    def report_embedding_backend(self):
+        """
+        Logs the drift and speed of the embedding backend compared to the torch backend,
+        unless it is the torch backend. This runs inference, so it should only be called
+        once any scoring workers have been forked.
+        """
+        if self.embedding_backend.name == TorchEmbeddingBackend.name:
+            return
+        report = compare_embedding_backends(TorchEmbeddingBackend(self.model), self.embedding_backend)
+        logger.info(f"Embedding backend {self.embedding_backend.name} compared to torch: {report}")
+
+
+@dataclass(frozen=True)
+class ScoringPlan:
+    """
+    Everything ATS scoring needs from a job description, compiled once per job
+    description by ATS.compile_plan and shared read-only by every resume scored
+    against it, so each resume score only does resume-dependent work.
+
+    Attributes:
+        skills (Tuple[str, ...]): The JD skills, the NER skills followed by the TF-IDF keywords.
+        universal_weights (Tuple[float, ...]): The normalized weights of the universal skills.
+        preferred_weights (Tuple[float, ...]): The normalized weights of the preferred skills.
+        weighted_skills (Tuple[str, ...]): The universal skills followed by the preferred skills.
+        weighted_skill_vectors (np.ndarray): The read-only skill vector of every weighted skill.
+        weighted_skill_names (Tuple[str, ...]): The name every weighted skill is matched by, see get_skill_name.
+        job_levels (Tuple[int, ...]): The education levels of the JD as indices into EDUCATION_LEVELS.
+        similarity_model (TfidfSimilarity): The TF-IDF similarity fitted on the JD skills.
+    """
+
+    skills: Tuple[str, ...]
+    universal_weights: Tuple[float, ...]
+    preferred_weights: Tuple[float, ...]
+    weighted_skills: Tuple[str, ...]
+    weighted_skill_vectors: np.ndarray
+    weighted_skill_names: Tuple[str, ...]
+    job_levels: Tuple[int, ...]
+    similarity_model: TfidfSimilarity
+
+
+ATS_SCORE_COLUMNS = [
+    "total_score", "education_score", "skills_score", "projects_score", "semantics_score", "similarity_score", "result"
+]
+
+ISO_DATE = re.compile(r"[1-9]\d{3}-\d{2}-\d{2}")
+
+
+def parse_dates(dates: List[str]) -> np.ndarray:
+    """
+    Parses "%Y-%m-%d" dates into a datetime64[D] array. Dates that are all zero-padded
+    ISO dates are parsed by NumPy in one call, anything else through datetime.strptime,
+    so the same dates are accepted and rejected as by ATS.calculate_years.
+    """
+    if all(isinstance(date, str) and ISO_DATE.fullmatch(date) for date in dates):
+        return np.array(dates, dtype="datetime64[D]")
+    return np.array([datetime.strptime(date, "%Y-%m-%d") for date in dates], dtype="datetime64[D]")
+
+
+@dataclass
+class ResumeBatch:
+    """
+    The resumes of a step in a columnar representation. Every flattened column has a
+    parallel array of the index of the resume each row belongs to.
+
+    Attributes:
+        size (int): The number of resumes.
+        empty (np.ndarray): Whether each resume is empty.
+        has_education (np.ndarray): Whether each resume is scored on education.
+        has_skills (np.ndarray): Whether each resume is scored on skills.
+        has_projects (np.ndarray): Whether each resume is scored on projects.
+        has_text (np.ndarray): Whether each resume is scored on semantics and similarity.
+        education (List[Dict[str, Any]]): The education rows of the resumes scored on education.
+        education_resume (np.ndarray): The resume of every education row.
+        skills (List[str]): The skills of the resumes scored on skills, flattened.
+        skill_offsets (np.ndarray): The start of every resume's skills, followed by len(skills).
+        project_start (np.ndarray): The datetime64 start date of every project.
+        project_end (np.ndarray): The datetime64 end date of every project.
+        project_resume (np.ndarray): The resume of every project.
+        texts (List[str]): The job title text of every resume scored on semantics and similarity.
+    """
+
+    size: int
+    empty: np.ndarray
+    has_education: np.ndarray
+    has_skills: np.ndarray
+    has_projects: np.ndarray
+    has_text: np.ndarray
+    education: List[Dict[str, Any]] = field(default_factory=list)
+    education_resume: np.ndarray = field(default_factory=lambda: np.zeros(0, dtype=int))
+    skills: List[str] = field(default_factory=list)
+    skill_offsets: np.ndarray = field(default_factory=lambda: np.zeros(1, dtype=int))
+    project_start: np.ndarray = field(default_factory=lambda: np.zeros(0, dtype="datetime64[D]"))
+    project_end: np.ndarray = field(default_factory=lambda: np.zeros(0, dtype="datetime64[D]"))
+    project_resume: np.ndarray = field(default_factory=lambda: np.zeros(0, dtype=int))
+    texts: List[str] = field(default_factory=list)
+
+
 class ATS:
+    """
+    A lightweight scoring context for a single job description. The heavy models
+    are borrowed from an ATSModels instance, which is only created here if one is
+    not passed in.
+    """
+
     def __init__(
         self,
         skills_df: pd.DataFrame,
         universal_skills_weights: Dict[str, Any],
-        preferred_skills_weights: Dict[str, Any]
+        preferred_skills_weights: Dict[str, Any],
+        models: ATSModels | None = None
     ):
+        if models is None:
+            models = ATSModels()
         self.resume_data = None
-        self.resume_extractor = None
+        self.resume_extractor = models.resume_extractor
         self.skills_df = skills_df
         self.universal_skills_weights = universal_skills_weights
         self.preferred_skills_weights = preferred_skills_weights
-        self.model = SentenceTransformer('paraphrase-MiniLM-L6-v2')
-        self.vectorizer = TfidfVectorizer()
-        self.nlp = spacy.load("en_core_web_md")
+        self.models = models
+        self.model = models.model
+        self.nlp = models.nlp
+        self.plan = None
+        self._plan_job_description = None
+
+    def compile_plan(self, job_description: Dict[str, Any]) -> ScoringPlan:
+        """
+        Compiles the scoring plan of a processed job description with this context's
+        skill weights.
+        """
+        job_description = self.reformat_job_description(job_description)
+        skills = tuple(job_description['skills'])
+
+        universal_weights = tuple(self.normalize(list(self.universal_skills_weights.values())))
+        preferred_weights = tuple(self.normalize(list(self.preferred_skills_weights.values())))
+        weighted_skills = tuple(self.universal_skills_weights.keys()) + tuple(self.preferred_skills_weights.keys())
+        vectors = self.get_skill_vectors(list(weighted_skills))
+        weighted_skill_vectors = np.array([vectors[skill] for skill in weighted_skills], dtype=np.float32)
+        weighted_skill_vectors.setflags(write=False)
+
+        return ScoringPlan(
+            skills=skills,
+            universal_weights=universal_weights,
+            preferred_weights=preferred_weights,
+            weighted_skills=weighted_skills,
+            weighted_skill_vectors=weighted_skill_vectors,
+            weighted_skill_names=tuple(get_skill_name(skill) for skill in weighted_skills),
+            job_levels=tuple(self.models.education_index.get_job_levels(job_description['education'])),
+            similarity_model=TfidfSimilarity(' '.join(skills))
+        )
+
+    def get_plan(self, job_description: Dict[str, Any]) -> ScoringPlan:
+        """
+        Returns the scoring plan of the job description, compiling it only if it was not
+        the last job description this context scored.
+        """
+        if self.plan is None or self._plan_job_description is not job_description:
+            self.plan = self.compile_plan(job_description)
+            self._plan_job_description = job_description
+        return self.plan
 
     def store_resume(self, resume_data: Dict[str, Any]):
         self.resume_data = resume_data
-        self.resume_extractor = ResumeExtractor(resume_data=self.resume_data)
 
-    def score_education(self, job_education: List[str], resume_education: List[Dict[str, Any]]) -> float:
-        dl_mappings = get_degree_level_mappings()
+    def get_degree_levels(self, resume_education: List[Dict[str, Any]]) -> Tuple[int, ...]:
+        return tuple(self.models.education_index.get_degree_level(edu['degree']) for edu in resume_education)
+
+    def score_education(self, job_levels: Sequence[int], resume_education: List[Dict[str, Any]]) -> float:
+        return self.score_degree_levels(job_levels, self.get_degree_levels(resume_education))
+
+    def score_degree_levels(self, job_levels: Sequence[int], degree_levels: Sequence[int]) -> float:
         highest_job_index = 0
         relevant_score = 0
-        education_levels = ["High School", "Associate", "Bachelor", "Master", "Doctorate"]
-        dn = DataNormalize()
-        for job_edu in [dl_mappings[j] for j in job_education]:
+        for job_index in job_levels:
             score = 0
-            job_index = education_levels.index(job_edu)
-            for edu in resume_education:
-                degree_type = dl_mappings[dn.get_normalized_degree_type(edu['degree'])]
-                edu_index = education_levels.index(degree_type)
+            for edu_index in degree_levels:
                 if edu_index == job_index:
                     score += 1
                 elif edu_index == job_index + 1:
@@ -99,17 +489,17 @@ class ATS:
 
         return score
 
-    def score_skills(self, jd_skills: List[str], resume_skills: List[str]) -> float:
-        universal_skills_weights = self.universal_skills_weights
-        preferred_skills_weights = self.preferred_skills_weights
-        universal_skills = defaultdict(int)
-        universal_skills = self.resume_extractor.process_skills(jd_skills, universal_skills)
-
-        max_jd_score = sum(universal_skills.values())
+    def score_skills(
+        self,
+        plan: ScoringPlan,
+        resume_skills: List[str],
+        skill_vectors: Callable[[], np.ndarray] | None = None
+    ) -> float:
+        max_jd_score = len(plan.skills)
 
         resume_skill_counts = defaultdict(int)
         resume_skill_counts = self.resume_extractor.process_skills(resume_skills, resume_skill_counts)
-        print(f"Resume Skill Counts: {resume_skill_counts}")
+        logger.debug(f"Resume Skill Counts: {resume_skill_counts}")
         resume_score = sum(resume_skill_counts.values())
 
         if max_jd_score > 0:
@@ -118,57 +508,95 @@ class ATS:
         else:
             skill_score = 0
 
-        additional_score = self.calculate_skill_additional_score(universal_skills_weights, preferred_skills_weights,
-                                                                 resume_skill_counts)
+        additional_score = self.calculate_skill_additional_score(plan, resume_skill_counts, skill_vectors=skill_vectors)
 
-        print(f"Additional Score: {additional_score}")
+        logger.debug(f"Additional Score: {additional_score}")
         total_skills_score = skill_score + additional_score
-        print(f"Total Skills Score: {total_skills_score}")
+        logger.debug(f"Total Skills Score: {total_skills_score}")
 
         return total_skills_score
 
-    def get_skill_vector(self, skill):
-        return self.nlp(skill).vector
+    def get_skill_vectors(self, skills: List[str]) -> Dict[str, np.ndarray]:
+        if self.models.skill_vectors is not None:
+            return self.models.skill_vectors.get_vectors(skills)
+        skills = list(dict.fromkeys(skills))
+        return dict(zip(skills, self.models.encode_skills(skills)))
 
-    def get_skill_knn_score(self, skill, resume_skill_counts, threshold=0.9):
-        skill_vector = self.get_skill_vector(skill).reshape(1, -1)
-        existing_skill_vectors = np.array([self.get_skill_vector(ex_skill) for ex_skill in resume_skill_counts.keys()])
+    def get_resume_skill_vectors(self, resume_skills: List[str]) -> np.ndarray:
+        """
+        Returns the skill vector of every resume skill as the rows of a matrix.
+        """
+        vectors = self.get_skill_vectors(resume_skills)
+        return np.array([vectors[skill] for skill in resume_skills])
 
-        if not existing_skill_vectors.any():
-            return None, 0.0
+    @staticmethod
+    def match_skill_names(jd_names: Sequence[str], resume_skills: List[str]) -> List[str | None]:
+        """
+        Matches every JD skill name to the first resume skill with the same name, see
+        get_skill_name, returning None for JD skills without one.
+        """
+        names = {}
+        for skill in resume_skills:
+            names.setdefault(get_skill_name(skill), skill)
+        return [names.get(name) for name in jd_names]
+
+    def match_skills(
+        self,
+        jd_names: Sequence[str],
+        jd_vectors: np.ndarray,
+        resume_skills: List[str],
+        threshold=0.9,
+        resume_vectors: Callable[[], np.ndarray] | None = None
+    ) -> List[str | None]:
+        """
+        Finds the matching resume skill for every JD skill, returning None for JD skills
+        without one. A resume skill with the same name or alias is matched first. The
+        JD skills left are matched to their most similar resume skill in a single
+        similarity matrix if it reaches the threshold, which is the only time the resume
+        skill vectors are looked up, from resume_vectors if it is given.
+        """
+        matches = self.match_skill_names(jd_names, resume_skills)
+        unmatched = [i for i, match in enumerate(matches) if match is None]
+        if not unmatched or not resume_skills:
+            return matches
 
-        similarities = cosine_similarity(skill_vector, existing_skill_vectors)
-        max_similarity = float(str(similarities.max()))
+        vectors = resume_vectors() if resume_vectors is not None else self.get_resume_skill_vectors(resume_skills)
+        if not vectors.any():
+            return matches
 
-        if max_similarity >= threshold:
-            most_similar_skill = list(resume_skill_counts.keys())[similarities.argmax()]
-            return most_similar_skill, max_similarity
-        else:
-            return None, 0.0
+        similarities = cosine_similarity(jd_vectors[unmatched], vectors)
+        for i, best_match, best_similarity in zip(unmatched, similarities.argmax(axis=1), similarities.max(axis=1)):
+            if best_similarity >= threshold:
+                matches[i] = resume_skills[best_match]
+        return matches
 
-    def calculate_skill_additional_score(self, universal_skills_weights, preferred_skills_weights, resume_skill_counts, threshold=0.9):
-        u_skill_weight_vals = self.normalize([u for u in universal_skills_weights.values()])
-        universal_skills_weights = {k: v for k, v in zip(universal_skills_weights.keys(), u_skill_weight_vals)}
-        p_skill_weight_vals = self.normalize([p for p in preferred_skills_weights.values()])
-        preferred_skills_weights = {k: v for k, v in zip(preferred_skills_weights.keys(), p_skill_weight_vals)}
+    def calculate_skill_additional_score(self, plan: ScoringPlan, resume_skill_counts, threshold=0.9, skill_vectors=None):
         additional_score = 0
 
-        for skill, weight in universal_skills_weights.items():
-            most_similar_skill, score = self.get_skill_knn_score(skill, resume_skill_counts, threshold)
-            if score >= threshold:
+        matches = self.match_skills(
+            plan.weighted_skill_names, plan.weighted_skill_vectors, list(resume_skill_counts.keys()), threshold, skill_vectors)
+        universal_matches = matches[:len(plan.universal_weights)]
+        preferred_matches = matches[len(plan.universal_weights):]
+
+        for weight, most_similar_skill in zip(plan.universal_weights, universal_matches):
+            if most_similar_skill is not None:
                 additional_score += resume_skill_counts[most_similar_skill] * weight
 
-        for skill, weight in preferred_skills_weights.items():
-            most_similar_skill, score = self.get_skill_knn_score(skill, resume_skill_counts, threshold)
-            if score >= threshold:
+        for weight, most_similar_skill in zip(plan.preferred_weights, preferred_matches):
+            if most_similar_skill is not None:
                 additional_score += resume_skill_counts[most_similar_skill] * weight * 0.5
 
         return additional_score
 
+    def get_project_durations(self, projects: List[Dict[str, Any]]) -> Tuple[float, ...]:
+        return tuple(self.calculate_years(project["start_date"], project["end_date"]) for project in projects)
+
     def score_projects(self, projects: List[Dict[str, Any]]) -> float:
+        return self.score_project_durations(self.get_project_durations(projects))
+
+    def score_project_durations(self, project_durations: Sequence[float]) -> float:
         score = 0
-        for project in projects:
-            project_duration = self.calculate_years(project["start_date"], project["end_date"])
+        for project_duration in project_durations:
             score += project_duration * 0.3
         return score
 
@@ -185,25 +613,46 @@ class ATS:
         end = datetime.strptime(end_date, "%Y-%m-%d")
         return (end - start).days / 365.25
 
-    def get_sentence_embeddings(self, text: str) -> Tensor:
-        return self.model.encode(text, convert_to_tensor=True)
+    def get_sentence_embeddings(self, text: str | List[str]) -> Tensor:
+        if isinstance(text, str):
+            return self.models.embedding_cache.encode(self.models.embedding_backend.encode, [text])[0]
+        return self.models.embedding_cache.encode(self.models.embedding_backend.encode, text)
 
     def check_semantic_sense(self, text: str) -> float:
-        sentences = nltk.sent_tokenize(text)
-        embeddings = self.get_sentence_embeddings(sentences)
+        return float(self.check_semantic_sense_batch([text])[0])
+
+    def check_semantic_sense_batch(self, texts: List[str]) -> np.ndarray:
+        """
+        Returns the coherence of every text: the average cosine similarity of its adjacent
+        sentences, or 0 for texts with fewer than two sentences. The sentences of all
+        texts are encoded in a single call, which sorts them by length to keep padding
+        low, and the similarities of all adjacent pairs are computed at once.
+        """
+        sentences = [nltk.sent_tokenize(text) for text in texts]
+        counts = np.array([len(text_sentences) for text_sentences in sentences], dtype=int)
+        coherence = np.zeros(len(texts))
 
-        if len(embeddings) <= 1:
-            return 0.0
+        has_pairs = counts > 1
+        if not has_pairs.any():
+            return coherence
 
-        coherence_score = 0
-        for i in range(1, len(embeddings)):
-            coherence_score += util.pytorch_cos_sim(embeddings[i], embeddings[i-1]).item()
+        embeddings = self.get_sentence_embeddings([sentence for text_sentences in sentences for sentence in text_sentences])
+        embeddings = torch.nn.functional.normalize(embeddings, p=2, dim=1)
+        # adjacent[k] is the similarity of sentences k and k + 1 of the flattened batch;
+        # the pairs spanning two texts fall outside every text's range and are ignored.
+        adjacent = (embeddings[1:] * embeddings[:-1]).sum(dim=1).cpu().numpy().astype(np.float64)
+        cumulative = np.concatenate([[0.0], np.cumsum(adjacent)])
 
-        average_coherence = coherence_score / (len(embeddings) - 1)
-        return average_coherence
+        ends = np.cumsum(counts)
+        starts = ends - counts
+        pair_sums = cumulative[ends[has_pairs] - 1] - cumulative[starts[has_pairs]]
+        coherence[has_pairs] = pair_sums / (counts[has_pairs] - 1)
+        return coherence
 
     def score_semantics(self, resume_text: str) -> int:
-        semantic_score = self.check_semantic_sense(resume_text)
+        return self.score_coherence(self.check_semantic_sense(resume_text))
+
+    def score_coherence(self, semantic_score: float) -> int:
         if semantic_score < 0.5:
             return semantic_score
         elif 0.5 <= semantic_score < 0.75:
@@ -211,25 +660,20 @@ class ATS:
         else:
             return 2
 
-    def check_similarity(self, resume_text: str, job_description_text: str, threshold: float = 0.7) -> bool:
-        self.vectorizer.fit([job_description_text, resume_text])
-        jd_vector = self.vectorizer.transform([job_description_text])
-        resume_vector = self.vectorizer.transform([resume_text])
-
-        similarity = cosine_similarity(jd_vector, resume_vector)[0][0]
+    def check_similarity(self, resume_text: str, similarity_model: TfidfSimilarity, threshold: float = 0.7) -> bool:
+        return bool(self.check_similarity_batch([resume_text], similarity_model, threshold)[0])
 
-        if similarity >= threshold:
-            return True
-        return False
+    def check_similarity_batch(self, resume_texts: List[str], similarity_model: TfidfSimilarity, threshold: float = 0.7) -> np.ndarray:
+        return similarity_model.similarities(resume_texts) >= threshold
 
-    def score_similarity(self, resume_text: str, job_description_text: str) -> int:
-        return 1 if self.check_similarity(resume_text, job_description_text) else 0
+    def score_similarity(self, resume_text: str, similarity_model: TfidfSimilarity) -> int:
+        return 1 if self.check_similarity(resume_text, similarity_model) else 0
 
     def reformat_job_description(self, job_description: Dict[str, Any]) -> Dict[str, Any]:
         reformatted_job_description = {}
         for k, v in job_description['ner_keywords'].items():
             reformatted_job_description[k] = v
-        reformatted_job_description['skills'] += job_description['tfidf_keywords']
+        reformatted_job_description['skills'] = reformatted_job_description['skills'] + job_description['tfidf_keywords']
         return reformatted_job_description
 
     @staticmethod
@@ -252,7 +696,243 @@ class ATS:
             print(f"JSON error: {e}")
             return {}  # or handle the error accordingly
 
-    def calculate_ats_score(self, job_description: Dict[str, Any], uid: str) -> Dict[str, Any]:
+    def get_resume_features(self, resume_data: Any) -> ResumeFeatures:
+        return self.models.resume_features.get(ScoreCache.fingerprint_resume(resume_data))
+
+    def parse_resumes(self, resumes: List[Any]) -> ResumeBatch:
+        """
+        Parses the resumes of a step into a ResumeBatch. Which components a resume is
+        scored on is decided exactly as in calculate_ats_score.
+        """
+        size = len(resumes)
+        flags = {name: np.zeros(size, dtype=bool) for name in
+                 ["empty", "has_education", "has_skills", "has_projects", "has_text"]}
+        education, education_resume = [], []
+        skills, skill_offsets = [], [0]
+        project_start, project_end, project_resume = [], [], []
+        texts = []
+
+        for i, resume_data in enumerate(resumes):
+            if not resume_data:
+                flags["empty"][i] = True
+                skill_offsets.append(len(skills))
+                continue
+
+            resume_data_literal = self.safe_json_loads(resume_data)
+
+            if 'education' in resume_data:
+                flags["has_education"][i] = True
+                resume_education = list(resume_data_literal['education'])
+                education += resume_education
+                education_resume += [i] * len(resume_education)
+
+            if 'skills' in resume_data:
+                flags["has_skills"][i] = True
+                skills += list(resume_data_literal["skills"])
+            skill_offsets.append(len(skills))
+
+            if 'projects' in resume_data:
+                flags["has_projects"][i] = True
+                for project in resume_data_literal["projects"]:
+                    project_start.append(project["start_date"])
+                    project_end.append(project["end_date"])
+                    project_resume.append(i)
+
+            if 'work_experience' in resume_data_literal and 'skills' in resume_data_literal:
+                flags["has_text"][i] = True
+                texts.append(' '.join([work["title"] for work in resume_data_literal["work_experience"] if "title" in work]))
+
+        return ResumeBatch(
+            size=size,
+            **flags,
+            education=education,
+            education_resume=np.array(education_resume, dtype=int),
+            skills=skills,
+            skill_offsets=np.array(skill_offsets, dtype=int),
+            project_start=parse_dates(project_start),
+            project_end=parse_dates(project_end),
+            project_resume=np.array(project_resume, dtype=int),
+            texts=texts
+        )
+
+    def score_education_batch(self, plan: ScoringPlan, batch: ResumeBatch, scored: np.ndarray) -> np.ndarray:
+        """
+        Returns the education score of every scored resume, and 0 for the others. Only
+        the first of the highest JD education levels is relevant, as in score_education.
+        """
+        if not plan.job_levels or max(plan.job_levels) == 0:
+            return np.zeros(batch.size)
+
+        relevant_level = max(plan.job_levels)
+        education_index = self.models.education_index
+        rows = np.flatnonzero(scored[batch.education_resume])
+        levels = np.array([education_index.get_degree_level(batch.education[row]['degree']) for row in rows], dtype=int)
+        difference = levels - relevant_level
+        points = np.select([difference == 0, difference == 1, (difference == -1) | (difference == 2)], [1, 1.25, 0.25], 0)
+        return np.bincount(batch.education_resume[rows], weights=points, minlength=batch.size)
+
+    def score_projects_batch(self, batch: ResumeBatch, scored: np.ndarray) -> np.ndarray:
+        """
+        Returns the project score of every scored resume, 0.3 per year of every project,
+        and 0 for the others.
+        """
+        rows = scored[batch.project_resume]
+        years = (batch.project_end[rows] - batch.project_start[rows]).astype(np.int64) / 365.25
+        return np.bincount(batch.project_resume[rows], weights=years * 0.3, minlength=batch.size)
+
+    def score_skills_batch(self, plan: ScoringPlan, batch: ResumeBatch, scored: np.ndarray, threshold=0.9) -> np.ndarray:
+        """
+        Returns the skills score of every scored resume, and 0 for the others. JD skills
+        are matched by name first, as in match_skills. The distinct skills of the resumes
+        with JD skills left are embedded together and compared to the JD skills in one
+        similarity matrix, from which every resume's best matches are read off its own
+        skill columns.
+        """
+        resume_skill_counts, matches = {}, {}
+        for i in np.flatnonzero(batch.has_skills & scored):
+            resume_skill_counts[i] = defaultdict(int)
+            for skill in batch.skills[batch.skill_offsets[i]:batch.skill_offsets[i + 1]]:
+                resume_skill_counts[i][skill] += 1
+            matches[i] = self.match_skill_names(plan.weighted_skill_names, list(resume_skill_counts[i]))
+
+        distinct_skills = list(dict.fromkeys(
+            skill for i, resume_matches in matches.items() if None in resume_matches
+            for skill in resume_skill_counts[i]
+        ))
+        columns = {skill: i for i, skill in enumerate(distinct_skills)}
+        if distinct_skills:
+            vectors = self.get_skill_vectors(distinct_skills)
+            skill_vectors = np.array([vectors[skill] for skill in distinct_skills])
+            similarities = cosine_similarity(plan.weighted_skill_vectors, skill_vectors)
+
+        max_jd_score = len(plan.skills)
+        universal_count = len(plan.universal_weights)
+
+        scores = np.zeros(batch.size)
+        for i, counts in resume_skill_counts.items():
+            resume_score = sum(counts.values())
+            skill_score = resume_score / max_jd_score * resume_score if max_jd_score > 0 else 0
+
+            resume_matches = matches[i]
+            unmatched = [j for j, match in enumerate(resume_matches) if match is None]
+            resume_skills = list(counts)
+            resume_columns = [columns[skill] for skill in resume_skills] if unmatched else []
+            if resume_columns and skill_vectors[resume_columns].any():
+                resume_similarities = similarities[np.ix_(unmatched, resume_columns)]
+                for j, best_match, best_similarity in zip(
+                        unmatched, resume_similarities.argmax(axis=1), resume_similarities.max(axis=1)):
+                    if best_similarity >= threshold:
+                        resume_matches[j] = resume_skills[best_match]
+
+            # Summed in the order of calculate_skill_additional_score.
+            additional_score = 0
+            for j, match in enumerate(resume_matches):
+                if match is None:
+                    continue
+                if j < universal_count:
+                    additional_score += counts[match] * plan.universal_weights[j]
+                else:
+                    additional_score += counts[match] * plan.preferred_weights[j - universal_count] * 0.5
+
+            scores[i] = skill_score + additional_score
+        return scores
+
+    def calculate_ats_scores(
+        self,
+        plan: ScoringPlan,
+        resumes: List[Any],
+        cpu_deadline: float | None = None
+    ) -> pd.DataFrame:
+        """
+        Scores a batch of resumes at once, with a row per resume holding the same values
+        calculate_ats_score returns for it. As there, the expensive components are only
+        evaluated for resumes whose similarity score is not 1, and are None for the
+        others.
+
+        Args:
+            plan: The scoring plan of the job description.
+            resumes: The resume data returned by each miner.
+            cpu_deadline: The CPU seconds allowed for scoring the whole batch, or None for
+                no deadline. ScoringDeadlineExceeded is raised once it has passed, checked
+                after each component.
+
+        Returns:
+            A DataFrame with a row per resume and the columns in ATS_SCORE_COLUMNS.
+        """
+        deadline = CpuDeadline(cpu_deadline)
+        batch = self.parse_resumes(resumes)
+
+        similarity_scores = np.ones(batch.size)
+        if batch.texts:
+            similarity_scores[batch.has_text] = self.check_similarity_batch(batch.texts, plan.similarity_model)
+        scored = similarity_scores != 1
+        self.models.component_stats.record(evaluated=EXPENSIVE_COMPONENTS, count=int(scored.sum()))
+        self.models.component_stats.record(skipped=EXPENSIVE_COMPONENTS, count=int((~scored & ~batch.empty).sum()))
+
+        deadline.check()
+        education_scores = np.where(batch.has_education, self.score_education_batch(plan, batch, scored), 1.0)
+        deadline.check()
+        skills_scores = np.where(batch.has_skills, self.score_skills_batch(plan, batch, scored), 1.0)
+        deadline.check()
+        projects_scores = np.where(batch.has_projects, self.score_projects_batch(batch, scored), 0.3)
+        deadline.check()
+
+        # Only the coherence of resumes not in the resume feature cache is computed.
+        semantics_scores = np.ones(batch.size)
+        texts = dict(zip(np.flatnonzero(batch.has_text), batch.texts))
+        features = {i: self.get_resume_features(resumes[i]) for i in texts if scored[i]}
+        missing = [i for i, resume_features in features.items() if "coherence" not in resume_features]
+        if missing:
+            coherence = self.check_semantic_sense_batch([texts[i] for i in missing])
+            for i, value in zip(missing, coherence):
+                features[i].set("coherence", float(value))
+        for i, resume_features in features.items():
+            semantics_scores[i] = self.score_coherence(
+                resume_features.get("coherence", lambda: self.check_semantic_sense(texts[i])))
+
+        for scores in [education_scores, skills_scores, projects_scores, semantics_scores]:
+            scores[~scored] = np.nan
+            scores[batch.empty] = 0
+
+        total_scores = education_scores + skills_scores + projects_scores + semantics_scores + similarity_scores
+        total_scores[~scored] = 0
+
+        passed = (scored & (education_scores >= 1) & (skills_scores >= 1) & (projects_scores >= 0.3) &
+                  (semantics_scores >= 1) & (similarity_scores >= 1) & (total_scores >= 5.5))
+
+        def component(scores: np.ndarray) -> pd.Series:
+            # Skipped components are None, as in calculate_ats_score.
+            column = pd.Series(scores, dtype=object)
+            column[~scored & ~batch.empty] = None
+            return column
+
+        return pd.DataFrame({
+            "total_score": total_scores,
+            "education_score": component(education_scores),
+            "skills_score": component(skills_scores),
+            "projects_score": component(projects_scores),
+            "semantics_score": component(semantics_scores),
+            "similarity_score": similarity_scores,
+            "result": np.where(passed, "Yay, you're in!", "Sorry, you're out."),
+        }, columns=ATS_SCORE_COLUMNS)
+
+    def calculate_ats_score(
+        self,
+        job_description: Dict[str, Any] | ScoringPlan,
+        uid: str,
+        cpu_deadline: float | None = None
+    ) -> Dict[str, Any]:
+        """
+        Scores the stored resume of a miner. A similarity score of 1 sets the total score
+        to 0, so the cheap empty check and TF-IDF similarity run first, and the expensive
+        components are only evaluated when they can still change the score. Skipped
+        components are reported as None. The job description independent parts of the
+        components are kept in the resume feature cache.
+
+        With a cpu_deadline, ScoringDeadlineExceeded is raised once scoring has taken
+        more than that many CPU seconds, checked after each component.
+        """
+        deadline = CpuDeadline(cpu_deadline)
         resume_data = self.resume_data.get(uid, None)
 
         min_education_score = 1
@@ -262,6 +942,7 @@ class ATS:
         min_overall_score = 5.5
         min_similarity_score = 1
 
+        education_score = skills_score = projects_score = semantics_score = None
         if not resume_data or resume_data is None:
             education_score = 0
             skills_score = 0
@@ -269,41 +950,61 @@ class ATS:
             semantics_score = 0
             similarity_score = 1
         else:
-            reformatted_job_description = self.reformat_job_description(job_description)
-            job_description = reformatted_job_description
-
+            plan = self.get_plan(job_description) if isinstance(job_description, dict) else job_description
             resume_data_literal = self.safe_json_loads(resume_data)
 
-            if 'education' in resume_data:
-                education_score = self.score_education(job_description["education"], resume_data_literal['education'])
+            has_text = 'work_experience' in resume_data_literal and 'skills' in resume_data_literal
+            if has_text:
+                resume_text = ' '.join([work["title"] for work in resume_data_literal["work_experience"] if "title" in work])
+                similarity_score = self.score_similarity(resume_text, plan.similarity_model)
             else:
-                education_score = min_education_score
+                similarity_score = min_similarity_score
 
-            if 'skills' in resume_data:
-                skills_score = self.score_skills(job_description["skills"], resume_data_literal["skills"])
+            deadline.check()
+            if similarity_score == 1:
+                self.models.component_stats.record(skipped=EXPENSIVE_COMPONENTS)
             else:
-                skills_score = min_skills_score
+                self.models.component_stats.record(evaluated=EXPENSIVE_COMPONENTS)
+                features = self.get_resume_features(resume_data)
 
-            if 'projects' in resume_data:
-                projects_score = self.score_projects(resume_data_literal["projects"])
-            else:
-                projects_score = min_projects_score
+                if 'education' in resume_data:
+                    degree_levels = features.get(
+                        "degree_levels", lambda: self.get_degree_levels(resume_data_literal['education']))
+                    education_score = self.score_degree_levels(plan.job_levels, degree_levels)
+                else:
+                    education_score = min_education_score
+                deadline.check()
 
-            if 'work_experience' in resume_data_literal and 'skills' in resume_data_literal:
-                resume_text = ' '.join([work["title"] for work in resume_data_literal["work_experience"] if "title" in work])
-                semantics_score = self.score_semantics(resume_text)
-                similarity_score = self.score_similarity(resume_text, ' '.join(job_description["skills"]))
-            else:
-                semantics_score = min_semantics_score
-                similarity_score = min_similarity_score
+                if 'skills' in resume_data:
+                    resume_skills = resume_data_literal["skills"]
+                    # Only looked up if some JD skill is not matched by name.
+                    skill_vectors = partial(features.get, "skill_vectors",
+                                            lambda: self.get_resume_skill_vectors(list(dict.fromkeys(resume_skills))))
+                    skills_score = self.score_skills(plan, resume_skills, skill_vectors)
+                else:
+                    skills_score = min_skills_score
+                deadline.check()
 
-        total_score = (education_score + skills_score + projects_score + semantics_score + similarity_score)
+                if 'projects' in resume_data:
+                    project_durations = features.get(
+                        "project_durations", lambda: self.get_project_durations(resume_data_literal["projects"]))
+                    projects_score = self.score_project_durations(project_durations)
+                else:
+                    projects_score = min_projects_score
+                deadline.check()
+
+                # has_text is always true here, as similarity defaults to 1 without text.
+                coherence = features.get("coherence", lambda: self.check_semantic_sense(resume_text))
+                semantics_score = self.score_coherence(coherence)
 
         # If similarity score is high, set total_score to 0
         if similarity_score == 1:
             total_score = 0
+        else:
+            total_score = (education_score + skills_score + projects_score + semantics_score + similarity_score)
 
-        if (education_score >= min_education_score and
+        if (similarity_score != 1 and
+                education_score >= min_education_score and
                 skills_score >= min_skills_score and
                 projects_score >= min_projects_score and
                 semantics_score >= min_semantics_score and
@@ -0,0 +1,148 @@
+import math
+import threading
+from collections import Counter, OrderedDict
+from typing import Dict, List
+
+import numpy as np
+from scipy.sparse import csr_matrix
+from sklearn.feature_extraction.text import TfidfVectorizer
+
+from hugging_data import get_degree_level_mappings, get_degree_type_mappings
+
+EDUCATION_LEVELS = ["High School", "Associate", "Bachelor", "Master", "Doctorate"]
+
+
+class EducationIndex:
+    """
+    A compiled index resolving degree strings to education levels, built once per
+    process from the degree type and degree level mappings.
+
+    A resume degree is resolved like DataNormalize.get_normalized_degree_type: to the
+    degree type mapping whose key is most similar to it under a TF-IDF fitted on the
+    degree and every key, ties going to the first key. Instead of refitting for each
+    degree, the key term counts are fitted once and each degree only adjusts the idf of
+    its own terms, which gives the same similarities. Degrees whose terms are in the
+    same proportions as a key's are resolved by a hash lookup, and every resolved
+    degree string is memoized.
+
+    Attributes:
+        degree_type_mappings (Dict[str, str]): The degree type of every degree string.
+        degree_level_mappings (Dict[str, str]): The education level of every degree type.
+        max_cache_size (int): The maximum number of resolved degree strings memoized.
+    """
+
+    def __init__(
+        self,
+        degree_type_mappings: Dict[str, str] | None = None,
+        degree_level_mappings: Dict[str, str] | None = None,
+        max_cache_size: int = 4096
+    ):
+        self.degree_type_mappings = degree_type_mappings if degree_type_mappings is not None \
+            else get_degree_type_mappings()
+        self.degree_level_mappings = degree_level_mappings if degree_level_mappings is not None \
+            else get_degree_level_mappings()
+        self.max_cache_size = max_cache_size
+        self._cache: OrderedDict[str, int] = OrderedDict()
+        self._lock = threading.Lock()
+
+        self._keys = list(self.degree_type_mappings.keys())
+        self._analyzer = TfidfVectorizer(stop_words='english').build_analyzer()
+
+        key_counts = [Counter(self._analyzer(key)) for key in self._keys]
+        self._exact: Dict[frozenset, int] = {}
+        for i, counts in enumerate(key_counts):
+            if counts:
+                self._exact.setdefault(self._direction(counts), i)
+
+        self._vocabulary: Dict[str, int] = {}
+        rows, cols, values = [], [], []
+        for row, counts in enumerate(key_counts):
+            for term, count in counts.items():
+                rows.append(row)
+                cols.append(self._vocabulary.setdefault(term, len(self._vocabulary)))
+                values.append(count)
+        self._counts = csr_matrix(
+            (np.array(values, dtype=np.float64), (rows, cols)),
+            shape=(len(self._keys), len(self._vocabulary))
+        ).tocsc()
+        self._df = np.asarray((self._counts > 0).sum(axis=0)).ravel()
+
+        # A fit on the degree and the keys sees len(keys) + 1 documents. This is the
+        # smoothed idf of every key term when the degree does not contain it.
+        self._documents = len(self._keys) + 1
+        self._idf = np.log((self._documents + 1) / (1 + self._df)) + 1
+        self._norms = self._counts.multiply(self._counts) @ (self._idf ** 2)
+
+    @staticmethod
+    def _direction(counts: Counter) -> frozenset:
+        # Term counts that are multiples of each other give parallel TF-IDF vectors,
+        # which have a similarity of 1.
+        divisor = math.gcd(*counts.values())
+        return frozenset((term, count // divisor) for term, count in counts.items())
+
+    def _nearest_key(self, degree: str) -> int:
+        counts = Counter(self._analyzer(degree))
+        if not counts:
+            return 0
+
+        exact = self._exact.get(self._direction(counts))
+        if exact is not None:
+            return exact
+
+        cols, query_counts, outside_counts = [], [], []
+        for term, count in counts.items():
+            col = self._vocabulary.get(term)
+            if col is None:
+                outside_counts.append(count)
+            else:
+                cols.append(col)
+                query_counts.append(count)
+        if not cols:
+            return 0
+
+        query_counts = np.array(query_counts, dtype=np.float64)
+        outside_counts = np.array(outside_counts, dtype=np.float64)
+        query_idf = np.log((self._documents + 1) / (2 + self._df[cols])) + 1
+        outside_idf = math.log((self._documents + 1) / 2) + 1
+        query_norm = (query_counts * query_idf) @ (query_counts * query_idf) + \
+            (outside_idf ** 2) * (outside_counts @ outside_counts)
+
+        shared = self._counts[:, cols]
+        dot = shared @ (query_counts * query_idf ** 2)
+        key_norms = self._norms + shared.multiply(shared) @ (query_idf ** 2 - self._idf[cols] ** 2)
+        denominators = np.sqrt(query_norm * key_norms)
+
+        similarities = np.zeros(len(self._keys))
+        nonzero = denominators > 0
+        similarities[nonzero] = dot[nonzero] / denominators[nonzero]
+        return int(np.argmax(similarities))
+
+    def get_degree_type(self, degree: str) -> str:
+        """
+        Returns the normalized degree type of a degree string.
+        """
+        return self.degree_type_mappings[self._keys[self._nearest_key(degree)]]
+
+    def get_degree_level(self, degree: str) -> int:
+        """
+        Returns the index in EDUCATION_LEVELS of the education level of a degree string.
+        """
+        with self._lock:
+            level = self._cache.get(degree)
+            if level is not None:
+                self._cache.move_to_end(degree)
+                return level
+
+        level = EDUCATION_LEVELS.index(self.degree_level_mappings[self.get_degree_type(degree)])
+        with self._lock:
+            self._cache[degree] = level
+            while len(self._cache) > self.max_cache_size:
+                self._cache.popitem(last=False)
+        return level
+
+    def get_job_levels(self, job_education: List[str]) -> List[int]:
+        """
+        Returns the index in EDUCATION_LEVELS of every education level of a job
+        description, which are degree types.
+        """
+        return [EDUCATION_LEVELS.index(self.degree_level_mappings[edu]) for edu in job_education]
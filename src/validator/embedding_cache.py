@@ -0,0 +1,94 @@
+import hashlib
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict, List
+
+import torch
+from torch import Tensor
+
+
+class SentenceEmbeddingCache:
+    """
+    A bounded LRU cache of sentence embeddings keyed by a hash of the sentence, so
+    sentences repeated across resumes and steps are only encoded once. Only the
+    sentences missing from the cache are sent to the model, in a single batch. The
+    cache is bounded by the bytes of the embeddings it holds rather than their count.
+
+    Attributes:
+        max_bytes (int): The maximum number of embedding bytes kept before the least recently used are evicted.
+        hits (int): The number of sentences that did not have to be encoded.
+        misses (int): The number of sentences that had to be encoded.
+    """
+
+    def __init__(self, max_bytes: int = 64 * 1024 * 1024):
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self._bytes = 0
+        self._embeddings: OrderedDict[bytes, Tensor] = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _key(sentence: str) -> bytes:
+        return hashlib.sha256(sentence.encode()).digest()
+
+    def _put(self, key: bytes, embedding: Tensor):
+        if key in self._embeddings:
+            return
+        self._embeddings[key] = embedding
+        self._bytes += len(key) + embedding.element_size() * embedding.nelement()
+        while self._bytes > self.max_bytes and self._embeddings:
+            old_key, old_embedding = self._embeddings.popitem(last=False)
+            self._bytes -= len(old_key) + old_embedding.element_size() * old_embedding.nelement()
+
+    def encode(self, encode: Callable[[List[str]], Tensor], sentences: List[str]) -> Tensor:
+        """
+        Returns the embeddings of the sentences, encoding only those not in the cache.
+
+        Args:
+            encode: The function encoding the sentences missing from the cache.
+            sentences: The sentences to embed.
+
+        Returns:
+            A tensor with a row per sentence, in the order of sentences.
+        """
+        keys = [self._key(sentence) for sentence in sentences]
+        embeddings: Dict[bytes, Tensor] = {}
+        missing: Dict[bytes, str] = {}
+        with self._lock:
+            for key, sentence in zip(keys, sentences):
+                embedding = self._embeddings.get(key)
+                if embedding is not None:
+                    self._embeddings.move_to_end(key)
+                    embeddings[key] = embedding
+                else:
+                    missing.setdefault(key, sentence)
+            self.misses += len(missing)
+            self.hits += len(keys) - len(missing)
+
+        if missing:
+            encoded = encode(list(missing.values())).cpu()
+            with self._lock:
+                for key, embedding in zip(missing.keys(), encoded):
+                    # Clone each row so a cached embedding does not keep the whole batch alive.
+                    embeddings[key] = embedding.clone()
+                    self._put(key, embeddings[key])
+
+        if not keys:
+            return torch.empty(0)
+        return torch.stack([embeddings[key] for key in keys])
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Returns the hit and miss counters, the hit rate, the number of cached embeddings
+        and their size in bytes.
+        """
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / lookups if lookups else None,
+                "size": len(self._embeddings),
+                "bytes": self._bytes,
+            }
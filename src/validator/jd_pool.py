@@ -0,0 +1,151 @@
+import os
+import shutil
+import threading
+import time
+from typing import Any, Dict
+
+import numpy as np
+from datasets import Dataset, load_dataset, load_from_disk
+from loguru import logger
+
+
+class FallbackJobDescriptionPool:
+    """
+    A local pool of public job descriptions used when the JD API is unavailable.
+
+    The dataset is saved once to dir_path as Arrow files and opened memory-mapped, so
+    sampling a record is a random access into the mapped file rather than a dataset
+    load. Records are drawn from a shuffled permutation of the pool, so no record is
+    repeated until every record has been drawn once. A background thread reloads the
+    dataset from the hub once the saved pool is refresh_interval seconds old, or is
+    missing, and swaps the new pool in. A restart with a recent saved pool does not
+    reload the dataset.
+
+    Attributes:
+        dir_path (str): The directory the pool is saved to.
+        dataset_name (str): The hub dataset the pool is built from.
+        refresh_interval (int): The number of seconds between refreshes.
+    """
+
+    def __init__(
+        self,
+        dir_path: str,
+        dataset_name: str = "nakamoto-yama/job-descriptions-public",
+        refresh_interval: int = 24 * 60 * 60
+    ):
+        self.dir_path = dir_path
+        self.dataset_name = dataset_name
+        self.refresh_interval = refresh_interval
+        self._lock = threading.Lock()
+        self._refresh_lock = threading.Lock()
+        self._dataset: Dataset | None = None
+        self._order: np.ndarray | None = None
+        self._cursor = 0
+        self._thread: threading.Thread | None = None
+
+    def start(self):
+        """
+        Opens the pool saved on disk, if any, and starts the background refresh thread.
+        """
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._load_saved()
+        self._thread = threading.Thread(target=self._run, name="jd-pool-refresh", daemon=True)
+        self._thread.start()
+
+    def _run(self):
+        while True:
+            age = self._saved_age()
+            if age is not None and age < self.refresh_interval:
+                time.sleep(self.refresh_interval - age)
+                continue
+            try:
+                with self._refresh_lock:
+                    # A pool may have been built by sample while waiting for the lock.
+                    age = self._saved_age()
+                    if age is None or age >= self.refresh_interval:
+                        self._build()
+            except Exception as e:
+                logger.error(f"Failed to refresh fallback job description pool: {e}")
+                time.sleep(self.refresh_interval)
+
+    def _saved_paths(self) -> list[str]:
+        if not os.path.isdir(self.dir_path):
+            return []
+        return sorted(
+            os.path.join(self.dir_path, name) for name in os.listdir(self.dir_path)
+            if name.startswith("pool-")
+        )
+
+    def _saved_age(self) -> float | None:
+        """
+        Returns the number of seconds since the newest saved pool was built, or None if
+        no pool is saved.
+        """
+        saved_paths = self._saved_paths()
+        if not saved_paths:
+            return None
+        try:
+            built_ns = int(os.path.basename(saved_paths[-1])[len("pool-"):])
+        except ValueError:
+            return None
+        return max(0.0, (time.time_ns() - built_ns) / 1e9)
+
+    def _load_saved(self):
+        saved_paths = self._saved_paths()
+        if not saved_paths or self._dataset is not None:
+            return
+        try:
+            self._swap(load_from_disk(saved_paths[-1]))
+        except Exception as e:
+            logger.error(f"Failed to open saved fallback job description pool: {e}")
+
+    def _swap(self, dataset: Dataset):
+        with self._lock:
+            self._dataset = dataset
+            self._order = None
+            self._cursor = 0
+
+    def refresh(self):
+        """
+        Rebuilds the pool from the hub dataset, saves it to disk and swaps it in. Older
+        saved pools are removed afterwards.
+        """
+        with self._refresh_lock:
+            self._build()
+
+    def _build(self):
+        # Called with _refresh_lock held.
+        dataset = load_dataset(self.dataset_name, split="train")
+        path = os.path.join(self.dir_path, f"pool-{time.time_ns()}")
+        dataset.save_to_disk(path)
+        self._swap(load_from_disk(path))
+
+        for old_path in self._saved_paths():
+            if old_path != path:
+                shutil.rmtree(old_path, ignore_errors=True)
+
+    def sample(self) -> Dict[str, Any]:
+        """
+        Returns the next record of the current cycle, building the pool first if it has
+        never been built.
+
+        Returns:
+            A job description record from the public dataset.
+        """
+        if self._dataset is None:
+            # The lock is held across the build, so concurrent callers wait for the
+            # first one to build the pool instead of building it again.
+            with self._refresh_lock:
+                if self._dataset is None:
+                    self._load_saved()
+                if self._dataset is None:
+                    self._build()
+
+        with self._lock:
+            if self._order is None or self._cursor >= len(self._order):
+                self._order = np.random.permutation(len(self._dataset))
+                self._cursor = 0
+            index = int(self._order[self._cursor])
+            self._cursor += 1
+            return self._dataset[index]
@@ -0,0 +1,139 @@
+import asyncio
+import concurrent.futures
+import queue
+import threading
+import time
+from typing import Any, Awaitable, Callable, Dict, Tuple
+
+from loguru import logger
+
+
+class JobDescriptionPrefetcher:
+    """
+    Keeps a bounded queue of upcoming job descriptions filled on a background thread,
+    so a validator step can pop a job description instead of waiting on the JD API.
+
+    Each queued bundle is a (job_description, scoring_data) tuple where scoring_data is
+    a Future holding the result of processing the job description. Bundles are queued
+    as soon as the job description is fetched and then processed on the same thread,
+    so at most the newest bundle is still being processed while the rest are ready.
+
+    Attributes:
+        fetch (Callable[[], Awaitable[str]]): Coroutine function returning the next job description.
+        process (Callable[[str], Dict[str, Any]]): Function turning a job description into scoring data.
+        depth (int): The maximum number of bundles kept in the queue.
+    """
+
+    def __init__(
+        self,
+        fetch: Callable[[], Awaitable[str]],
+        process: Callable[[str], Dict[str, Any]],
+        depth: int = 2,
+        retry_interval: float = 5
+    ):
+        self.fetch = fetch
+        self.process = process
+        self.depth = depth
+        self.retry_interval = retry_interval
+        self._queue: queue.Queue = queue.Queue()
+        self._slots = threading.Semaphore(depth)
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+        self._refills = 0
+        self._failures = 0
+        self._last_refill_latency = None
+        self._total_refill_latency = 0.0
+        self._last_wait = None
+
+    def start(self):
+        """
+        Starts the background thread filling the queue.
+        """
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="jd-prefetcher", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        """
+        Signals the background thread to stop once its current job description is done.
+        """
+        self._stop.set()
+
+    def _run(self):
+        loop = asyncio.new_event_loop()
+        try:
+            while not self._stop.is_set():
+                if not self._slots.acquire(timeout=1):
+                    continue
+                self._refill(loop)
+        finally:
+            loop.close()
+
+    def _refill(self, loop: asyncio.AbstractEventLoop):
+        start = time.perf_counter()
+        try:
+            job_description = loop.run_until_complete(self.fetch())
+        except Exception as e:
+            logger.error(f"Failed to prefetch job description: {e}")
+            self._failures += 1
+            self._slots.release()
+            self._stop.wait(self.retry_interval)
+            return
+
+        scoring_data = concurrent.futures.Future()
+        self._queue.put((job_description, scoring_data))
+
+        try:
+            scoring_data.set_result(self.process(job_description))
+        except Exception as e:
+            logger.error(f"Failed to process prefetched job description: {e}")
+            self._failures += 1
+            scoring_data.set_exception(e)
+
+        latency = time.perf_counter() - start
+        self._refills += 1
+        self._last_refill_latency = latency
+        self._total_refill_latency += latency
+
+    def get(self, timeout: float | None = None) -> Tuple[str, concurrent.futures.Future]:
+        """
+        Pops the next bundle, blocking until one is available.
+
+        Args:
+            timeout: The maximum number of seconds to wait. Waits forever if None.
+
+        Returns:
+            A (job_description, scoring_data) tuple, where scoring_data is a Future
+            resolving to the processed job description.
+
+        Raises:
+            queue.Empty: If no bundle became available before the timeout.
+        """
+        start = time.perf_counter()
+        bundle = self._queue.get(timeout=timeout)
+        self._last_wait = time.perf_counter() - start
+        self._slots.release()
+        return bundle
+
+    def get_metrics(self) -> Dict[str, Any]:
+        """
+        Returns the current queue depth and refill statistics.
+
+        Returns:
+            Dict containing the queue depth and capacity, the number of ready bundles,
+            refill and failure counts, the last and average refill latency in seconds,
+            and how long the last get waited for a bundle.
+        """
+        bundles = list(self._queue.queue)
+        return {
+            "queue_depth": len(bundles),
+            "queue_capacity": self.depth,
+            "ready": sum(1 for _, scoring_data in bundles if scoring_data.done()),
+            "refills": self._refills,
+            "failures": self._failures,
+            "last_refill_latency": self._last_refill_latency,
+            "avg_refill_latency": self._total_refill_latency / self._refills if self._refills else None,
+            "last_wait": self._last_wait,
+        }
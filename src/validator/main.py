@@ -9,15 +9,19 @@ import time
 import os
 import concurrent.futures
 import nltk
+import threading
 import traceback
+from concurrent.futures.process import BrokenProcessPool
 from functools import partial
-from typing import Any, Dict, List, Tuple
+from queue import Empty
+from typing import Any, Awaitable, Dict, List, Tuple
 
 from communex.module.module import Module
 from communex.module.client import ModuleClient
 from communex.client import CommuneClient, Keypair
 from communex.compat.key import classic_load_key
 from communex._common import get_node_url
+from communex.errors import NetworkTimeoutError
 
 from substrateinterface import Keypair
 
@@ -25,14 +29,22 @@ from loguru import logger
 
 from comx.interface import ComxInterface
 from comx.client import ComxClient
+from comx.snapshot import ChainSnapshot
+from comx.module_client import ModuleClientPool
 from comx.miner.module import MinerModule, ScoredMinerModule
 from comx.miner.registry import MinerRegistry
+from comx.miner.health import MinerHealthTracker
 
 from config.validator import ValidatorConfig
 
+from validator.admission import AdmissionLimits, ResumeAdmission
 from validator.adjust_scoring import conditional_power_scaling, normalize_scores
-from validator.ats import ATS
+from validator.ats import ATS, ATSModels, ScoringPlan
 from validator.job_description import JobDescriptionParser
+from validator.jd_prefetch import JobDescriptionPrefetcher
+from validator.jd_pool import FallbackJobDescriptionPool
+from validator.scoring_pool import ScoringPool, score_resumes
+from validator.score_cache import ScoreCache
 from validator.resume_extract import ResumeExtractor
 from validator.skills import JDSkills
 from validator.io.weights import WeightIO, WeightIOInterface
@@ -50,6 +62,16 @@ class Validator(Module):
         interval: int,
         call_timeout: int = 20,
         use_testnet: bool = False,
+        max_concurrent_queries: int = 8,
+        query_timeout: int = 30,
+        jd_prefetch_depth: int = 2,
+        jd_pool: FallbackJobDescriptionPool | None = None,
+        scoring_workers: int = 0,
+        score_batch_size: int = 16,
+        snapshot_interval: int = 0,
+        skill_vector_dir: str | None = None,
+        embedding_backend: str = "torch",
+        admission_limits: AdmissionLimits | None = None,
     ) -> None:
         super().__init__()
         self.client = client
@@ -59,21 +81,55 @@ class Validator(Module):
         self.interval = interval
         self.call_timeout = call_timeout
         self.use_testnet = use_testnet
+        self.snapshot_interval = snapshot_interval
+        self.max_concurrent_queries = max_concurrent_queries
+        self.query_timeout = query_timeout
+        self.client_pool = ModuleClientPool(key=key)
+        self.miner_health = MinerHealthTracker()
+        self.score_cache = ScoreCache()
+        self.admission = ResumeAdmission(admission_limits)
+        self.scoring_executor = concurrent.futures.ThreadPoolExecutor(max_workers=1)
+        self.jd_prefetch_depth = jd_prefetch_depth
+        self.jd_prefetcher = None
+        self.jd_pool = jd_pool
         self.uid = None
         self.queried_miners: MinerRegistry = MinerRegistry()
         self.jd_keys = JobDescriptionParser()
+        # Held while parsing, as the prefetcher thread and a direct fetch share the parser.
+        self.jd_keys_lock = threading.Lock()
+        self.ats_models = None
         self.ats = None
+        self.scoring_workers = scoring_workers
+        self.score_batch_size = score_batch_size
+        self.scoring_pool = None
+        self.skill_vector_dir = skill_vector_dir
+        self.embedding_backend = embedding_backend
 
-    def get_validator_uid(self) -> int:
-        modules = self.client.get_map_modules(self.netuid, False)
+    def get_snapshot(self) -> ChainSnapshot:
+        """
+        Gets the snapshot of the subnet, pinned to a single block. The snapshot is
+        cached by the client for snapshot_interval blocks.
+
+        Returns:
+            The ChainSnapshot of the subnet.
+        """
+        return self.client.get_snapshot(netuid=self.netuid, interval=self.snapshot_interval)
+
+    def get_validator_uid(self, snapshot: ChainSnapshot | None = None) -> int:
+        if snapshot is None:
+            snapshot = self.get_snapshot()
+        modules = snapshot.modules
         if self.key.ss58_address not in modules:
             return -1
         return modules[self.key.ss58_address]['uid']
 
-    async def validate_step(self):
+    async def validate_step(self, snapshot: ChainSnapshot | None = None):
         try:
             print("Starting Asynchronous Validation Step...")
-            miners = self.get_miner_modules()
+            if self.ats_models is None:
+                self.load_scoring()
+            miners = self.get_miner_modules(snapshot=snapshot)
+            self.miner_health.prune(miner.ss58 for miner in miners)
             print(f"Miners: {miners}")
             print("Syncing miners...")
             new_registry = self.sync_miners(miners=miners)
@@ -82,18 +138,14 @@ class Validator(Module):
             print("Getting next miners to query...")
             next_miners = self.next_miners(registry=new_registry)
             print("Generating job description...")
-            job_description = await self.get_job_description()
-            print("Retrieving resumes...")
-            resumes = await self.query(miners=next_miners, job_description=job_description)
-            print("Processing job description")
-            scoring_data = self.process_job_description(job_description=job_description)
-
-            print("Creating ATS object...")
-            self.ats = ATS(skills_df=scoring_data['skills'], universal_skills_weights=scoring_data['universal'],
-                           preferred_skills_weights=scoring_data['preferred'])
-
-            print("Scoring miners...")
-            next_miners = self.score(miners=next_miners, resumes=resumes, scoring_data=scoring_data)
+            # Job descriptions are fetched and processed ahead of time on the prefetcher's
+            # thread. If the newest one is still processing, it finishes while the miners
+            # are queried, since none of it depends on the miner responses.
+            job_description, scoring_data = await self.next_job_description()
+
+            print("Retrieving and scoring resumes...")
+            next_miners = await self.query_and_score(
+                miners=next_miners, job_description=job_description, scoring_data=scoring_data)
             print("Cache-ing miners...")
             self.cache(miners=next_miners)
 
@@ -112,25 +164,33 @@ class Validator(Module):
             print("Exception in 'validate_step':")
             traceback.print_exc()
 
-    def get_miner_modules(self) -> list[MinerModule]:
+    def get_miner_modules(self, snapshot: ChainSnapshot | None = None) -> list[MinerModule]:
         """
         Gets a list of all the miners currently registered on the subnet.
 
+        Args:
+            snapshot:
+                The ChainSnapshot to read the subnet from. If None, the snapshot is
+                retrieved from the client.
+
         Returns:
             A list of MinerModules representing all the miners currently
             registered to the subnet.
         """
+        if snapshot is None:
+            snapshot = self.get_snapshot()
+
         # Get all modules registered on subnet
-        modules = self.client.get_map_modules(self.netuid, False)
+        modules = snapshot.modules
 
         # Get subnet hyperparameters
-        subnet = self.client.get_subnet_params(key=self.netuid)
+        subnet = snapshot.subnet_params
 
         # Get maximum weight age for the subnet
         max_weight_age = subnet['max_weight_age']
 
-        # Get the current block
-        current_block = self.client.get_current_block()
+        # Get the block the snapshot was read at
+        current_block = snapshot.block
 
         miners: list[MinerModule] = []
 
@@ -274,14 +334,26 @@ class Validator(Module):
 
         return next_miners
 
-    async def query(self, miners: MinerRegistry, job_description: str) -> list[dict | None]:
+    async def query(
+        self,
+        miners: MinerRegistry,
+        job_description: str,
+        queue: asyncio.Queue | None = None
+    ) -> list[dict | None]:
         """
         Queries all the miners in the MinerRegistry with the provided job description. 
         The miner responses are appended to a list in json format.
 
+        All miners are queried concurrently on the running event loop, with at most
+        max_concurrent_queries requests in flight. Miners that have not answered
+        once query_timeout has passed are cancelled and treated as failed queries.
+
         Args:
             miners: The MinerRegistry containing the miners that will be queried.
             job_description: Dictionary containing job description info
+            queue:
+                If provided, a (uid, response) tuple is put on the queue as soon as each
+                miner responds, fails or is cancelled.
 
         Returns:
             list[dict | None]:
@@ -290,12 +362,35 @@ class Validator(Module):
 
                 TODO: Format the data in a way to map uid/ss58 to each response.
         """
-        get_miner_prediction = partial(self._get_miner_prediction, job_description)
         miners_dict = miners.get_all_by_uid()
-
-        with concurrent.futures.ThreadPoolExecutor(max_workers=8) as executor:
-            it = executor.map(get_miner_prediction, miners_dict.values())
-            miner_answers = [*it]
+        semaphore = asyncio.Semaphore(self.max_concurrent_queries)
+
+        def on_done(uid: int, task: asyncio.Task):
+            response = {str(uid): None} if task.cancelled() else task.result()
+            queue.put_nowait((uid, response))
+
+        tasks = []
+        for uid, miner in miners_dict.items():
+            task = asyncio.create_task(self._get_miner_prediction(job_description, miner, semaphore))
+            if queue is not None:
+                task.add_done_callback(partial(on_done, uid))
+            tasks.append(task)
+
+        miner_answers = []
+        if tasks:
+            done, pending = await asyncio.wait(tasks, timeout=self.query_timeout)
+            for task in pending:
+                task.cancel()
+            # Wait for the cancellations to go through so every response has been
+            # put on the queue before returning.
+            await asyncio.gather(*pending, return_exceptions=True)
+
+            for uid, task in zip(miners_dict.keys(), tasks):
+                if task in done:
+                    miner_answers.append(task.result())
+                else:
+                    logger.error(f"Miner {uid} did not respond before the query deadline")
+                    miner_answers.append({str(uid): None})
 
         print("Resumes:")
         for uid, resume in zip(miners_dict.keys(), miner_answers):
@@ -303,55 +398,282 @@ class Validator(Module):
 
         return miner_answers
 
-    def _get_miner_prediction(self, job_description: str, miner: ScoredMinerModule) -> dict[str, Any]:
+    async def _get_miner_prediction(
+        self,
+        job_description: str,
+        miner: ScoredMinerModule,
+        semaphore: asyncio.Semaphore
+    ) -> dict[str, Any]:
 
         ip, port = miner.get_split_ip_port()
         uid = miner.uid
         if ip is None or port is None or ip == 'None' or port == 'None':
             miner_prediction = None
+        elif not self.miner_health.should_query(miner.ss58):
+            # Miners that keep failing are only probed occasionally and score 0 meanwhile.
+            logger.info(f"Skipping miner {uid}, circuit is open: {self.miner_health.get_stats(miner.ss58)}")
+            miner_prediction = None
         else:
-            client = ModuleClient(host=ip, port=int(port), key=self.key)
+            client = self.client_pool.get_client(ss58=miner.ss58, host=ip, port=int(port))
+            timeout = self.miner_health.get_timeout(miner.ss58, self.call_timeout)
 
+            start = None
             try:
-                miner_answer = asyncio.run(
-                    client.call("generate", miner.ss58, {"prompt": job_description}, timeout=self.call_timeout)
-                )
+                async with semaphore:
+                    start = time.monotonic()
+                    miner_answer = await client.call(
+                        "generate", miner.ss58, {"prompt": job_description}, timeout=timeout
+                    )
+                    latency = time.monotonic() - start
 
                 miner_prediction = miner_answer["answer"]
+                self.miner_health.record_success(miner.ss58, latency)
+            except asyncio.CancelledError:
+                # Cancelled at the query deadline. Miners still waiting for a query slot
+                # were never queried, so only the ones being queried timed out.
+                if start is not None:
+                    self.miner_health.record_failure(miner.ss58, timed_out=True)
+                raise
             except Exception as e:
                 logger.error(f"Error getting miner response: {e}")
+                self.miner_health.record_failure(miner.ss58, timed_out=isinstance(e, NetworkTimeoutError))
                 miner_prediction = None
         miner_prediction = {str(uid): miner_prediction}
         return miner_prediction
 
-    def score(self, miners: MinerRegistry, resumes: Dict[str, Any], scoring_data: Dict[str, Any]) -> MinerRegistry:
+    async def query_and_score(
+        self,
+        miners: MinerRegistry,
+        job_description: str,
+        scoring_data: Awaitable[Dict[str, Any]]
+    ) -> MinerRegistry:
         """
-        Takes a list of miners that will be scored, a uid mapping of resumes and job description scoring data
+        Queries the miners and scores each resume as soon as its miner responds, so
+        scoring overlaps with the network round-trips of the remaining miners. Scores
+        are written to the miners in the registry as they are calculated.
 
         Args:
-            miners: The MinerRegistry containing the miners that will be scored.
-            resumes: Dict containing UID as key and resume data as the value
-            scoring_data: Dict containing various values extracted from the job description
+            miners: The MinerRegistry containing the miners that will be queried and scored.
+            job_description: The job description sent to the miners.
+            scoring_data:
+                Awaitable resolving to the dict of values extracted from the job description.
+                It is awaited by the scoring consumer, so the job description can still be
+                processing while the miners are being queried.
+
+        Returns:
+            The MinerRegistry containing the scored miners.
         """
-        miners_dict = miners.get_all_by_uid()
-        uids = [u for u in miners_dict.keys()]
-        print_scores = []
-        for uid, v in miners_dict.items():
-            resume_index = uids.index(uid)
-            uid = str(uid)
-            resume_data = resumes[resume_index]
-            self.ats.store_resume(resume_data=resume_data)
-            ats_score = self.ats.calculate_ats_score(scoring_data['jd'], uid)
-            total_score = ats_score['total_score']
-            v.score = total_score
-            miners.set(v)
-            print_score = f"{uid} - {ats_score}"
-            print_scores.append(print_score)
-        score_print = '\n'.join(print_scores)
-        print(f"Scores:\n{score_print}")
+        queue: asyncio.Queue = asyncio.Queue()
+        consumer = asyncio.create_task(self._score_responses(miners=miners, queue=queue, scoring_data=scoring_data))
 
+        try:
+            await self.query(miners=miners, job_description=job_description, queue=queue)
+        finally:
+            queue.put_nowait(None)
+
+        await consumer
         return miners
 
+    async def _score_responses(
+        self,
+        miners: MinerRegistry,
+        queue: asyncio.Queue,
+        scoring_data: Awaitable[Dict[str, Any]]
+    ):
+        """
+        Consumes (uid, response) tuples from the queue until a None sentinel is received,
+        scoring them off the event loop so it is free to keep handling miner responses.
+        Once the scoring data is ready, an ATS object is created and the job description
+        is compiled into a scoring plan on the scoring executor.
+
+        Resumes are scored in micro-batches with ATS.calculate_ats_scores. A batch is
+        started as soon as a scoring slot is free, one per scoring worker or a single
+        one without a scoring pool, and holds every resume that arrived while the slots
+        were busy, up to score_batch_size. Batches go to the scoring pool's worker
+        processes if there is one, otherwise to the scoring executor.
+
+        Responses are passed through resume admission first, so oversized or malformed
+        resumes are rejected or truncated before any NLP runs on them. Resumes already
+        scored against this job description are taken from the score cache, and identical
+        resumes arriving while the first is still being scored wait for that score
+        instead of being scored again.
+        """
+        loop = asyncio.get_running_loop()
+        scoring_data = await scoring_data
+
+        print("Creating ATS object...")
+        self.ats = await loop.run_in_executor(self.scoring_executor, self.get_ats, scoring_data)
+        plan = await loop.run_in_executor(self.scoring_executor, self.ats.compile_plan, scoring_data['jd'])
+
+        jd_fingerprint = ScoreCache.fingerprint_job_description(scoring_data)
+        in_flight: dict[str, asyncio.Future] = {}
+        pending = []
+        batch: list[Tuple[str, Dict[str, Any], asyncio.Future]] = []
+        scoring: set[asyncio.Task] = set()
+
+        def receive(uid: int, resume_data: Dict[str, Any]):
+            miner = miners.get_by_uid(uid)
+            resume_data = {str(uid): self.admission.admit(resume_data[str(uid)])}
+            resume_fingerprint = ScoreCache.fingerprint_resume(resume_data[str(uid)])
+
+            ats_score = self.score_cache.get(jd_fingerprint, resume_fingerprint)
+            if ats_score is not None:
+                self.set_miner_score(miners=miners, miner=miner, ats_score=ats_score)
+                return
+
+            future = in_flight.get(resume_fingerprint)
+            if future is None:
+                future = loop.create_future()
+                in_flight[resume_fingerprint] = future
+                batch.append((str(uid), resume_data, future))
+            pending.append(asyncio.create_task(
+                self._set_miner_score_when_done(miners, miner, future, jd_fingerprint, resume_fingerprint)))
+
+        def start_batch():
+            task = asyncio.create_task(self._score_batch(batch[:self.score_batch_size], scoring_data, plan))
+            del batch[:self.score_batch_size]
+            scoring.add(task)
+            task.add_done_callback(scoring.discard)
+
+        received = asyncio.ensure_future(queue.get())
+        finished = False
+        while not finished:
+            await asyncio.wait({received, *scoring}, return_when=asyncio.FIRST_COMPLETED)
+            if received.done():
+                # Every response already queued is taken at once.
+                items = [received.result()]
+                while not queue.empty():
+                    items.append(queue.get_nowait())
+                for item in items:
+                    if item is None:
+                        finished = True
+                        break
+                    receive(*item)
+                if not finished:
+                    received = asyncio.ensure_future(queue.get())
+
+            slots = self.scoring_pool.workers if self.scoring_pool is not None else 1
+            while len(batch) >= self.score_batch_size or (batch and len(scoring) < slots):
+                start_batch()
+
+        while batch:
+            start_batch()
+        await asyncio.gather(*pending)
+        logger.info(f"Score cache: {self.score_cache.get_stats()}")
+        logger.info(f"Resume admission: {self.admission.get_stats()}")
+        if self.scoring_pool is None:
+            # Scoring workers each keep their own caches and component stats.
+            logger.info(f"Sentence embedding cache: {self.ats_models.embedding_cache.get_stats()}")
+            logger.info(f"Scoring components: {self.ats_models.component_stats.get_stats()}")
+            logger.info(f"Resume feature cache: {self.ats_models.resume_features.get_stats()}")
+
+    async def _score_batch(
+        self,
+        batch: list[Tuple[str, Dict[str, Any], asyncio.Future]],
+        scoring_data: Dict[str, Any],
+        plan: ScoringPlan
+    ):
+        resumes = [(uid, resume_data) for uid, resume_data, _ in batch]
+        cpu_deadline = self.admission.limits.cpu_deadline
+        try:
+            ats_scores = None
+            if self.scoring_pool is not None:
+                try:
+                    ats_scores = await asyncio.wrap_future(
+                        self.scoring_pool.submit(scoring_data, plan, resumes, cpu_deadline))
+                except BrokenProcessPool as e:
+                    self.stop_scoring_pool(e)
+
+            if ats_scores is None:
+                loop = asyncio.get_running_loop()
+                ats_scores = await loop.run_in_executor(
+                    self.scoring_executor, score_resumes, self.ats, plan, resumes, cpu_deadline)
+        except Exception as e:
+            for _, _, future in batch:
+                future.set_exception(e)
+            return
+
+        for (_, _, future), ats_score in zip(batch, ats_scores):
+            future.set_result(ats_score)
+
+    async def _set_miner_score_when_done(
+        self,
+        miners: MinerRegistry,
+        miner: ScoredMinerModule,
+        future: asyncio.Future,
+        jd_fingerprint: str,
+        resume_fingerprint: str
+    ):
+        ats_score = await future
+        self.score_cache.put(jd_fingerprint, resume_fingerprint, ats_score)
+        self.set_miner_score(miners=miners, miner=miner, ats_score=dict(ats_score))
+
+    def set_miner_score(self, miners: MinerRegistry, miner: ScoredMinerModule, ats_score: Dict[str, Any]):
+        """
+        Stores the total ATS score on the miner in the registry.
+
+        Args:
+            miners: The MinerRegistry the scored miner is written to.
+            miner: The miner that was scored.
+            ats_score: The ATS score of the miner's resume.
+        """
+        miner.score = ats_score['total_score']
+        miners.set(miner)
+        print(f"Score: {miner.uid} - {ats_score}")
+
+    def load_scoring(self):
+        """
+        Loads the ATS models and, if more than one scoring worker is configured, forks
+        the scoring pool. This must run before the job description prefetcher thread is
+        started so the workers are forked from a single-threaded process, and the
+        embedding backend is only compared to torch once the workers are forked.
+        """
+        if self.ats_models is None:
+            print("Loading ATS models...")
+            self.ats_models = ATSModels(skill_vector_dir=self.skill_vector_dir, embedding_backend=self.embedding_backend)
+
+        if self.scoring_pool is None and self.scoring_workers > 1:
+            print(f"Starting {self.scoring_workers} scoring workers...")
+            self.scoring_pool = ScoringPool(models=self.ats_models, workers=self.scoring_workers)
+
+        # Only run inference once the workers are forked.
+        self.ats_models.report_embedding_backend()
+
+    def stop_scoring_pool(self, error: Exception):
+        """
+        Shuts down a broken scoring pool and scores serially from then on. The pool is
+        not recreated, since forking after inference has run is unsafe.
+
+        Args:
+            error: The error the pool broke with.
+        """
+        if self.scoring_pool is None:
+            return
+        logger.error(f"Scoring pool broke, scoring serially from now on: {error}")
+        scoring_pool, self.scoring_pool = self.scoring_pool, None
+        scoring_pool.shutdown()
+
+    def get_ats(self, scoring_data: Dict[str, Any]) -> ATS:
+        """
+        Builds the ATS scoring context for a job description. The ATS models are
+        loaded on first use and reused for every following step.
+
+        Args:
+            scoring_data: Dict containing various values extracted from the job description
+
+        Returns:
+            An ATS scoring context for the job description in scoring_data.
+        """
+        if self.ats_models is None:
+            self.load_scoring()
+
+        return ATS(
+            skills_df=scoring_data['skills'],
+            universal_skills_weights=scoring_data['universal'],
+            preferred_skills_weights=scoring_data['preferred'],
+            models=self.ats_models
+        )
+
     def cache(self, miners: MinerRegistry):
         """
         Takes a MinerRegistry containing the queried and scored miners for
@@ -414,13 +736,19 @@ class Validator(Module):
         return intuids, intweights
 
     def validation_loop(self) -> None:
+        # A single event loop is kept for the lifetime of the validator so pooled
+        # miner connections can be reused from one step to the next.
+        loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(loop)
+
         while True:
-            uid = self.get_validator_uid()
+            snapshot = self.get_snapshot()
+            uid = self.get_validator_uid(snapshot=snapshot)
             self.uid = uid
 
             if self.uid != -1:
                 logger.info("Begin validator step... ")
-                asyncio.run(self.validate_step())
+                loop.run_until_complete(self.validate_step(snapshot=snapshot))
             else:
                 logger.info("Validator not registered, skipping step...")
 
@@ -428,17 +756,49 @@ class Validator(Module):
             time.sleep(self.interval)
 
     def extract_resumes(self, miner_resumes: Dict[str, Any]) -> Dict[str, Any]:
-        resume_extractor = ResumeExtractor()
+        resume_extractor = self.ats_models.resume_extractor if self.ats_models is not None else ResumeExtractor()
         new_miner_resumes = {}
         for uid, miner_resume in miner_resumes.items():
-            resume_extractor.add_resume_data(miner_resume)
-            extracted_resume = resume_extractor.get_segments()
-            new_miner_resumes[uid] = extracted_resume
+            resume = [v for v in miner_resume.values()][0]
+            new_miner_resumes[uid] = resume_extractor.get_segments(resume).to_dict()
         return new_miner_resumes
 
+    async def next_job_description(self) -> Tuple[str, Awaitable[Dict[str, Any]]]:
+        """
+        Pops the next job description from the prefetch queue, starting the prefetcher
+        on first use. If no job description is ready within the time a single fetch may
+        take, one is fetched and processed directly instead, so a step never waits on a
+        prefetcher that keeps failing. Processing holds jd_keys_lock, so the direct fetch
+        never parses at the same time as the prefetcher thread.
+
+        Returns:
+            A tuple of the job description and an awaitable resolving to its scoring data.
+        """
+        if self.jd_prefetcher is None:
+            if self.jd_pool is not None:
+                self.jd_pool.start()
+            self.jd_prefetcher = JobDescriptionPrefetcher(
+                fetch=self.get_job_description,
+                process=self.process_job_description,
+                depth=self.jd_prefetch_depth
+            )
+            self.jd_prefetcher.start()
+
+        loop = asyncio.get_running_loop()
+        try:
+            job_description, scoring_data = await loop.run_in_executor(
+                None, partial(self.jd_prefetcher.get, timeout=self.call_timeout + 120))
+        except Empty:
+            logger.warning("No prefetched job description is ready, fetching one directly")
+            job_description = await self.get_job_description()
+            return job_description, loop.run_in_executor(None, self.process_job_description, job_description)
+        logger.info(f"JD prefetch metrics: {self.jd_prefetcher.get_metrics()}")
+        return job_description, asyncio.wrap_future(scoring_data)
+
     def process_job_description(self, job_description: str) -> Dict[str, Any]:
-        skills_df = self.jd_keys.get_skills_dataframe(job_description=job_description)
-        processed_job_description = self.jd_keys.get_formatted_jd(df=skills_df)
+        with self.jd_keys_lock:
+            skills_df = self.jd_keys.get_skills_dataframe(job_description=job_description)
+            processed_job_description = self.jd_keys.get_formatted_jd(df=skills_df)
         jd_skills = JDSkills(skills_df, job_description)
         universal_skills_weights, preferred_skills_weights = jd_skills.get_skills_weights()
         scoring_data = {
@@ -468,8 +828,11 @@ class Validator(Module):
             print("WARNING: JD API Connection Error: getting record from public hf repo"
                   "(most likely validator has not set weights and is not recognized yet; "
                   f"if issue persists for multiple steps, message Yama's discord channel)")
-            dataset = datasets.load_dataset("nakamoto-yama/job-descriptions-public")
-            api_response = dataset['train'].shuffle(seed=42).select([0])[0]
+            if self.jd_pool is not None:
+                api_response = self.jd_pool.sample()
+            else:
+                dataset = datasets.load_dataset("nakamoto-yama/job-descriptions-public")
+                api_response = dataset['train'].shuffle(seed=42).select([0])[0]
         print(f"API Response: {api_response}")
         return api_response['Description']
 
@@ -505,7 +868,20 @@ if __name__ == '__main__':
             weight_io=WeightIO(io=IO(), dir_path=yama_dir, file_name="weights.json"),
             interval=config.get_validator_interval(),
             call_timeout=20,
-            use_testnet=config.get_testnet()
+            use_testnet=config.get_testnet(),
+            max_concurrent_queries=config.get_max_concurrent_queries(),
+            query_timeout=config.get_query_timeout(),
+            jd_prefetch_depth=config.get_jd_prefetch_depth(),
+            jd_pool=FallbackJobDescriptionPool(dir_path=os.path.join(yama_dir, "jd_pool")),
+            scoring_workers=config.get_scoring_workers(),
+            score_batch_size=config.get_score_batch_size(),
+            snapshot_interval=config.get_snapshot_interval(),
+            skill_vector_dir=os.path.join(yama_dir, "skill_vectors"),
+            embedding_backend=config.get_embedding_backend(),
+            admission_limits=AdmissionLimits(
+                max_bytes=config.get_max_resume_size(),
+                cpu_deadline=config.get_resume_cpu_deadline()
+            )
         )
 
         validator.validation_loop()
@@ -1,13 +1,16 @@
 import json
+import threading
 from datetime import datetime
 from collections import defaultdict
+from dataclasses import dataclass
+from types import MappingProxyType
 from datasets import load_dataset
 from sklearn.feature_extraction.text import TfidfVectorizer
 from sklearn.neighbors import NearestNeighbors
 from fuzzywuzzy import fuzz
 from hugging_data import get_certifications_dataset, get_colleges
 from normalize import DataNormalize
-from typing import Dict, List, Any, Tuple
+from typing import Dict, List, Any, Mapping, Tuple
 
 sample_resume_data = {
     "skills": [
@@ -64,52 +67,122 @@ sample_resume_data = {
 }
 
 
-class ResumeExtractor:
-    def __init__(self, resume_data: Dict[str, Any] | None = None):
-        if resume_data is None:
-            self.resume_data = sample_resume_data
-        else:
-            self.resume_data = None
-            self.add_resume_data(resume_data)
+class ResumeReferenceData:
+    """
+    The reference data resumes are extracted against, built once per process and shared
+    read-only by every ResumeExtractor, so constructing an extractor does not reload the
+    datasets or refit the certification index.
+
+    Attributes:
+        dataset (Tuple[Dict[str, str], ...]): The certifications dataset.
+        certifications (Tuple[str, ...]): The name of every certification in the dataset.
+        skills_gained (Mapping[str, str]): The skills gained of every certification, from its first record.
+        universities (Dict[str, List[Any]]): The colleges dataset.
+        college_names (frozenset): The lowercase name of every college.
+        vectorizer (TfidfVectorizer): The TF-IDF vectorizer fitted on the certifications.
+        knn (NearestNeighbors): The nearest neighbor index over the certification vectors.
+    """
+
+    def __init__(
+        self,
+        dataset: List[Dict[str, str]] | None = None,
+        universities: Dict[str, List[Any]] | None = None
+    ):
+        self.dataset = tuple(dataset if dataset is not None else get_certifications_dataset())
+        self.certifications = tuple(cert["Class"] for cert in self.dataset)
+        skills_gained = {}
+        for cert in self.dataset:
+            skills_gained.setdefault(cert["Class"], cert["Skills Gained"])
+        self.skills_gained: Mapping[str, str] = MappingProxyType(skills_gained)
+
+        self.universities = universities if universities is not None else get_colleges()
+        self.college_names = frozenset(name.lower() for name in self.universities.get("name", []))
+
         self.vectorizer = TfidfVectorizer()
-        self.dataset = get_certifications_dataset()
-        self.certifications = [cert["Class"] for cert in self.dataset]
-        self.universities = get_colleges()
-        self.knn = self.load_knn_model()
-        self.universal_skills = defaultdict(int)
-        self.education_dict = defaultdict(lambda: {"exists": 0, "major": ""})
-        self.work_experience_dict = defaultdict(float)
-        self.workskills_dict = defaultdict(float)
-        self.certification_dict = {}
-        self.project_timelines = []
-        self.job_titles = []
-        self.data_normalizer = DataNormalize()
-
-    def check_university_exists(self, university_name: str, universities: List[str]) -> 0 | 1:
-        for uni in universities:
-            if uni['name'].lower() == university_name.lower():
-                return 1
-        return 0
+        self.knn = NearestNeighbors(metric='cosine', algorithm='brute')
+        self.knn.fit(self.vectorizer.fit_transform(self.certifications))
+
+    def has_college(self, university_name: str) -> bool:
+        return university_name.lower() in self.college_names
+
+
+_reference_data: ResumeReferenceData | None = None
+_reference_data_lock = threading.Lock()
+
+
+def get_resume_reference_data() -> ResumeReferenceData:
+    """
+    Returns the process-wide resume reference data, building it on first use.
+    """
+    global _reference_data
+    with _reference_data_lock:
+        if _reference_data is None:
+            _reference_data = ResumeReferenceData()
+        return _reference_data
+
+
+@dataclass(frozen=True, slots=True)
+class ResumeSegments:
+    """
+    The segments extracted from a single resume.
+
+    Attributes:
+        universal_skills (Dict[str, int]): The count of every skill in the skills, work roles and certifications.
+        education (Dict[str, Dict[str, Any]]): Whether the school of every normalized major exists.
+        work_experience (Dict[str, float]): The years of experience of every job title.
+        workskills (Dict[str, float]): The years of experience of every skill in the work roles.
+        project_timelines (Tuple[float, ...]): The duration in years of every project.
+        certifications (Dict[str, List[str]]): The skills gained of every matched certification.
+        job_titles (Tuple[str, ...]): The normalized job titles.
+    """
+
+    universal_skills: Dict[str, int]
+    education: Dict[str, Dict[str, Any]]
+    work_experience: Dict[str, float]
+    workskills: Dict[str, float]
+    project_timelines: Tuple[float, ...]
+    certifications: Dict[str, List[str]]
+    job_titles: Tuple[str, ...]
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "universal_skills": self.universal_skills,
+            "education_dict": self.education,
+            "work_experience_dict": self.work_experience,
+            "workskills_dict": self.workskills,
+            "project_timelines": list(self.project_timelines),
+            "certification_dictionary": self.certifications,
+            "job_titles": list(self.job_titles)
+        }
+
+
+class ResumeExtractor:
+    """
+    Extracts the segments of resumes. The extractor keeps no state between resumes: it
+    only reads the shared ResumeReferenceData, which is the process-wide instance unless
+    one is given, and every call builds its results from its arguments. A single
+    extractor can therefore be shared by threads and used for any number of resumes.
+    """
+
+    def __init__(self, reference_data: ResumeReferenceData | None = None):
+        self.reference_data = reference_data if reference_data is not None else get_resume_reference_data()
+
+    def check_university_exists(self, university_name: str) -> 0 | 1:
+        return int(self.reference_data.has_college(university_name))
 
     def process_skills(self, skills: List[str], universal_skills: Dict[str, Any]) -> Dict[str, int]:
         for skill in skills:
-            self.universal_skills[skill] += 1
             if skill in universal_skills:
                 universal_skills[skill] += 1
             else:
                 universal_skills[skill] = 1
         return universal_skills
 
-    def find_nearest_certifications(
-        self,
-        query: str,
-        knn_model: NearestNeighbors,
-        vectorizer: TfidfVectorizer,
-        certifications: List[str],
-        threshold: float = 0.5
-    ) -> List[Tuple[str, float]]:
-        query_vec = vectorizer.transform([query])
-        distances, indices = knn_model.kneighbors(query_vec, n_neighbors=len(certifications))
+    def find_nearest_certifications(self, query: str, threshold: float = 0.5) -> List[Tuple[str, float]]:
+        reference_data = self.reference_data
+        certifications = reference_data.certifications
+        query_vec = reference_data.vectorizer.transform([query])
+        distances, indices = reference_data.knn.kneighbors(query_vec, n_neighbors=len(certifications))
         nearest_certs = [(certifications[idx], distances[0][i]) for i, idx in enumerate(indices[0])]
         nearest_certs = [(cert, dist) for cert, dist in nearest_certs if dist < threshold]
 
@@ -125,103 +198,85 @@ class ResumeExtractor:
         end = datetime.strptime(end_date, "%Y-%m-%d")
         return (end - start).days / 365.25
 
-    def skills_from_certs(self) -> Dict[str, Any]:
-        certification_dict = self.certification_dict
-        for cert in self.resume_data["certifications"]:
-            nearest_certs = self.find_nearest_certifications(cert, self.knn, self.vectorizer, self.certifications, threshold=0.3)
+    def skills_from_certs(self, certifications: List[str], universal_skills: Dict[str, int]) -> Dict[str, List[str]]:
+        certification_dict = {}
+        for cert in certifications:
+            nearest_certs = self.find_nearest_certifications(cert, threshold=0.3)
             if nearest_certs:
                 best_cert, _ = nearest_certs[0]
-                matching_cert = self.dataset.filter(lambda x: x['Class'] == best_cert)
-                if len(matching_cert) > 0:
-                    cert_info = matching_cert[0]
-                    skills_gained = cert_info['Skills Gained'].split(", ")
+                cert_skills = self.reference_data.skills_gained.get(best_cert)
+                if cert_skills is not None:
+                    skills_gained = cert_skills.split(", ")
                     certification_dict[best_cert] = skills_gained
                     for skill in skills_gained:
                         if skill:
-                            self.universal_skills[skill] += 1
+                            universal_skills[skill] += 1
                 else:
                     certification_dict[best_cert] = []
                     for skill in best_cert.split():
-                        self.universal_skills[skill] += 1
+                        universal_skills[skill] += 1
             else:
                 certification_dict[cert] = []
                 for skill in cert.split():
-                    self.universal_skills[skill] += 1
+                    universal_skills[skill] += 1
         return certification_dict
 
-    def verify_education(self) -> Dict[str, Any]:
-        education_dict = self.education_dict
-        for edu in self.resume_data["education"]:
-            university_name = edu["school"]  # Fetch university name directly from the dict
-            major = self.data_normalizer.get_normalized_degree_major(edu["major"])
-            if self.check_university_exists(university_name, self.universities):
-                education_dict[major]["exists"] = 1  # University exists
-                education_dict[major]["major"] = major
-            else:
-                education_dict[major]["exists"] = 0  # University doesn't exist
-                education_dict[major]["major"] = major
+    def verify_education(self, education: List[Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
+        # DataNormalize refits its vectorizer on every lookup, so it is not shared.
+        data_normalizer = DataNormalize()
+        education_dict = {}
+        for edu in education:
+            major = data_normalizer.get_normalized_degree_major(edu["major"])
+            education_dict[major] = {"exists": self.check_university_exists(edu["school"]), "major": major}
         return education_dict
 
-    def process_work_experience(self):
-        work_experience_dict = self.work_experience_dict
-        workskills_dict = self.workskills_dict
-        for work in self.resume_data["work_experience"]:
+    def process_work_experience(
+        self,
+        work_experience: List[Dict[str, Any]],
+        universal_skills: Dict[str, int]
+    ) -> Tuple[Dict[str, float], Dict[str, float], List[str]]:
+        work_experience_dict = defaultdict(float)
+        workskills_dict = defaultdict(float)
+        job_titles = []
+        for work in work_experience:
             job_title = work["job_title"]
             years_of_experience = self.calculate_years(work["start_date"], work["end_date"])
             work_experience_dict[job_title] += years_of_experience
-            self.job_titles.append(job_title)
+            job_titles.append(job_title)
             # Extract skills from roles
             roles_skills = work["roles"].split()
             for skill in roles_skills:
-                self.universal_skills[skill] += 1
+                universal_skills[skill] += 1
                 workskills_dict[skill] += years_of_experience
+        return dict(work_experience_dict), dict(workskills_dict), job_titles
 
-    def calculate_timelines(self):
-        project_timelines = self.project_timelines
-        for project in self.resume_data["projects"]:
-            project_duration = self.calculate_years(project["start_date"], project["end_date"])
-            project_timelines.append(project_duration)
-
-    def get_segments(self) -> Dict[str, Any]:
-        self.universal_skills = self.process_skills(self.resume_data["skills"])
-        self.verify_education()
-        self.process_work_experience()
-        self.calculate_timelines()
-        self.skills_from_certs()
-
-        result = {
-            "universal_skills": dict(self.universal_skills),
-            "education_dict": dict(self.education_dict),
-            "work_experience_dict": dict(self.work_experience_dict),
-            "workskills_dict": dict(self.workskills_dict),
-            "project_timelines": self.project_timelines,
-            "certification_dictionary": self.certification_dict,
-            "job_titles": self.data_normalizer.normalize_job_titles(self.job_titles)
-        }
-        return result
-
-    def load_knn_model(self) -> NearestNeighbors:
-        X = self.vectorizer.fit_transform(self.certifications)
-        knn = NearestNeighbors(metric='cosine', algorithm='brute')
-        knn.fit(X)
-        return knn
+    def calculate_timelines(self, projects: List[Dict[str, Any]]) -> List[float]:
+        return [self.calculate_years(project["start_date"], project["end_date"]) for project in projects]
 
-    def add_resume_data(self, resume_data: Dict[str, Any]):
-        self.resume_data = [v for v in resume_data.values()][0]
+    def get_segments(self, resume: Dict[str, Any]) -> ResumeSegments:
+        """
+        Extracts the segments of a resume into a fresh ResumeSegments.
+        """
+        universal_skills = self.process_skills(resume["skills"], defaultdict(int))
+        education = self.verify_education(resume["education"])
+        work_experience, workskills, job_titles = self.process_work_experience(
+            resume["work_experience"], universal_skills)
+        project_timelines = self.calculate_timelines(resume["projects"])
+        certifications = self.skills_from_certs(resume["certifications"], universal_skills)
 
-    def reset(self):
-        self.universal_skills = defaultdict(int)
-        self.education_dict = defaultdict(lambda: {"exists": 0, "major": ""})
-        self.work_experience_dict = defaultdict(float)
-        self.workskills_dict = defaultdict(float)
-        self.certification_dict = {}
-        self.project_timelines = []
-        self.job_titles = []
+        return ResumeSegments(
+            universal_skills=dict(universal_skills),
+            education=education,
+            work_experience=work_experience,
+            workskills=workskills,
+            project_timelines=tuple(project_timelines),
+            certifications=certifications,
+            job_titles=tuple(DataNormalize().normalize_job_titles(job_titles))
+        )
 
 
 if __name__ == '__main__':
-    resume_extractor = ResumeExtractor(resume_data=sample_resume_data)
-    result = resume_extractor.get_segments()
+    resume_extractor = ResumeExtractor()
+    result = resume_extractor.get_segments(sample_resume_data)
     print("\nResult:")
-    print(json.dumps(result, indent=4))
-    resume_extractor.reset()
+    print(json.dumps(result.to_dict(), indent=4))
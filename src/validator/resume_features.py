@@ -0,0 +1,97 @@
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict
+
+
+class ResumeFeatures:
+    """
+    The intermediates of scoring a resume that do not depend on the job description,
+    such as its degree levels, skill vectors, project durations and sentence coherence.
+    Each feature is computed on first use and kept for every later job description.
+    """
+
+    def __init__(self):
+        self._values: Dict[str, Any] = {}
+        self._lock = threading.Lock()
+
+    def __contains__(self, name: str) -> bool:
+        with self._lock:
+            return name in self._values
+
+    def get(self, name: str, compute: Callable[[], Any]) -> Any:
+        """
+        Returns the named feature, computing it first if it is not known yet.
+
+        Args:
+            name: The name of the feature.
+            compute: The function computing the feature from the resume.
+
+        Returns:
+            The feature value.
+        """
+        with self._lock:
+            if name in self._values:
+                return self._values[name]
+
+        # Computed outside the lock, a feature computed concurrently keeps the first value.
+        value = compute()
+        with self._lock:
+            return self._values.setdefault(name, value)
+
+    def set(self, name: str, value: Any):
+        """
+        Stores a feature computed elsewhere, such as in a batch with other resumes.
+        """
+        with self._lock:
+            self._values.setdefault(name, value)
+
+
+class ResumeFeatureCache:
+    """
+    A bounded LRU cache of the job description independent features of resumes, keyed
+    by the canonical resume fingerprint of ScoreCache.fingerprint_resume. Miners often
+    resend a resume for different job descriptions, which then only needs its job
+    description dependent parts scored.
+
+    Attributes:
+        max_size (int): The maximum number of resumes kept before the least recently used is evicted.
+        hits (int): The number of lookups that found the resume.
+        misses (int): The number of lookups that did not find the resume.
+    """
+
+    def __init__(self, max_size: int = 1024):
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self._features: OrderedDict[str, ResumeFeatures] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, resume_fingerprint: str) -> ResumeFeatures:
+        """
+        Returns the features of the resume, which are empty if it was not seen before.
+        """
+        with self._lock:
+            features = self._features.get(resume_fingerprint)
+            if features is not None:
+                self._features.move_to_end(resume_fingerprint)
+                self.hits += 1
+                return features
+
+            self.misses += 1
+            features = self._features[resume_fingerprint] = ResumeFeatures()
+            while len(self._features) > self.max_size:
+                self._features.popitem(last=False)
+            return features
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Returns the hit and miss counters, the hit rate and the number of cached resumes.
+        """
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / lookups if lookups else None,
+                "size": len(self._features),
+            }
@@ -0,0 +1,104 @@
+import hashlib
+import json
+import threading
+from collections import OrderedDict
+from typing import Any, Dict
+
+
+def _canonical_json(value: Any) -> str:
+    return json.dumps(value, sort_keys=True, separators=(',', ':'), ensure_ascii=False, default=str)
+
+
+class ScoreCache:
+    """
+    A bounded LRU cache of ATS scores keyed by a fingerprint of the processed job
+    description and a fingerprint of the resume, so identical resumes submitted by
+    different miners are only scored once per job description.
+
+    Attributes:
+        max_size (int): The maximum number of scores kept before the least recently used is evicted.
+        hits (int): The number of lookups that found a score.
+        misses (int): The number of lookups that did not find a score.
+    """
+
+    def __init__(self, max_size: int = 1024):
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self._scores: OrderedDict[str, Dict[str, Any]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def fingerprint_job_description(scoring_data: Dict[str, Any]) -> str:
+        """
+        Returns the fingerprint of the processed job description, covering everything
+        the ATS score depends on.
+
+        Args:
+            scoring_data: Dict containing various values extracted from the job description
+
+        Returns:
+            The hex digest of the canonicalized job description and skill weights.
+        """
+        canonical = _canonical_json([scoring_data['jd'], scoring_data['universal'], scoring_data['preferred']])
+        return hashlib.sha256(canonical.encode()).hexdigest()
+
+    @staticmethod
+    def fingerprint_resume(resume: Any) -> str:
+        """
+        Returns the fingerprint of a miner's resume. JSON strings are parsed so that
+        formatting differences do not matter. The type of the response is part of the
+        fingerprint since ATS treats string and dict responses differently.
+
+        Args:
+            resume: The resume returned by the miner.
+
+        Returns:
+            The hex digest of the canonicalized resume.
+        """
+        value = resume
+        if isinstance(resume, str):
+            try:
+                value = json.loads(resume)
+            except json.JSONDecodeError:
+                pass
+        canonical = _canonical_json([type(resume).__name__, value])
+        return hashlib.sha256(canonical.encode()).hexdigest()
+
+    def get(self, jd_fingerprint: str, resume_fingerprint: str) -> Dict[str, Any] | None:
+        """
+        Returns a copy of the cached score, or None if there is none.
+        """
+        key = jd_fingerprint + resume_fingerprint
+        with self._lock:
+            score = self._scores.get(key)
+            if score is None:
+                self.misses += 1
+                return None
+            self._scores.move_to_end(key)
+            self.hits += 1
+            return dict(score)
+
+    def put(self, jd_fingerprint: str, resume_fingerprint: str, score: Dict[str, Any]):
+        """
+        Caches a copy of the score, evicting the least recently used score if full.
+        """
+        key = jd_fingerprint + resume_fingerprint
+        with self._lock:
+            self._scores[key] = dict(score)
+            self._scores.move_to_end(key)
+            while len(self._scores) > self.max_size:
+                self._scores.popitem(last=False)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Returns the hit and miss counters, the hit rate and the number of cached scores.
+        """
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / lookups if lookups else None,
+                "size": len(self._scores),
+            }
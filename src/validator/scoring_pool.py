@@ -0,0 +1,209 @@
+import concurrent.futures
+import multiprocessing
+import pickle
+from typing import Any, Dict, List, Tuple
+
+import torch
+from loguru import logger
+
+from validator.ats import ATS, ATSModels, ScoringDeadlineExceeded, ScoringPlan
+
+# Set in the parent before the workers are forked, so every worker shares the already
+# loaded models copy-on-write instead of loading its own.
+_models: ATSModels | None = None
+# The ATS context and scoring plan of the job description a worker last scored, with
+# the id of its job, so they are only unpickled and built once per job description.
+_job: Tuple[int, ATS, ScoringPlan] | None = None
+
+
+def _init_worker():
+    # Each worker scores one batch at a time, so keep torch from oversubscribing the
+    # cores shared with the other workers.
+    torch.set_num_threads(1)
+
+
+def _warm_up(_: int):
+    pass
+
+
+def score_resume(
+    ats: ATS,
+    uid: str,
+    resume_data: Dict[str, Any],
+    job_description: Dict[str, Any] | ScoringPlan,
+    cpu_deadline: float | None = None
+) -> Dict[str, Any]:
+    """
+    Scores a single resume with the given ATS context. A resume that takes more than
+    cpu_deadline CPU seconds to score, or fails to score, is scored as an empty resume.
+
+    Args:
+        ats: The ATS context for the job description.
+        uid: The UID of the miner the resume belongs to.
+        resume_data: Dict containing the UID as key and resume data as the value.
+        job_description: The processed job description, or its compiled scoring plan.
+        cpu_deadline: The CPU seconds allowed for scoring the resume, or None for no deadline.
+
+    Returns:
+        The ATS score of the resume.
+    """
+    ats.store_resume(resume_data=resume_data)
+    try:
+        return ats.calculate_ats_score(job_description, uid, cpu_deadline)
+    except ScoringDeadlineExceeded as e:
+        logger.warning(f"Scoring the resume of miner {uid} was abandoned: {e}")
+    except Exception as e:
+        logger.error(f"Failed to score the resume of miner {uid}: {e}")
+    ats.store_resume(resume_data={uid: None})
+    return ats.calculate_ats_score(job_description, uid)
+
+
+def score_resumes(
+    ats: ATS,
+    plan: ScoringPlan,
+    resumes: List[Tuple[str, Dict[str, Any]]],
+    cpu_deadline: float | None = None
+) -> List[Dict[str, Any]]:
+    """
+    Scores a micro-batch of resumes with the given ATS context in one
+    calculate_ats_scores call. This is the scoring call shared by the serial and the
+    multi-process paths. The batch is allowed cpu_deadline CPU seconds per resume; if
+    it takes longer or fails, its resumes are scored one at a time with score_resume,
+    so only the resumes that are expensive or fail to score are scored as empty.
+
+    Args:
+        ats: The ATS context for the job description.
+        plan: The scoring plan compiled from the job description.
+        resumes: List of (uid, resume_data) tuples.
+        cpu_deadline: The CPU seconds allowed for scoring each resume, or None for no deadline.
+
+    Returns:
+        The ATS scores in the same order as resumes.
+    """
+    batch_deadline = cpu_deadline * len(resumes) if cpu_deadline is not None else None
+    try:
+        scores = ats.calculate_ats_scores(
+            plan, [resume_data[uid] for uid, resume_data in resumes], batch_deadline)
+        return scores.to_dict('records')
+    except ScoringDeadlineExceeded as e:
+        logger.warning(f"Scoring a batch of {len(resumes)} resumes was abandoned, scoring them one at a time: {e}")
+    except Exception as e:
+        logger.error(f"Failed to score a batch of {len(resumes)} resumes, scoring them one at a time: {e}")
+    return [score_resume(ats, uid, resume_data, plan, cpu_deadline) for uid, resume_data in resumes]
+
+
+def _score_in_worker(
+    job_id: int,
+    job: bytes,
+    resumes: List[Tuple[str, Dict[str, Any]]],
+    cpu_deadline: float | None
+) -> List[Dict[str, Any]]:
+    global _job
+    if _job is None or _job[0] != job_id:
+        scoring_data, plan = pickle.loads(job)
+        ats = ATS(
+            skills_df=scoring_data['skills'],
+            universal_skills_weights=scoring_data['universal'],
+            preferred_skills_weights=scoring_data['preferred'],
+            models=_models
+        )
+        _job = (job_id, ats, plan)
+    _, ats, plan = _job
+    return score_resumes(ats, plan, resumes, cpu_deadline)
+
+
+class ScoringPool:
+    """
+    A pool of forked worker processes scoring micro-batches of resumes in parallel. The
+    ATS models are loaded in the parent before forking so the workers share them
+    copy-on-write. The scoring data and the scoring plan compiled once in the parent
+    are pickled once per job description and sent with each batch as bytes; a worker
+    only unpickles them and builds its ATS context when the job description changes, so
+    results match scoring the same resumes serially.
+
+    The pool should be created before any other threads are started and before any
+    inference has run, since only the forking thread is copied into the workers and
+    torch's thread pools do not survive a fork once they are started. For the same
+    reason a broken pool should not be recreated later in the process.
+
+    Attributes:
+        workers (int): The number of worker processes.
+        executor (concurrent.futures.ProcessPoolExecutor): The executor running the workers.
+    """
+
+    def __init__(self, models: ATSModels, workers: int):
+        global _models
+        _models = models
+
+        self.workers = workers
+        self.executor = concurrent.futures.ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=multiprocessing.get_context("fork"),
+            initializer=_init_worker
+        )
+        # Fork every worker now, while the models are loaded and before any inference.
+        list(self.executor.map(_warm_up, range(workers)))
+        self._job_id = 0
+        self._job_plan: ScoringPlan | None = None
+        self._job: bytes | None = None
+
+    def submit(
+        self,
+        scoring_data: Dict[str, Any],
+        plan: ScoringPlan,
+        resumes: List[Tuple[str, Dict[str, Any]]],
+        cpu_deadline: float | None = None
+    ) -> concurrent.futures.Future:
+        """
+        Submits a micro-batch of resumes to be scored together by a worker.
+
+        Args:
+            scoring_data: Dict containing various values extracted from the job description
+            plan: The scoring plan compiled from the job description.
+            resumes: List of (uid, resume_data) tuples.
+            cpu_deadline: The CPU seconds allowed for scoring each resume, or None for no deadline.
+
+        Returns:
+            A Future resolving to the ATS scores in the same order as resumes.
+
+        Raises:
+            concurrent.futures.process.BrokenProcessPool:
+                If a worker died, here or from the Future.
+        """
+        if plan is not self._job_plan:
+            self._job_id += 1
+            self._job_plan = plan
+            self._job = pickle.dumps((scoring_data, plan), protocol=pickle.HIGHEST_PROTOCOL)
+        return self.executor.submit(_score_in_worker, self._job_id, self._job, resumes, cpu_deadline)
+
+    def score(
+        self,
+        scoring_data: Dict[str, Any],
+        plan: ScoringPlan,
+        resumes: List[Tuple[str, Dict[str, Any]]],
+        cpu_deadline: float | None = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Scores resumes split into one batch per worker.
+
+        Args:
+            scoring_data: Dict containing various values extracted from the job description
+            plan: The scoring plan compiled from the job description.
+            resumes: List of (uid, resume_data) tuples.
+            cpu_deadline: The CPU seconds allowed for scoring each resume, or None for no deadline.
+
+        Returns:
+            The ATS scores in the same order as resumes.
+        """
+        size = max(1, -(-len(resumes) // self.workers))
+        futures = [
+            self.submit(scoring_data, plan, resumes[start:start + size], cpu_deadline)
+            for start in range(0, len(resumes), size)
+        ]
+        return [score for future in futures for score in future.result()]
+
+    def shutdown(self):
+        """
+        Shuts down the worker processes.
+        """
+        self.executor.shutdown(cancel_futures=True)
@@ -0,0 +1,82 @@
+import math
+from collections import Counter
+from typing import List
+
+import numpy as np
+from scipy.sparse import csr_matrix
+from sklearn.feature_extraction.text import CountVectorizer
+
+# The idf TfidfVectorizer gives a term found in only one of two documents:
+# ln((1 + 2) / (1 + 1)) + 1. Terms found in both get an idf of exactly 1.
+SINGLE_DOCUMENT_IDF = math.log(1.5) + 1
+
+
+class TfidfSimilarity:
+    """
+    The TF-IDF cosine similarity of resume texts to a single job description text,
+    fitted once per job description.
+
+    The similarities are exactly those of fitting a default TfidfVectorizer on
+    [job_description_text, resume_text] for every resume. With two documents the idf of
+    a term is 1 if both contain it and SINGLE_DOCUMENT_IDF otherwise, so the norms of
+    both vectors follow from the resume's term counts and the counts of the terms it
+    shares with the job description. All resumes are counted into one sparse matrix over
+    the job description's vocabulary and scored with sparse matrix-vector products.
+
+    Attributes:
+        job_description_text (str): The job description text the resumes are compared to.
+    """
+
+    def __init__(self, job_description_text: str):
+        self.job_description_text = job_description_text
+        vectorizer = CountVectorizer()
+        self._analyzer = vectorizer.build_analyzer()
+
+        jd_counts = Counter(self._analyzer(job_description_text))
+        self._vocabulary = {term: i for i, term in enumerate(jd_counts)}
+        self._jd_counts = np.array(list(jd_counts.values()), dtype=np.float64)
+        self._jd_squared = self._jd_counts ** 2
+        self._jd_squared_sum = self._jd_squared.sum()
+
+    def similarities(self, resume_texts: List[str]) -> np.ndarray:
+        """
+        Returns the similarity of every resume text to the job description text. Pairs
+        where either text has no terms have a similarity of 0. When neither text has any
+        terms, TfidfVectorizer raises a ValueError for the empty vocabulary instead; here
+        such a pair is also 0, so one such resume does not stop the others being scored.
+
+        Args:
+            resume_texts: The resume texts to compare.
+
+        Returns:
+            The similarities in the same order as resume_texts.
+        """
+        rows, cols, counts = [], [], []
+        resume_squared_sums = np.zeros(len(resume_texts))
+        for row, text in enumerate(resume_texts):
+            for term, count in Counter(self._analyzer(text)).items():
+                resume_squared_sums[row] += count * count
+                col = self._vocabulary.get(term)
+                if col is not None:
+                    rows.append(row)
+                    cols.append(col)
+                    counts.append(count)
+
+        # Only the terms shared with the job description are kept in the matrix.
+        shared = csr_matrix(
+            (np.array(counts, dtype=np.float64), (rows, cols)),
+            shape=(len(resume_texts), len(self._vocabulary))
+        )
+        dot = shared @ self._jd_counts
+        shared_resume_squared = np.asarray(shared.multiply(shared).sum(axis=1)).ravel()
+        shared_jd_squared = (shared > 0).astype(np.float64) @ self._jd_squared
+
+        idf_squared = SINGLE_DOCUMENT_IDF ** 2
+        resume_norms = idf_squared * resume_squared_sums - (idf_squared - 1) * shared_resume_squared
+        jd_norms = idf_squared * self._jd_squared_sum - (idf_squared - 1) * shared_jd_squared
+        denominators = np.sqrt(resume_norms * jd_norms)
+
+        similarities = np.zeros(len(resume_texts))
+        nonzero = denominators > 0
+        similarities[nonzero] = dot[nonzero] / denominators[nonzero]
+        return similarities
@@ -0,0 +1,279 @@
+import argparse
+import fcntl
+import json
+import os
+import threading
+from collections import OrderedDict
+from typing import Callable, Dict, Iterable, List
+
+import numpy as np
+import spacy
+from spacy.language import Language
+
+from hugging_data import get_certifications_dataset, get_keyword_matrix
+
+
+# The components of en_core_web_md. None of them change the static word vectors a
+# doc's vector is averaged from, so skill vectors only need the tokenizer.
+SKILL_NLP_EXCLUDE = ["tok2vec", "tagger", "parser", "attribute_ruler", "lemmatizer", "ner", "senter"]
+
+
+def normalize_skill(skill: str) -> str:
+    """
+    Returns the skill stripped and casefolded, so differently spelled mentions of a skill
+    are treated as one.
+    """
+    return skill.strip().casefold()
+
+
+def load_skill_nlp() -> Language:
+    """
+    Loads en_core_web_md without any pipeline components, for looking up skill vectors
+    in its static vectors table.
+    """
+    return spacy.load("en_core_web_md", exclude=SKILL_NLP_EXCLUDE)
+
+
+def encode_skills(nlp: Language, skills: List[str], batch_size: int = 256) -> np.ndarray:
+    """
+    Returns the vector of every skill, the average of its token vectors, in a matrix with
+    a row per skill. The skills are tokenized in batches with nlp.pipe.
+
+    Args:
+        nlp: The spaCy pipeline whose vectors table is used.
+        skills: The skills to embed.
+        batch_size: The number of skills tokenized per batch.
+
+    Returns:
+        A float32 matrix of shape (len(skills), vectors_length).
+    """
+    if not skills:
+        return np.zeros((0, nlp.vocab.vectors_length), dtype=np.float32)
+    return np.stack([doc.vector for doc in nlp.pipe(skills, batch_size=batch_size)])
+
+
+class SkillVectorStore:
+    """
+    A persistent store of skill vectors keyed by skill text, so the same skill is only
+    embedded once across steps and scoring processes.
+
+    Vectors are kept in an on-disk float32 matrix that is opened memory-mapped, with a
+    JSON lines index mapping each skill to its row. Recently used vectors are also kept
+    in an in-memory LRU. Skills missing from the store are embedded in one batch with
+    encode, which returns a row per skill.
+
+    New rows are appended to both files under an exclusive file lock. Processes sharing
+    the directory, such as forked scoring workers, never write over each other's rows,
+    and pick up each other's appends the next time they miss.
+
+    Skills are keyed by their exact text rather than by normalize_skill, since the
+    spaCy vectors differ by case and surrounding whitespace. Normalizing the keys would
+    change the vectors, and so the scores, compared to embedding skills without a
+    store. ATS.match_skills matches skills by their normalized name before it looks
+    up any vectors.
+
+    Attributes:
+        dir_path (str): The directory holding the vector matrix and index.
+        dim (int): The width of the skill vectors.
+        max_cache_size (int): The maximum number of vectors kept in the LRU.
+        hits (int): The number of lookups answered from the LRU or the matrix.
+        misses (int): The number of lookups that had to embed the skill.
+    """
+
+    def __init__(
+        self,
+        dir_path: str,
+        encode: Callable[[List[str]], np.ndarray],
+        dim: int,
+        max_cache_size: int = 4096
+    ):
+        self.dir_path = dir_path
+        self.encode = encode
+        self.dim = dim
+        self.max_cache_size = max_cache_size
+        self.hits = 0
+        self.misses = 0
+        self._rows: Dict[str, int] = {}
+        self._index_rows = 0
+        self._index_offset = 0
+        self._matrix: np.ndarray | None = None
+        self._cache: OrderedDict[str, np.ndarray] = OrderedDict()
+        self._lock = threading.Lock()
+
+        os.makedirs(dir_path, exist_ok=True)
+        with self._lock:
+            self._reload()
+
+    @property
+    def vectors_path(self) -> str:
+        return os.path.join(self.dir_path, "vectors.f32")
+
+    @property
+    def index_path(self) -> str:
+        return os.path.join(self.dir_path, "index.jsonl")
+
+    @property
+    def lock_path(self) -> str:
+        return os.path.join(self.dir_path, "store.lock")
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def _reload(self):
+        # Reads the index lines appended since the last reload and remaps the matrix.
+        if not os.path.exists(self.index_path) or os.path.getsize(self.index_path) == self._index_offset:
+            return
+
+        with open(self.index_path, "rb") as f:
+            f.seek(self._index_offset)
+            for line in f:
+                if not line.endswith(b"\n"):
+                    break
+                self._rows.setdefault(json.loads(line), self._index_rows)
+                self._index_rows += 1
+                self._index_offset += len(line)
+
+        self._matrix = np.memmap(self.vectors_path, dtype=np.float32, mode="r", shape=(self._index_rows, self.dim)) \
+            if self._index_rows else None
+
+    def _lookup(self, skill: str) -> np.ndarray | None:
+        vector = self._cache.get(skill)
+        if vector is not None:
+            self._cache.move_to_end(skill)
+            return vector
+
+        row = self._rows.get(skill)
+        if row is None:
+            return None
+        vector = np.array(self._matrix[row])
+        self._remember(skill, vector)
+        return vector
+
+    def _remember(self, skill: str, vector: np.ndarray):
+        self._cache[skill] = vector
+        self._cache.move_to_end(skill)
+        while len(self._cache) > self.max_cache_size:
+            self._cache.popitem(last=False)
+
+    def _append(self, vectors: Dict[str, np.ndarray]):
+        with open(self.lock_path, "w") as lock:
+            fcntl.flock(lock, fcntl.LOCK_EX)
+            try:
+                self._reload()
+                new_skills = [skill for skill in vectors if skill not in self._rows]
+                if not new_skills:
+                    return
+                # Drops whatever a writer that died mid-append left past the last
+                # complete index line, so rows and index lines stay aligned.
+                with open(self.vectors_path, "ab") as f:
+                    f.truncate(self._index_rows * self.dim * 4)
+                    f.write(np.stack([vectors[skill] for skill in new_skills]).astype(np.float32).tobytes())
+                with open(self.index_path, "ab") as f:
+                    f.truncate(self._index_offset)
+                    f.write("".join(json.dumps(skill) + "\n" for skill in new_skills).encode("utf-8"))
+                self._reload()
+            finally:
+                fcntl.flock(lock, fcntl.LOCK_UN)
+
+    def get_vectors(self, skills: Iterable[str]) -> Dict[str, np.ndarray]:
+        """
+        Returns the vector of every distinct skill, embedding and appending the skills
+        missing from the store.
+
+        Args:
+            skills: The skills to look up.
+
+        Returns:
+            A dict mapping each distinct skill to its vector.
+        """
+        with self._lock:
+            vectors = {}
+            missing = []
+            for skill in dict.fromkeys(skills):
+                vector = self._lookup(skill)
+                if vector is None:
+                    missing.append(skill)
+                else:
+                    vectors[skill] = vector
+
+            if missing:
+                self._reload()
+                still_missing = []
+                for skill in missing:
+                    vector = self._lookup(skill)
+                    if vector is None:
+                        still_missing.append(skill)
+                    else:
+                        vectors[skill] = vector
+                missing = still_missing
+
+            self.hits += len(vectors)
+            self.misses += len(missing)
+
+            if missing:
+                new_vectors = dict(zip(missing, np.asarray(self.encode(missing), dtype=np.float32)))
+                self._append(new_vectors)
+                for skill, vector in new_vectors.items():
+                    self._remember(skill, vector)
+                vectors.update(new_vectors)
+
+            return vectors
+
+    def seed(self, skills: Iterable[str], batch_size: int = 1024):
+        """
+        Embeds and appends every skill missing from the store.
+
+        Args:
+            skills: The skills to add.
+            batch_size: The number of skills appended per write.
+        """
+        skills = list(dict.fromkeys(skills))
+        for start in range(0, len(skills), batch_size):
+            self.get_vectors(skills[start:start + batch_size])
+
+    def get_stats(self) -> Dict[str, int | float | None]:
+        """
+        Returns the hit and miss counters, the hit rate and the number of stored skills.
+        """
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / lookups if lookups else None,
+                "size": len(self._rows),
+            }
+
+
+def get_seed_skills() -> List[str]:
+    """
+    Returns the skill vocabulary used to pre-seed the store: every keyword of the
+    keyword matrix and its co-occurring keywords, and the skills gained from every
+    certification.
+    """
+    skills = []
+    keyword_matrix = get_keyword_matrix()
+    for keyword, occurrences in zip(keyword_matrix['Keyword'], keyword_matrix['Co-occurrences']):
+        skills.append(keyword)
+        skills += list(occurrences.keys())
+
+    for cert in get_certifications_dataset():
+        if cert['Skills Gained']:
+            skills += cert['Skills Gained'].split(", ")
+
+    return [skill for skill in dict.fromkeys(skills) if skill]
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Pre-seeds the skill vector store")
+    parser.add_argument(
+        "--dir", type=str, default=os.path.join(os.path.expanduser("~"), ".commune", "yama", "skill_vectors"),
+        help="skill vector store directory"
+    )
+    args = parser.parse_args()
+
+    nlp = load_skill_nlp()
+    store = SkillVectorStore(dir_path=args.dir, encode=lambda skills: encode_skills(nlp, skills), dim=nlp.vocab.vectors_length)
+    seed_skills = get_seed_skills()
+    store.seed(seed_skills)
+    print(f"Skill vector store at {args.dir} holds {len(store)} skills ({len(seed_skills)} seed skills)")